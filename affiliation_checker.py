@@ -17,12 +17,14 @@ logger = logging.getLogger(__name__)
 class AffiliationChecker:
     """Check speaker affiliations and titles via web search and AI analysis"""
 
-    def __init__(self, model='claude-3-haiku-20240307'):
+    def __init__(self, model='claude-3-haiku-20240307', enricher=None):
         """
         Initialize affiliation checker
 
         Args:
             model: Claude model to use for analysis (default: Haiku for cost efficiency)
+            enricher: UnifiedSpeakerEnricher to search with, so searches share
+                      its rate limiting (default: a new one per check)
         """
         self.anthropic_api_key = os.getenv('ANTHROPIC_API_KEY')
 
@@ -31,6 +33,7 @@ class AffiliationChecker:
 
         self.anthropic_client = anthropic.Anthropic(api_key=self.anthropic_api_key)
         self.model = model
+        self.enricher = enricher
 
     def check_current_affiliation(
         self,
@@ -68,7 +71,7 @@ class AffiliationChecker:
         logger.info(f"Searching for: {search_query}")
 
         try:
-            enricher = UnifiedSpeakerEnricher()
+            enricher = self.enricher or UnifiedSpeakerEnricher()
             search_results = enricher.web_search(search_query, max_results=5)
 
             if not search_results.get('success'):
@@ -6,6 +6,10 @@ FILENAME="speakers_${DATE}.db"
 
 mkdir -p "$BACKUP_DIR"
 
+# Flush the WAL into the main file so the copy is complete
+# (mode=rw: a missing database is an error, not a new empty file)
+python3 -c "import sqlite3; conn = sqlite3.connect('file:speakers.db?mode=rw', uri=True); conn.execute('PRAGMA wal_checkpoint(TRUNCATE)'); conn.close()" || exit 1
+
 # Create backup
 cp speakers.db "$BACKUP_DIR/$FILENAME"
 
@@ -6,11 +6,17 @@ for storing and querying event and speaker data. It includes intelligent dedupli
 logic that uses fuzzy affiliation matching to prevent duplicate speaker records.
 """
 
+import copy
+import os
+import queue
 import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
 from datetime import datetime, timezone
 import json
 import re
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Callable, Iterator
 
 def normalize_name(name: str) -> str:
     """
@@ -87,16 +93,53 @@ class SpeakerDatabase:
     slight variations in their affiliation names.
     """
 
-    def __init__(self, db_path: str = 'speakers.db'):
+    # The hot writers reuse a few dozen distinct statements; a larger
+    # statement cache than sqlite3's default (128) keeps them all prepared
+    STATEMENT_CACHE_SIZE = 256
+
+    def __init__(self, db_path: str = 'speakers.db', read_only: bool = False):
         """
         Initialize database connection and create tables if needed.
 
         Args:
             db_path: Path to SQLite database file (default: 'speakers.db')
+            read_only: Open a read-only connection and skip schema setup.
+                       The database must already exist (see SpeakerDatabasePool).
         """
         self.db_path = db_path
+        # Contiguous float32 copy of all embeddings, stored next to the database
+        self.embedding_matrix_path = os.path.splitext(db_path)[0] + '_unit_embeddings.npy'
+        # Row -> speaker_id (and int8 row scales) for that matrix, so a fresh
+        # matrix can be mapped without reading every speaker_embeddings row
+        self.embedding_ids_path = os.path.splitext(db_path)[0] + '_unit_embedding_ids.npy'
+        self.embedding_scales_path = os.path.splitext(db_path)[0] + '_unit_embedding_scales.npy'
         self.conn = None
-        self.init_database()
+        self.read_only = read_only
+        # Cached get_statistics/get_enhanced_statistics results (see _cached_stats)
+        self._stats_cache = {}
+        # Nesting depth of atomic() savepoints
+        self._savepoints = 0
+        if read_only:
+            self._connect_read_only()
+        else:
+            self.init_database()
+
+    def _connect_read_only(self) -> None:
+        """
+        Open a read-only connection (mode=ro) for query-only callers.
+
+        Schema creation and migrations are skipped because they need write
+        access; the WAL journal mode set by a regular connection persists in
+        the database file, so readers still never block the writer.
+        """
+        uri = Path(self.db_path).absolute().as_uri() + '?mode=ro'
+        self.conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                                    cached_statements=self.STATEMENT_CACHE_SIZE)
+        self.conn.executescript('''
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
+            PRAGMA temp_store=MEMORY;
+        ''')
 
     def init_database(self) -> None:
         """
@@ -107,9 +150,24 @@ class SpeakerDatabase:
         run multiple times - it only creates missing structures.
         """
         # check_same_thread=False is safe here because we create new connections per request
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                    cached_statements=self.STATEMENT_CACHE_SIZE)
+
+        # Connection tuning:
+        # - WAL lets the dashboard read while the pipeline writes (readers never block the writer)
+        # - synchronous=NORMAL is safe under WAL and skips an fsync on every commit
+        # - 64MB page cache, 256MB mmap and in-memory temp tables speed up the
+        #   read-heavy stats and embedding queries
+        self.conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
+            PRAGMA temp_store=MEMORY;
+        ''')
+
         cursor = self.conn.cursor()
-        
+
         # Events table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS events (
@@ -169,19 +227,8 @@ class SpeakerDatabase:
             )
         ''')
 
-        # Speaker tags table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS speaker_tags (
-                tag_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                speaker_id INTEGER NOT NULL,
-                tag_text TEXT NOT NULL,
-                confidence_score REAL,
-                source TEXT,
-                created_at TEXT,
-                FOREIGN KEY (speaker_id) REFERENCES speakers(speaker_id),
-                UNIQUE(speaker_id, tag_text)
-            )
-        ''')
+        # Speaker tags table (clustered on its natural key, see WITHOUT_ROWID_TABLES)
+        cursor.execute(self.WITHOUT_ROWID_TABLES['speaker_tags'][0].format(table='speaker_tags'))
 
         # Speaker embeddings table (for semantic search)
         cursor.execute('''
@@ -226,19 +273,8 @@ class SpeakerDatabase:
             )
         ''')
 
-        # Speaker languages table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS speaker_languages (
-                language_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                speaker_id INTEGER NOT NULL,
-                language TEXT NOT NULL,
-                proficiency TEXT,
-                confidence REAL,
-                source TEXT,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (speaker_id) REFERENCES speakers(speaker_id) ON DELETE CASCADE
-            )
-        ''')
+        # Speaker languages table (clustered on its natural key, see WITHOUT_ROWID_TABLES)
+        cursor.execute(self.WITHOUT_ROWID_TABLES['speaker_languages'][0].format(table='speaker_languages'))
 
         # Speaker freshness tracking table
         cursor.execute('''
@@ -272,6 +308,15 @@ class SpeakerDatabase:
             )
         ''')
 
+        # Query embedding cache - avoids an embedding API call for repeated searches
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS query_embedding_cache (
+                cache_key TEXT PRIMARY KEY,
+                embedding BLOB NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        ''')
+
         # Search logs table - track search queries for analytics
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS search_logs (
@@ -284,6 +329,18 @@ class SpeakerDatabase:
             )
         ''')
 
+        # Migration: rebuild pre-existing rowid tables as WITHOUT ROWID
+        self._migrate_without_rowid(cursor)
+
+        # Migration: row index into the on-disk embedding matrix (NULL = not in matrix yet)
+        cursor.execute("PRAGMA table_info(speaker_embeddings)")
+        embedding_columns = [col[1] for col in cursor.fetchall()]
+        if 'embedding_offset' not in embedding_columns:
+            cursor.execute('ALTER TABLE speaker_embeddings ADD COLUMN embedding_offset INTEGER')
+        # Per-row dequantization scale for an int8 matrix (NULL for float32)
+        if 'embedding_scale' not in embedding_columns:
+            cursor.execute('ALTER TABLE speaker_embeddings ADD COLUMN embedding_scale REAL')
+
         # Add tagging_status column to speakers table if it doesn't exist
         cursor.execute("PRAGMA table_info(speakers)")
         columns = [col[1] for col in cursor.fetchall()]
@@ -296,20 +353,34 @@ class SpeakerDatabase:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_status ON events(processing_status)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_event_speakers_speaker ON event_speakers(speaker_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_event_speakers_event ON event_speakers(event_id)')
+        # (speaker_tags and speaker_languages need no speaker_id index: their
+        # primary key starts with speaker_id)
 
         # Indexes for search-related tables
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_embeddings_speaker ON speaker_embeddings(speaker_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_demographics_speaker ON speaker_demographics(speaker_id)')
+        # speaker_embeddings and speaker_demographics are keyed on speaker_id
+        # (INTEGER PRIMARY KEY, i.e. the rowid), so a separate index on it
+        # only duplicated the table's own key
+        cursor.execute('DROP INDEX IF EXISTS idx_embeddings_speaker')
+        cursor.execute('DROP INDEX IF EXISTS idx_demographics_speaker')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_locations_speaker ON speaker_locations(speaker_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_locations_primary ON speaker_locations(is_primary)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_languages_speaker ON speaker_languages(speaker_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_freshness_needs_refresh ON speaker_freshness(needs_refresh)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_freshness_priority ON speaker_freshness(priority_score)')
+        # Refresh queues read "needs_refresh = 1 ORDER BY priority_score DESC
+        # LIMIT n": a partial index over just the queued rows answers that
+        # with a bounded seek, and replaces the two single-column indexes
+        cursor.execute('DROP INDEX IF EXISTS idx_freshness_needs_refresh')
+        cursor.execute('DROP INDEX IF EXISTS idx_freshness_priority')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_freshness_refresh
+            ON speaker_freshness(priority_score DESC) WHERE needs_refresh = 1
+        ''')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_corrections_speaker ON speaker_corrections(speaker_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_corrections_verified ON speaker_corrections(verified)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_search_logs_timestamp ON search_logs(timestamp)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_search_logs_query ON search_logs(query)')
 
+        # Running counters for the stats dashboard
+        self._init_counters(cursor)
+
         # Migration: add cost breakdown columns to pipeline_runs if they don't exist
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='pipeline_runs'")
         if cursor.fetchone():
@@ -324,7 +395,166 @@ class SpeakerDatabase:
                 cursor.execute("ALTER TABLE pipeline_runs ADD COLUMN enrichment_cost REAL DEFAULT 0")
 
         self.conn.commit()
-    
+
+    # Tables stored WITHOUT ROWID, clustered on (speaker_id, ...) so per-speaker
+    # lookups are a range scan of the primary key and rows aren't stored twice
+    # (rowid tree + UNIQUE index). Each entry is (CREATE TABLE template, columns).
+    # speaker_embeddings stays a rowid table: it is already keyed by
+    # speaker_id INTEGER PRIMARY KEY, and its large BLOB rows suit rowid storage.
+    WITHOUT_ROWID_TABLES = {
+        'speaker_tags': ('''
+            CREATE TABLE IF NOT EXISTS {table} (
+                speaker_id INTEGER NOT NULL,
+                tag_text TEXT NOT NULL,
+                confidence_score REAL,
+                source TEXT,
+                created_at TEXT,
+                PRIMARY KEY (speaker_id, tag_text),
+                FOREIGN KEY (speaker_id) REFERENCES speakers(speaker_id)
+            ) WITHOUT ROWID
+        ''', 'speaker_id, tag_text, confidence_score, source, created_at'),
+        'speaker_languages': ('''
+            CREATE TABLE IF NOT EXISTS {table} (
+                speaker_id INTEGER NOT NULL,
+                language TEXT NOT NULL,
+                proficiency TEXT,
+                confidence REAL,
+                source TEXT,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (speaker_id, language),
+                FOREIGN KEY (speaker_id) REFERENCES speakers(speaker_id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+        ''', 'speaker_id, language, proficiency, confidence, source, created_at'),
+    }
+
+    def _migrate_without_rowid(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Rebuild any WITHOUT_ROWID_TABLES still stored as rowid tables.
+
+        Rows are copied into a new table which then replaces the old one. Old
+        databases could hold the same language twice for a speaker; the most
+        recently inserted row wins. Triggers on the old table are dropped with
+        it, so this must run before _init_counters recreates them.
+        """
+        for table, (create_sql, columns) in self.WITHOUT_ROWID_TABLES.items():
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,))
+            row = cursor.fetchone()
+            if row is None or 'WITHOUT ROWID' in row[0].upper():
+                continue
+
+            new_table = f'{table}_new'
+            cursor.execute(f'DROP TABLE IF EXISTS {new_table}')
+            cursor.execute(create_sql.format(table=new_table))
+            cursor.execute(f'''
+                INSERT OR REPLACE INTO {new_table} ({columns})
+                SELECT {columns} FROM {table} ORDER BY rowid
+            ''')
+            cursor.execute(f'DROP TABLE {table}')
+            cursor.execute(f'ALTER TABLE {new_table} RENAME TO {table}')
+
+    # Counters maintained by triggers, mapped to the query that seeds them
+    COUNTER_SEED_QUERIES = {
+        'total_tags': 'SELECT COUNT(*) FROM speaker_tags',
+        'tagged_speakers': 'SELECT COUNT(*) FROM (SELECT 1 FROM speaker_tags GROUP BY speaker_id)',
+        'total_embeddings': 'SELECT COUNT(*) FROM speaker_embeddings',
+        # Only ever compared for change, so any starting value works
+        'embedding_writes': 'SELECT COUNT(*) FROM speaker_embeddings',
+    }
+
+    def _init_counters(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Create the counters table and the triggers that keep it up to date.
+
+        SQLite keeps no live row counts, so every COUNT(*) on speaker_tags or
+        speaker_embeddings is a full scan. Instead, triggers bump a small
+        counters table on each insert/delete, and the stats methods read the
+        totals back with a single primary-key lookup.
+
+        Triggers are created before seeding so that no write can slip between
+        the seed count and the first trigger firing. Seeding only runs when a
+        counter row is missing (new database or first run after upgrade).
+        """
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+
+        cursor.executescript('''
+            CREATE TRIGGER IF NOT EXISTS tr_tags_insert AFTER INSERT ON speaker_tags
+            BEGIN
+                UPDATE counters SET value = value + 1 WHERE name = 'total_tags';
+                -- First tag for this speaker: the new row is the only one
+                UPDATE counters SET value = value + 1 WHERE name = 'tagged_speakers'
+                    AND (SELECT COUNT(*) FROM speaker_tags WHERE speaker_id = NEW.speaker_id) = 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS tr_tags_delete AFTER DELETE ON speaker_tags
+            BEGIN
+                UPDATE counters SET value = value - 1 WHERE name = 'total_tags';
+                -- Last tag removed: speaker is no longer tagged
+                UPDATE counters SET value = value - 1 WHERE name = 'tagged_speakers'
+                    AND NOT EXISTS (SELECT 1 FROM speaker_tags WHERE speaker_id = OLD.speaker_id);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS tr_tags_update AFTER UPDATE OF speaker_id ON speaker_tags
+            WHEN OLD.speaker_id IS NOT NEW.speaker_id
+            BEGIN
+                UPDATE counters SET value = value - 1 WHERE name = 'tagged_speakers'
+                    AND NOT EXISTS (SELECT 1 FROM speaker_tags WHERE speaker_id = OLD.speaker_id);
+                UPDATE counters SET value = value + 1 WHERE name = 'tagged_speakers'
+                    AND (SELECT COUNT(*) FROM speaker_tags WHERE speaker_id = NEW.speaker_id) = 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS tr_embeddings_insert AFTER INSERT ON speaker_embeddings
+            BEGIN
+                UPDATE counters SET value = value + 1 WHERE name = 'total_embeddings';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS tr_embeddings_delete AFTER DELETE ON speaker_embeddings
+            BEGIN
+                UPDATE counters SET value = value - 1 WHERE name = 'total_embeddings';
+            END;
+
+            -- embedding_writes changes whenever any stored vector does, so
+            -- in-memory search indexes know when to reload
+            CREATE TRIGGER IF NOT EXISTS tr_embeddings_writes_insert AFTER INSERT ON speaker_embeddings
+            BEGIN
+                UPDATE counters SET value = value + 1 WHERE name = 'embedding_writes';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS tr_embeddings_writes_update AFTER UPDATE OF embedding ON speaker_embeddings
+            BEGIN
+                UPDATE counters SET value = value + 1 WHERE name = 'embedding_writes';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS tr_embeddings_writes_delete AFTER DELETE ON speaker_embeddings
+            BEGIN
+                UPDATE counters SET value = value + 1 WHERE name = 'embedding_writes';
+            END;
+        ''')
+
+        cursor.execute('SELECT name FROM counters')
+        existing = {row[0] for row in cursor.fetchall()}
+        for name, seed_query in self.COUNTER_SEED_QUERIES.items():
+            if name not in existing:
+                cursor.execute(
+                    f'INSERT OR IGNORE INTO counters (name, value) VALUES (?, ({seed_query}))',
+                    (name,)
+                )
+
+    def get_counters(self) -> Dict[str, int]:
+        """
+        Get the trigger-maintained running counters.
+
+        Returns:
+            Dictionary with keys total_tags, tagged_speakers, total_embeddings
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT name, value FROM counters')
+        return dict(cursor.fetchall())
+
     def add_event(self, url: str, title: str, body_text: str, raw_html: Optional[str] = None,
                   event_date: Optional[str] = None, location: str = 'Unknown') -> int:
         """
@@ -350,19 +580,69 @@ class SpeakerDatabase:
         """
         cursor = self.conn.cursor()
         scraped_at = datetime.now().isoformat()
+        owns_transaction = not self.conn.in_transaction
 
         try:
             cursor.execute('''
                 INSERT INTO events (url, title, event_date, location, body_text, raw_html, scraped_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (url, title, event_date, location, body_text, raw_html, scraped_at))
-            self.conn.commit()
+            if owns_transaction:
+                self.conn.commit()
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             # URL already exists - this is expected behavior when re-running scraper
             # Return the existing event ID rather than failing
             cursor.execute('SELECT event_id FROM events WHERE url = ?', (url,))
             return cursor.fetchone()[0]
+
+    def get_existing_event_urls(self, urls) -> set:
+        """
+        Return which of the given URLs are already in the events table.
+
+        Looks the candidates up through the UNIQUE index on events.url, so
+        memory stays proportional to the candidates rather than to every
+        event ever scraped.
+
+        Args:
+            urls: Candidate event URLs
+
+        Returns:
+            Set of the URLs that already exist
+        """
+        urls = list(urls)
+        cursor = self.conn.cursor()
+        existing = set()
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f'SELECT url FROM events WHERE url IN ({placeholders})', chunk)
+            existing.update(row[0] for row in cursor)
+        return existing
+
+    def get_new_event_urls(self, urls) -> List[str]:
+        """
+        Return the given URLs that are not yet in the events table.
+
+        The candidates go to SQLite as one JSON array and the set difference
+        runs there as an anti-join against the UNIQUE index on events.url:
+        one statement, no bound-parameter limit, no temp table to write.
+
+        Args:
+            urls: Candidate event URLs
+
+        Returns:
+            The new URLs, in their original order
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT c.value
+            FROM json_each(?) c
+            WHERE NOT EXISTS (SELECT 1 FROM events e WHERE e.url = c.value)
+            ORDER BY c.key
+        ''', (json.dumps(list(urls)),))
+        return [row[0] for row in cursor]
     
     def get_unprocessed_events(self, max_attempts=3, limit=None) -> List[Tuple]:
         """
@@ -380,21 +660,38 @@ class SpeakerDatabase:
             extraction_attempts < max_attempts to prevent infinite retries.
             Orders by extraction_attempts ASC (retry failed events first, then new ones).
         """
-        cursor = self.conn.cursor()
+        return list(self.iter_unprocessed_events(max_attempts, limit))
+
+    def iter_unprocessed_events(self, max_attempts=3, limit=None,
+                                batch_size: int = 50) -> Iterator[Tuple]:
+        """
+        Stream the events get_unprocessed_events returns, in the same order.
+
+        Rows are fetched batch_size at a time, so a large backlog's body_text
+        isn't all held in memory before the first event is processed.
+
+        Args:
+            max_attempts: Maximum extraction attempts before skipping (default: 3)
+            limit: Maximum number of events (default: None for all)
+            batch_size: Rows per fetchmany() call
 
-        query = '''
+        Yields:
+            Tuples: (event_id, url, title, body_text)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
             SELECT event_id, url, title, body_text
             FROM events
             WHERE processing_status = 'pending'
             AND (extraction_attempts IS NULL OR extraction_attempts < ?)
             ORDER BY extraction_attempts ASC, event_id ASC
-        '''
-
-        if limit:
-            query += f' LIMIT {limit}'
-
-        cursor.execute(query, (max_attempts,))
-        return cursor.fetchall()
+            LIMIT ?
+        ''', (max_attempts, limit or -1))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
 
     def _normalize_text(self, text: Optional[str]) -> set:
         """
@@ -587,6 +884,7 @@ class SpeakerDatabase:
         """
         cursor = self.conn.cursor()
         now = datetime.now().isoformat()
+        owns_transaction = not self.conn.in_transaction
 
         # Use affiliation as primary_affiliation fallback
         if primary_affiliation is None:
@@ -623,7 +921,8 @@ class SpeakerDatabase:
                             title = COALESCE(?, title)
                         WHERE speaker_id = ?
                     ''', (now, merged_affiliation, merged_bio, title, speaker_id))
-                    self.conn.commit()
+                    if owns_transaction:
+                        self.conn.commit()
                     return speaker_id
 
         # No matching speaker found - create new one
@@ -632,7 +931,8 @@ class SpeakerDatabase:
                 INSERT INTO speakers (name, title, affiliation, primary_affiliation, bio, first_seen, last_updated)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (name, title, affiliation, primary_affiliation, bio, now, now))
-            self.conn.commit()
+            if owns_transaction:
+                self.conn.commit()
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             # Race condition or exact match - get existing ID
@@ -672,24 +972,70 @@ class SpeakerDatabase:
             If the link already exists, updates the role_in_event and extracted_info
             fields rather than creating a duplicate.
         """
-        cursor = self.conn.cursor()
+        self.link_speakers_to_event(event_id, [(speaker_id, role_in_event, extracted_info)])
 
-        try:
-            cursor.execute('''
-                INSERT INTO event_speakers (event_id, speaker_id, role_in_event, extracted_info)
-                VALUES (?, ?, ?, ?)
-            ''', (event_id, speaker_id, role_in_event, extracted_info))
-            self.conn.commit()
-        except sqlite3.IntegrityError:
-            # Link already exists (duplicate event_id + speaker_id)
-            # Update with new information rather than failing
-            cursor.execute('''
-                UPDATE event_speakers
-                SET role_in_event = ?, extracted_info = ?
-                WHERE event_id = ? AND speaker_id = ?
-            ''', (role_in_event, extracted_info, event_id, speaker_id))
+    def link_speakers_to_event(self, event_id: int, links) -> None:
+        """
+        Link many speakers to one event in a single executemany.
+
+        Same upsert semantics as link_speaker_to_event: an existing
+        (event_id, speaker_id) link gets the new role and extracted info.
+
+        Args:
+            event_id: Event ID
+            links: Iterable of (speaker_id, role_in_event, extracted_info)
+        """
+        params = [
+            (event_id, speaker_id, role_in_event, extracted_info)
+            for speaker_id, role_in_event, extracted_info in links
+        ]
+        if not params:
+            return
+
+        owns_transaction = not self.conn.in_transaction
+        self.conn.executemany('''
+            INSERT INTO event_speakers (event_id, speaker_id, role_in_event, extracted_info)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (event_id, speaker_id) DO UPDATE SET
+                role_in_event = excluded.role_in_event,
+                extracted_info = excluded.extracted_info
+        ''', params)
+        if owns_transaction:
             self.conn.commit()
 
+    def save_extracted_speakers(self, event_id: int, speakers: List[Dict]) -> List[int]:
+        """
+        Save one event's extraction result and mark the event completed.
+
+        The speakers, their links and the event status commit together
+        (add_speaker still dedupes one at a time); each link keeps the
+        extracted speaker dict as compact JSON.
+
+        Args:
+            event_id: Event ID
+            speakers: Speaker dicts as returned by SpeakerExtractor
+
+        Returns:
+            Speaker IDs, in the order of speakers
+        """
+        with self.atomic():
+            links = []
+            for speaker_data in speakers:
+                speaker_id = self.add_speaker(
+                    name=speaker_data.get('name'),
+                    title=speaker_data.get('title'),
+                    affiliation=speaker_data.get('affiliation'),
+                    primary_affiliation=speaker_data.get('primary_affiliation'),
+                    bio=speaker_data.get('bio')
+                )
+                # Compact, unescaped JSON: smaller rows and a cheaper encode
+                extracted_info = json.dumps(speaker_data, ensure_ascii=False, separators=(',', ':'))
+                links.append((speaker_id, speaker_data.get('role_in_event'), extracted_info))
+
+            self.link_speakers_to_event(event_id, links)
+            self.mark_event_processed(event_id, 'completed')
+        return [speaker_id for speaker_id, _, _ in links]
+
     def mark_event_processed(self, event_id: int, status: str = 'completed') -> None:
         """
         Mark an event as processed (or failed) after speaker extraction.
@@ -702,12 +1048,14 @@ class SpeakerDatabase:
             Also sets the processed_at timestamp to current time.
         """
         cursor = self.conn.cursor()
+        owns_transaction = not self.conn.in_transaction
         cursor.execute('''
             UPDATE events
             SET processing_status = ?, processed_at = ?
             WHERE event_id = ?
         ''', (status, datetime.now().isoformat(), event_id))
-        self.conn.commit()
+        if owns_transaction:
+            self.conn.commit()
 
     def increment_extraction_attempts(self, event_id: int) -> None:
         """
@@ -785,6 +1133,65 @@ class SpeakerDatabase:
         ''', (speaker_id,))
         return cursor.fetchall()
 
+    def get_speaker_event_counts(self) -> Dict[int, int]:
+        """
+        Count every speaker's events in one grouped query.
+
+        Returns:
+            Dictionary of speaker_id -> number of events (the length of
+            get_speaker_events); speakers without events are absent
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT es.speaker_id, COUNT(*)
+            FROM event_speakers es
+            JOIN events e ON e.event_id = es.event_id
+            GROUP BY es.speaker_id
+        ''')
+        return dict(cursor.fetchall())
+
+    def iter_speakers_with_event_counts(self, batch_size: int = 1000) -> Iterator[List[Tuple]]:
+        """
+        Stream every speaker with their tags and event count, for CSV export.
+
+        One statement joins the grouped event counts and aggregates tags, and
+        rows are read off the cursor batch_size at a time, so neither the
+        speaker table nor a per-speaker query is needed.
+
+        Args:
+            batch_size: Rows per fetchmany() batch
+
+        Yields:
+            Lists of tuples: (speaker_id, name, title, affiliation, bio, tags,
+            first_seen, last_updated, event_count), ordered by name; tags is
+            '; '-joined tag text (highest confidence first), and missing text
+            fields are ''
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT s.speaker_id, s.name, COALESCE(s.title, ''), COALESCE(s.affiliation, ''),
+                COALESCE(s.bio, ''),
+                COALESCE((SELECT group_concat(tag_text, '; ') FROM (
+                    SELECT t.tag_text FROM speaker_tags t
+                    WHERE t.speaker_id = s.speaker_id
+                    ORDER BY t.confidence_score DESC
+                )), ''),
+                s.first_seen, s.last_updated, COALESCE(c.n, 0)
+            FROM speakers s
+            LEFT JOIN (
+                SELECT es.speaker_id, COUNT(*) AS n
+                FROM event_speakers es
+                JOIN events e ON e.event_id = es.event_id
+                GROUP BY es.speaker_id
+            ) c ON c.speaker_id = s.speaker_id
+            ORDER BY s.name
+        ''')
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+
     def get_event_speakers(self, event_id: int) -> List[Tuple]:
         """
         Get all speakers who participated in a specific event.
@@ -978,6 +1385,48 @@ class SpeakerDatabase:
 
         return cursor.fetchall()
 
+    # Seconds a cached statistics result may be served for (bounds the
+    # drift of time-based figures like "last 7 days")
+    STATS_CACHE_TTL = 30
+
+    def data_version(self) -> Tuple[int, int]:
+        """
+        Cheap fingerprint of the database contents as seen by this connection.
+
+        PRAGMA data_version changes whenever *another* connection commits (e.g.
+        the pipeline inserting into pipeline_runs or speaker_tags), and
+        total_changes counts rows changed through this connection.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('PRAGMA data_version')
+        return cursor.fetchone()[0], self.conn.total_changes
+
+    def _cached_stats(self, key: str, compute: Callable[[], Dict]) -> Dict:
+        """
+        Return a statistics dict from the short-lived cache, recomputing if needed.
+
+        Dashboard polling asks for the same aggregates over and over while the
+        data only changes when the pipeline writes. A cached result is reused
+        until STATS_CACHE_TTL expires or any write is committed (by this or
+        any other connection), whichever comes first.
+
+        Args:
+            key: Cache slot name
+            compute: Function that runs the aggregate queries
+
+        Returns:
+            A copy of the statistics dict (callers are free to modify it)
+        """
+        now = time.monotonic()
+        version = self.data_version()
+        cached = self._stats_cache.get(key)
+        if cached and now - cached[0] < self.STATS_CACHE_TTL and cached[1] == version:
+            return copy.deepcopy(cached[2])
+
+        stats = compute()
+        self._stats_cache[key] = (now, version, stats)
+        return copy.deepcopy(stats)
+
     def get_statistics(self) -> Dict[str, int]:
         """
         Get database statistics for all tables.
@@ -986,11 +1435,16 @@ class SpeakerDatabase:
             Dictionary with keys:
             - total_events: Total events scraped
             - processed_events: Events with completed speaker extraction
+            - pending_events: Events not yet processed (total - processed)
             - total_speakers: Total deduplicated speakers
             - total_connections: Total event-speaker links
             - tagged_speakers: Speakers with at least one tag
             - total_tags: Total tag records
         """
+        return self._cached_stats('statistics', self._compute_statistics)
+
+    def _compute_statistics(self) -> Dict[str, int]:
+        """Run the queries behind get_statistics (uncached)."""
         cursor = self.conn.cursor()
 
         stats = {}
@@ -1000,6 +1454,7 @@ class SpeakerDatabase:
 
         cursor.execute('SELECT COUNT(*) FROM events WHERE processing_status = "completed"')
         stats['processed_events'] = cursor.fetchone()[0]
+        stats['pending_events'] = stats['total_events'] - stats['processed_events']
 
         cursor.execute('SELECT COUNT(*) FROM speakers')
         stats['total_speakers'] = cursor.fetchone()[0]
@@ -1007,14 +1462,22 @@ class SpeakerDatabase:
         cursor.execute('SELECT COUNT(*) FROM event_speakers')
         stats['total_connections'] = cursor.fetchone()[0]
 
-        cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_tags')
-        stats['tagged_speakers'] = cursor.fetchone()[0]
-
-        cursor.execute('SELECT COUNT(*) FROM speaker_tags')
-        stats['total_tags'] = cursor.fetchone()[0]
+        # Tag totals come from the trigger-maintained counters (O(1) lookup)
+        counters = self.get_counters()
+        stats['tagged_speakers'] = counters.get('tagged_speakers', 0)
+        stats['total_tags'] = counters.get('total_tags', 0)
 
         return stats
 
+    def count_speakers(self) -> int:
+        """
+        Count speakers with a single query.
+
+        For callers that only need this one number: get_statistics runs all
+        of its aggregates whenever a write has invalidated its cache.
+        """
+        return self.conn.execute('SELECT COUNT(*) FROM speakers').fetchone()[0]
+
     def get_enhanced_statistics(self) -> Dict:
         """
         Get enhanced database statistics including enrichment progress and costs
@@ -1027,6 +1490,10 @@ class SpeakerDatabase:
             - API costs (total and by service)
             - Recent activity (last 7 days)
         """
+        return self._cached_stats('enhanced_statistics', self._compute_enhanced_statistics)
+
+    def _compute_enhanced_statistics(self) -> Dict:
+        """Run the queries behind get_enhanced_statistics (uncached)."""
         cursor = self.conn.cursor()
         stats = {}
 
@@ -1049,16 +1516,12 @@ class SpeakerDatabase:
             1
         )
 
-        # Embeddings - count unique speakers, not total embedding records
-        cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_embeddings')
-        stats['speakers_with_embeddings'] = cursor.fetchone()[0]
-
-        # Tags
-        cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_tags')
-        stats['tagged_speakers'] = cursor.fetchone()[0]
-
-        cursor.execute('SELECT COUNT(*) FROM speaker_tags')
-        stats['total_tags'] = cursor.fetchone()[0]
+        # Embeddings and tags come from the trigger-maintained counters.
+        # speaker_embeddings is keyed by speaker_id, so rows == unique speakers.
+        counters = self.get_counters()
+        stats['speakers_with_embeddings'] = counters.get('total_embeddings', 0)
+        stats['tagged_speakers'] = counters.get('tagged_speakers', 0)
+        stats['total_tags'] = counters.get('total_tags', 0)
 
         # Pipeline runs and costs (if table exists)
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='pipeline_runs'")
@@ -1147,13 +1610,17 @@ class SpeakerDatabase:
         from datetime import datetime, timedelta
         six_months_ago = (datetime.now() - timedelta(days=180)).isoformat()
 
+        # speaker_demographics has one row per speaker (keyed on speaker_id),
+        # so count its rows directly instead of JOIN + DISTINCT
         cursor.execute('''
-            SELECT COUNT(DISTINCT s.speaker_id)
-            FROM speakers s
-            INNER JOIN speaker_demographics sd ON s.speaker_id = sd.speaker_id
-            WHERE s.tagging_status = 'completed'
-            AND sd.enriched_at IS NOT NULL
+            SELECT COUNT(*)
+            FROM speaker_demographics sd
+            WHERE sd.enriched_at IS NOT NULL
             AND sd.enriched_at < ?
+            AND EXISTS (
+                SELECT 1 FROM speakers s
+                WHERE s.speaker_id = sd.speaker_id AND s.tagging_status = 'completed'
+            )
         ''', (six_months_ago,))
         stats['stale_speakers_count'] = cursor.fetchone()[0]
 
@@ -1174,11 +1641,44 @@ class SpeakerDatabase:
                 VALUES (?, ?, ?, ?, ?)
             ''', (speaker_id, tag_text.lower().strip(), confidence, source, now))
             self.conn.commit()
-            return cursor.lastrowid
+            return True
         except sqlite3.IntegrityError:
             # Tag already exists for this speaker
             return None
 
+    def bulk_upsert_tags(self, rows) -> int:
+        """
+        Add many tags in one transaction (e.g. when re-tagging after a reset).
+
+        Tags are normalized like add_speaker_tag and inserted with a single
+        executemany; tags a speaker already has are ignored. If the caller
+        already has a transaction open the rows join it and the caller
+        commits, otherwise the batch is committed here.
+
+        Args:
+            rows: Iterable of (speaker_id, tag_text, confidence, source)
+
+        Returns:
+            Number of tags inserted
+        """
+        now = datetime.now().isoformat()
+        params = [
+            (speaker_id, tag_text.lower().strip(), confidence, source, now)
+            for speaker_id, tag_text, confidence, source in rows
+        ]
+        if not params:
+            return 0
+
+        cursor = self.conn.cursor()
+        # Own transaction, or a savepoint inside the caller's: either way a
+        # failed batch is rolled back rather than left open
+        with self.atomic():
+            cursor.executemany('''
+                INSERT OR IGNORE INTO speaker_tags (speaker_id, tag_text, confidence_score, source, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', params)
+        return cursor.rowcount
+
     def get_speaker_tags(self, speaker_id):
         """Get all tags for a speaker"""
         cursor = self.conn.cursor()
@@ -1190,6 +1690,58 @@ class SpeakerDatabase:
         ''', (speaker_id,))
         return cursor.fetchall()
 
+    def get_enrichment_counts(self) -> Dict[str, int]:
+        """
+        Get enrichment coverage counts in a single query.
+
+        Returns:
+            Dictionary with keys total_speakers, tagged_speakers,
+            with_demographics, with_locations, with_languages,
+            fully_enriched (tags and demographics) and remaining
+            (neither tags nor demographics)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT
+                (SELECT COUNT(*) FROM speakers),
+                (SELECT value FROM counters WHERE name = 'tagged_speakers'),
+                (SELECT COUNT(*) FROM speaker_demographics),
+                (SELECT COUNT(DISTINCT speaker_id) FROM speaker_locations),
+                (SELECT COUNT(DISTINCT speaker_id) FROM speaker_languages),
+                (SELECT COUNT(*) FROM speaker_demographics d
+                 WHERE EXISTS (SELECT 1 FROM speaker_tags t WHERE t.speaker_id = d.speaker_id)),
+                (SELECT COUNT(*) FROM speakers s
+                 WHERE NOT EXISTS (SELECT 1 FROM speaker_demographics d WHERE d.speaker_id = s.speaker_id)
+                   AND NOT EXISTS (SELECT 1 FROM speaker_tags t WHERE t.speaker_id = s.speaker_id))
+        ''')
+        keys = ('total_speakers', 'tagged_speakers', 'with_demographics', 'with_locations',
+                'with_languages', 'fully_enriched', 'remaining')
+        return {key: value or 0 for key, value in zip(keys, cursor.fetchone())}
+
+    def get_unenriched_speakers(self, limit: Optional[int] = None) -> List[Tuple]:
+        """
+        Get speakers with neither demographics nor tags, ordered by name.
+
+        The filter runs in SQL (primary-key probes into both tables), so
+        callers don't need to fetch every speaker and check each in Python.
+
+        Args:
+            limit: Maximum number of speakers to return (None = all)
+
+        Returns:
+            List of tuples in the get_all_speakers shape
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT s.speaker_id, s.name, s.title, s.affiliation, s.bio, s.first_seen, s.last_updated
+            FROM speakers s
+            WHERE NOT EXISTS (SELECT 1 FROM speaker_demographics d WHERE d.speaker_id = s.speaker_id)
+              AND NOT EXISTS (SELECT 1 FROM speaker_tags t WHERE t.speaker_id = s.speaker_id)
+            ORDER BY s.name
+            LIMIT ?
+        ''', (-1 if limit is None else limit,))
+        return cursor.fetchall()
+
     def get_untagged_speakers(self):
         """Get all speakers that haven't been tagged yet"""
         cursor = self.conn.cursor()
@@ -1200,15 +1752,52 @@ class SpeakerDatabase:
         ''')
         return cursor.fetchall()
 
+    @contextmanager
+    def atomic(self):
+        """
+        Run a block of writes as one unit.
+
+        Opens a transaction, or a savepoint if one is already open, so blocks
+        nest: a caller can group many atomic() blocks into a single commit
+        while each block still rolls back on its own if it raises. The save
+        helpers that normally commit per call leave committing to the
+        outermost block.
+        """
+        if not self.conn.in_transaction:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield
+            except BaseException:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+            return
+
+        self._savepoints += 1
+        name = f'atomic_{self._savepoints}'
+        self.conn.execute(f'SAVEPOINT {name}')
+        try:
+            yield
+        except BaseException:
+            self.conn.execute(f'ROLLBACK TO {name}')
+            self.conn.execute(f'RELEASE {name}')
+            raise
+        finally:
+            self._savepoints -= 1
+        self.conn.execute(f'RELEASE {name}')
+
     def mark_speaker_tagged(self, speaker_id, status='completed'):
         """Mark a speaker's tagging status"""
         cursor = self.conn.cursor()
+        # Inside a caller's transaction (see atomic) the caller commits
+        owns_transaction = not self.conn.in_transaction
         cursor.execute('''
             UPDATE speakers
             SET tagging_status = ?
             WHERE speaker_id = ?
         ''', (status, speaker_id))
-        self.conn.commit()
+        if owns_transaction:
+            self.conn.commit()
 
     def enrich_speaker_data(self, speaker_id, enriched_title=None, enriched_bio=None):
         """
@@ -1219,28 +1808,22 @@ class SpeakerDatabase:
             enriched_title: Updated job title (or None to skip)
             enriched_bio: Enriched biography (or None to skip)
         """
+        if not enriched_title and not enriched_bio:
+            return
+
         cursor = self.conn.cursor()
+        # Inside a caller's transaction (see atomic) the caller commits
+        owns_transaction = not self.conn.in_transaction
         now = datetime.now().isoformat()
 
-        # Build UPDATE query dynamically based on what's being enriched
-        updates = []
-        params = []
-
-        if enriched_title:
-            updates.append('title = ?')
-            params.append(enriched_title)
-
-        if enriched_bio:
-            updates.append('bio = ?')
-            params.append(enriched_bio)
-
-        if updates:
-            updates.append('last_updated = ?')
-            params.append(now)
-            params.append(speaker_id)
-
-            query = f"UPDATE speakers SET {', '.join(updates)} WHERE speaker_id = ?"
-            cursor.execute(query, params)
+        # One fixed statement (reused from sqlite3's statement cache);
+        # COALESCE(NULL, col) keeps whichever field isn't being enriched
+        cursor.execute('''
+            UPDATE speakers
+            SET title = COALESCE(?, title), bio = COALESCE(?, bio), last_updated = ?
+            WHERE speaker_id = ?
+        ''', (enriched_title or None, enriched_bio or None, now, speaker_id))
+        if owns_transaction:
             self.conn.commit()
 
     def get_speaker_by_id(self, speaker_id):
@@ -1279,25 +1862,41 @@ class SpeakerDatabase:
 
     def save_speaker_embedding(self, speaker_id, embedding_blob, embedding_text, model='voyage-3'):
         """Save embedding for a speaker"""
-        cursor = self.conn.cursor()
-        now = datetime.now().isoformat()
+        self.save_speaker_embeddings([(speaker_id, embedding_blob, embedding_text)], model=model)
+        return True
 
-        try:
-            cursor.execute('''
-                INSERT INTO speaker_embeddings (speaker_id, embedding_model, embedding, embedding_text, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (speaker_id, model, embedding_blob, embedding_text, now))
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError:
-            # Update existing embedding
-            cursor.execute('''
-                UPDATE speaker_embeddings
-                SET embedding = ?, embedding_text = ?, embedding_model = ?, created_at = ?
-                WHERE speaker_id = ?
-            ''', (embedding_blob, embedding_text, model, now, speaker_id))
+    def save_speaker_embeddings(self, rows, model='voyage-3'):
+        """
+        Save many speaker embeddings in a single executemany.
+
+        Same semantics as save_speaker_embedding: an existing embedding is
+        overwritten and its matrix row is marked stale until the next rebuild.
+
+        Args:
+            rows: Iterable of (speaker_id, embedding_blob, embedding_text)
+            model: Embedding model name recorded with every row
+        """
+        now = datetime.now().isoformat()
+        params = [
+            (speaker_id, model, embedding_blob, embedding_text, now)
+            for speaker_id, embedding_blob, embedding_text in rows
+        ]
+        if not params:
+            return
+
+        owns_transaction = not self.conn.in_transaction
+        self.conn.executemany('''
+            INSERT INTO speaker_embeddings (speaker_id, embedding_model, embedding, embedding_text, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (speaker_id) DO UPDATE SET
+                embedding = excluded.embedding,
+                embedding_text = excluded.embedding_text,
+                embedding_model = excluded.embedding_model,
+                created_at = excluded.created_at,
+                embedding_offset = NULL
+        ''', params)
+        if owns_transaction:
             self.conn.commit()
-            return True
 
     def get_speaker_embedding(self, speaker_id):
         """Get embedding for a specific speaker"""
@@ -1318,6 +1917,168 @@ class SpeakerDatabase:
         ''')
         return cursor.fetchall()
 
+    # Element types the on-disk embedding matrix can be stored in
+    EMBEDDING_MATRIX_DTYPES = ('float32', 'float16', 'int8')
+
+    def rebuild_embedding_matrix(self, deserialize: Callable[[bytes], Any], dtype: str = 'float32') -> int:
+        """
+        Write all embeddings into one contiguous float32 matrix file.
+
+        Reading N BLOB rows and decoding each one is N small allocations per
+        search. Instead, the embeddings are copied once into a .npy file next
+        to the database (one row per speaker, ordered by speaker_id) and each
+        speaker_embeddings row records its row number in embedding_offset.
+        Searches can then memory-map the whole matrix in a single read.
+        Rows are L2-normalized, so a dot product with a unit query is the
+        cosine similarity.
+
+        The BLOB column stays the source of truth; this file is a derived
+        cache and can be rebuilt at any time.
+
+        dtype='float16' halves the matrix with no measurable effect on
+        ranking. With dtype='int8' each row is quantized symmetrically to
+        int8 with its own scale (max |x| / 127, kept in embedding_scale). The
+        matrix is then a quarter of the size, at a score error of well under 1%.
+
+        Args:
+            deserialize: Callable turning a stored BLOB into a vector
+                         (usually EmbeddingEngine.deserialize_embedding)
+            dtype: One of EMBEDDING_MATRIX_DTYPES
+
+        Returns:
+            Number of rows written to the matrix
+        """
+        import numpy as np
+
+        if dtype not in self.EMBEDDING_MATRIX_DTYPES:
+            raise ValueError(f"Unknown embedding matrix dtype: {dtype}. Use one of {self.EMBEDDING_MATRIX_DTYPES}")
+
+        cursor = self.conn.cursor()
+        # Read before the rows: a write racing the rebuild leaves the stamp old
+        writes = self.get_counters().get('embedding_writes', 0)
+        cursor.execute('SELECT speaker_id, embedding FROM speaker_embeddings ORDER BY speaker_id')
+        rows = cursor.fetchall()
+        if not rows:
+            return 0
+
+        dimension = len(deserialize(rows[0][1]))
+        tmp_path = self.embedding_matrix_path + '.tmp'
+        matrix = np.lib.format.open_memmap(
+            tmp_path, mode='w+', dtype=np.dtype(dtype), shape=(len(rows), dimension)
+        )
+        scales = []
+        for offset, (_, blob) in enumerate(rows):
+            vector = np.asarray(deserialize(blob), dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm:
+                vector = vector / norm
+            if dtype == 'int8':
+                scale = float(np.abs(vector).max()) / 127 or 1.0
+                matrix[offset] = np.clip(np.round(vector / scale), -127, 127)
+                scales.append(scale)
+            else:
+                matrix[offset] = vector
+                scales.append(None)
+        matrix.flush()
+        del matrix
+
+        # Swap the files in atomically, then record the offsets
+        os.replace(tmp_path, self.embedding_matrix_path)
+        sidecars = [(self.embedding_ids_path, np.array([row[0] for row in rows], dtype=np.int64))]
+        if dtype == 'int8':
+            sidecars.append((self.embedding_scales_path, np.array(scales, dtype=np.float32)))
+        for path, array in sidecars:
+            with open(path + '.tmp', 'wb') as f:
+                np.save(f, array)
+            os.replace(path + '.tmp', path)
+        cursor.executemany(
+            'UPDATE speaker_embeddings SET embedding_offset = ?, embedding_scale = ? WHERE speaker_id = ?',
+            [(offset, scales[offset], speaker_id) for offset, (speaker_id, _) in enumerate(rows)]
+        )
+        # embedding_writes as of this rebuild; while it still matches, the
+        # sidecar files describe the matrix exactly (see get_embedding_matrix)
+        cursor.execute(
+            "INSERT OR REPLACE INTO counters (name, value) VALUES ('embedding_matrix_writes', ?)",
+            (writes,)
+        )
+        self.conn.commit()
+        return len(rows)
+
+    def get_embedding_matrix(self) -> Optional[Tuple[Any, Any]]:
+        """
+        Get all embeddings as (speaker_ids, matrix) from the on-disk matrix file.
+
+        The matrix is memory-mapped read-only, so rows are paged in by the OS on
+        demand instead of being copied out of SQLite one BLOB at a time. If no
+        embedding has been written since the rebuild, the ids (and int8
+        scales) come from the sidecar .npy files, so loading doesn't depend on
+        the number of speakers; otherwise they're read from embedding_offset.
+
+        Returns:
+            Tuple (ids, matrix) where ids is an int64 array and matrix a float32
+            array of shape (len(ids), dimension), or None if the matrix file is
+            missing or stale (some embedding saved since the last rebuild).
+            Callers should fall back to get_all_embeddings() on None.
+            A float16 or int8 matrix is returned as a QuantizedEmbeddingMatrix,
+            which supports the same `matrix @ query` scoring.
+        """
+        import numpy as np
+
+        if not os.path.exists(self.embedding_matrix_path):
+            return None
+
+        # Fast path: no embedding written since the rebuild, so the matrix and
+        # its sidecar ids/scales are current and load with no per-row reads
+        counters = self.get_counters()
+        if (counters.get('embedding_matrix_writes') == counters.get('embedding_writes')
+                and os.path.exists(self.embedding_ids_path)):
+            matrix = np.load(self.embedding_matrix_path, mmap_mode='r')
+            ids = np.load(self.embedding_ids_path, mmap_mode='r')
+            scales = None
+            if matrix.dtype == np.int8 and os.path.exists(self.embedding_scales_path):
+                scales = np.load(self.embedding_scales_path)
+            if len(ids) == len(matrix) and (matrix.dtype != np.int8 or scales is not None):
+                return self._wrap_embedding_matrix(ids, matrix, scales)
+
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT speaker_id, embedding_offset, embedding_scale
+            FROM speaker_embeddings
+            ORDER BY embedding_offset
+        ''')
+        rows = cursor.fetchall()
+        if not rows or any(offset is None for _, offset, _ in rows):
+            return None
+
+        matrix = np.load(self.embedding_matrix_path, mmap_mode='r')
+        ids = np.fromiter((speaker_id for speaker_id, _, _ in rows), dtype=np.int64, count=len(rows))
+        offsets = np.fromiter((offset for _, offset, _ in rows), dtype=np.int64, count=len(rows))
+
+        if offsets[-1] >= len(matrix):
+            return None
+        if not (len(offsets) == len(matrix) and offsets[-1] == len(matrix) - 1):
+            # Some rows were deleted since the rebuild: gather the surviving ones
+            matrix = matrix[offsets]
+        # (otherwise offsets are exactly 0..N-1: hand back the mapped view as-is)
+
+        scales = None
+        if matrix.dtype == np.int8:
+            if any(scale is None for _, _, scale in rows):
+                return None
+            scales = np.fromiter((scale for _, _, scale in rows), dtype=np.float32, count=len(rows))
+        return self._wrap_embedding_matrix(ids, matrix, scales)
+
+    @staticmethod
+    def _wrap_embedding_matrix(ids, matrix, scales) -> Tuple[Any, Any]:
+        """(ids, matrix) with float16/int8 matrices wrapped for `matrix @ query`"""
+        import numpy as np
+
+        if matrix.dtype == np.int8:
+            return ids, QuantizedEmbeddingMatrix(matrix, scales)
+        if matrix.dtype == np.float16:
+            return ids, QuantizedEmbeddingMatrix(matrix)
+        return ids, matrix
+
     def get_speakers_without_embeddings(self):
         """Get all speakers that don't have embeddings yet"""
         cursor = self.conn.cursor()
@@ -1329,18 +2090,123 @@ class SpeakerDatabase:
         ''')
         return cursor.fetchall()
 
-    def count_embeddings(self):
-        """Count how many speakers have embeddings"""
+    # Speakers that still need an embedding: none at all, or (when the model
+    # parameter is not NULL) one from a different model. Binds (model, model).
+    _MISSING_EMBEDDING_FILTER = '''
+        WHERE NOT EXISTS (
+            SELECT 1 FROM speaker_embeddings e
+            WHERE e.speaker_id = s.speaker_id AND (? IS NULL OR e.embedding_model = ?)
+        )
+    '''
+
+    def _embedding_filter(self, missing_only, model):
+        """WHERE clause and parameters selecting speakers for embedding"""
+        if not missing_only:
+            return '', ()
+        return self._MISSING_EMBEDDING_FILTER, (model, model)
+
+    def count_speakers_for_embedding(self, missing_only=True, model=None) -> int:
+        """Count the speakers iter_speakers_for_embedding would yield (before any limit)"""
+        where, params = self._embedding_filter(missing_only, model)
         cursor = self.conn.cursor()
-        cursor.execute('SELECT COUNT(*) FROM speaker_embeddings')
+        cursor.execute('SELECT COUNT(*) FROM speakers s' + where, params)
         return cursor.fetchone()[0]
 
+    def iter_speakers_for_embedding(self, missing_only=True, model=None, limit=None,
+                                    bio_chars=None, max_events=None,
+                                    event_chars=None) -> Iterator[Tuple]:
+        """
+        Stream speakers together with the tags and events their embedding text uses.
+
+        Tags and events come from correlated subqueries in the same statement,
+        so there is no per-speaker query and rows are read off the cursor as
+        the caller consumes them rather than held in memory.
+
+        Args:
+            missing_only: Only speakers without an embedding
+            model: With missing_only, also include speakers whose embedding
+                   came from a different model (None: any embedding counts)
+            limit: Maximum number of speakers (None for all)
+            bio_chars: Truncate bios to this many characters in SQL
+            max_events: Only the most recent events
+            event_chars: Truncate event descriptions to this many characters
+
+        The truncation limits let callers that only read part of a long bio
+        or event page (see EmbeddingEngine.build_embedding_text) leave the
+        rest in the database. None means no limit.
+
+        Yields:
+            Tuples: (speaker_id, name, title, affiliation, primary_affiliation,
+            bio, tags, events) where tags is a list of tag text (highest
+            confidence first) and events a list of (title, role_in_event,
+            body_text), most recent first
+        """
+        where, params = self._embedding_filter(missing_only, model)
+        # substr() past SQLite's maximum string length (1e9 by default) and
+        # LIMIT -1 keep everything
+        whole = 2 ** 31 - 1
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT s.speaker_id, s.name, s.title, s.affiliation, s.primary_affiliation,
+                substr(s.bio, 1, ?),
+                (SELECT json_group_array(tag_text) FROM (
+                    SELECT t.tag_text FROM speaker_tags t
+                    WHERE t.speaker_id = s.speaker_id
+                    ORDER BY t.confidence_score DESC
+                )),
+                (SELECT json_group_array(json_array(title, role_in_event, body_text)) FROM (
+                    SELECT ev.title, es.role_in_event, substr(ev.body_text, 1, ?) AS body_text
+                    FROM event_speakers es
+                    JOIN events ev ON ev.event_id = es.event_id
+                    WHERE es.speaker_id = s.speaker_id
+                    ORDER BY ev.event_date DESC
+                    LIMIT ?
+                ))
+            FROM speakers s
+        ''' + where + '''
+            ORDER BY s.speaker_id
+            LIMIT ?
+        ''', (whole if bio_chars is None else bio_chars,
+              whole if event_chars is None else event_chars,
+              -1 if max_events is None else max_events,
+              *params, -1 if limit is None else limit))
+        for *speaker, tags, events in cursor:
+            yield (*speaker, json.loads(tags), [tuple(event) for event in json.loads(events)])
+
+    def get_embedded_speaker_ids(self, speaker_ids, model=None):
+        """
+        Return which of the given speakers already have an embedding.
+
+        One json_each join per batch instead of a COUNT(*) per speaker.
+
+        Args:
+            speaker_ids: Candidate speaker IDs
+            model: Only count embeddings from this model (None: any model)
+
+        Returns:
+            Set of the speaker IDs that have a speaker_embeddings row
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT e.speaker_id
+            FROM json_each(?) c
+            JOIN speaker_embeddings e ON e.speaker_id = c.value
+            WHERE ? IS NULL OR e.embedding_model = ?
+        ''', (json.dumps(list(speaker_ids)), model, model))
+        return {row[0] for row in cursor}
+
+    def count_embeddings(self):
+        """Count how many speakers have embeddings"""
+        return self.get_counters().get('total_embeddings', 0)
+
     # ========== Enrichment Methods ==========
 
     def save_speaker_demographics(self, speaker_id, gender=None, gender_confidence=None,
                                   nationality=None, nationality_confidence=None, birth_year=None):
         """Save demographic information for a speaker"""
         cursor = self.conn.cursor()
+        # Inside a caller's transaction (see atomic) the caller commits
+        owns_transaction = not self.conn.in_transaction
         now = datetime.now().isoformat()
 
         try:
@@ -1349,7 +2215,8 @@ class SpeakerDatabase:
                 (speaker_id, gender, gender_confidence, nationality, nationality_confidence, birth_year, enriched_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (speaker_id, gender, gender_confidence, nationality, nationality_confidence, birth_year, now))
-            self.conn.commit()
+            if owns_transaction:
+                self.conn.commit()
             return True
         except sqlite3.IntegrityError:
             # Update existing
@@ -1359,7 +2226,8 @@ class SpeakerDatabase:
                     nationality_confidence = ?, birth_year = ?, enriched_at = ?
                 WHERE speaker_id = ?
             ''', (gender, gender_confidence, nationality, nationality_confidence, birth_year, now, speaker_id))
-            self.conn.commit()
+            if owns_transaction:
+                self.conn.commit()
             return True
 
     def get_speaker_demographics(self, speaker_id):
@@ -1376,6 +2244,8 @@ class SpeakerDatabase:
                              region=None, is_primary=False, confidence=None, source=None):
         """Save location information for a speaker"""
         cursor = self.conn.cursor()
+        # Inside a caller's transaction (see atomic) the caller commits
+        owns_transaction = not self.conn.in_transaction
         now = datetime.now().isoformat()
 
         cursor.execute('''
@@ -1383,9 +2253,40 @@ class SpeakerDatabase:
             (speaker_id, location_type, city, country, region, is_primary, confidence, source, created_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', (speaker_id, location_type, city, country, region, is_primary, confidence, source, now))
-        self.conn.commit()
+        if owns_transaction:
+            self.conn.commit()
         return cursor.lastrowid
 
+    def bulk_insert_locations(self, rows) -> int:
+        """
+        Add many locations with a single executemany
+
+        Joins the caller's transaction if one is open (the caller commits),
+        otherwise the batch is committed here.
+
+        Args:
+            rows: Iterable of (speaker_id, location_type, city, country,
+                region, is_primary, confidence, source)
+
+        Returns:
+            Number of locations inserted
+        """
+        now = datetime.now().isoformat()
+        params = [row + (now,) for row in map(tuple, rows)]
+        if not params:
+            return 0
+
+        cursor = self.conn.cursor()
+        # Own transaction, or a savepoint inside the caller's: either way a
+        # failed batch is rolled back rather than left open
+        with self.atomic():
+            cursor.executemany('''
+                INSERT INTO speaker_locations
+                (speaker_id, location_type, city, country, region, is_primary, confidence, source, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', params)
+        return cursor.rowcount
+
     def get_speaker_locations(self, speaker_id):
         """Get all locations for a speaker"""
         cursor = self.conn.cursor()
@@ -1400,6 +2301,8 @@ class SpeakerDatabase:
     def save_speaker_language(self, speaker_id, language, proficiency=None, confidence=None, source=None):
         """Save language information for a speaker"""
         cursor = self.conn.cursor()
+        # Inside a caller's transaction (see atomic) the caller commits
+        owns_transaction = not self.conn.in_transaction
         now = datetime.now().isoformat()
 
         try:
@@ -1408,8 +2311,9 @@ class SpeakerDatabase:
                 (speaker_id, language, proficiency, confidence, source, created_at)
                 VALUES (?, ?, ?, ?, ?, ?)
             ''', (speaker_id, language, proficiency, confidence, source, now))
-            self.conn.commit()
-            return cursor.lastrowid
+            if owns_transaction:
+                self.conn.commit()
+            return True
         except sqlite3.IntegrityError:
             # Language already exists for this speaker, update it
             cursor.execute('''
@@ -1417,9 +2321,45 @@ class SpeakerDatabase:
                 SET proficiency = ?, confidence = ?, source = ?, created_at = ?
                 WHERE speaker_id = ? AND language = ?
             ''', (proficiency, confidence, source, now, speaker_id, language))
-            self.conn.commit()
+            if owns_transaction:
+                self.conn.commit()
             return None
 
+    def bulk_upsert_languages(self, rows) -> int:
+        """
+        Save many languages with a single executemany
+
+        A language the speaker already has is updated in place, as in
+        save_speaker_language. Joins the caller's transaction if one is
+        open (the caller commits), otherwise the batch is committed here.
+
+        Args:
+            rows: Iterable of (speaker_id, language, proficiency, confidence, source)
+
+        Returns:
+            Number of languages written
+        """
+        now = datetime.now().isoformat()
+        params = [row + (now,) for row in map(tuple, rows)]
+        if not params:
+            return 0
+
+        cursor = self.conn.cursor()
+        # Own transaction, or a savepoint inside the caller's: either way a
+        # failed batch is rolled back rather than left open
+        with self.atomic():
+            cursor.executemany('''
+                INSERT INTO speaker_languages
+                (speaker_id, language, proficiency, confidence, source, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (speaker_id, language) DO UPDATE SET
+                    proficiency = excluded.proficiency,
+                    confidence = excluded.confidence,
+                    source = excluded.source,
+                    created_at = excluded.created_at
+            ''', params)
+        return cursor.rowcount
+
     def get_speaker_languages(self, speaker_id):
         """Get all languages for a speaker"""
         cursor = self.conn.cursor()
@@ -1494,65 +2434,18 @@ class SpeakerDatabase:
         for normalized_name, id_str in duplicate_groups:
             speaker_ids = [int(x) for x in id_str.split(',')]
 
-            # Fetch full records for all speakers in this duplicate group
-            speakers = []
-            for sid in speaker_ids:
-                cursor.execute('''
-                    SELECT speaker_id, name, title, affiliation, primary_affiliation, bio
-                    FROM speakers WHERE speaker_id = ?
-                ''', (sid,))
-                speakers.append(cursor.fetchone())
-
-            # Score each record by completeness - the most complete record becomes primary
-            # This ensures we keep the record with the most information
-            def completeness_score(s):
-                score = 0
-                if s[2]: score += 1  # Has title
-                if s[3]: score += len(s[3])  # Affiliation length
-                if s[4]: score += 1  # Has primary_affiliation
-                if s[5]: score += len(s[5]) if s[5] else 0  # Bio length
-                return score
-
-            speakers_sorted = sorted(speakers, key=completeness_score, reverse=True)
-            primary = speakers_sorted[0]
-            primary_id = primary[0]
-            duplicates = speakers_sorted[1:]
+            # Completeness scoring and field merging both run inside SQLite
+            primary_id = self.pick_primary_speaker(speaker_ids)
+            duplicate_ids = [sid for sid in speaker_ids if sid != primary_id]
 
             if verbose:
-                print(f"Merging '{primary[1]}': keeping ID={primary_id}, merging {len(duplicates)} duplicates")
-
-            # Merge information from all duplicates into the primary record
-            # Always prefer longer/more detailed information
-            merged_title = primary[2]
-            merged_affiliation = primary[3]
-            merged_primary_aff = primary[4]
-            merged_bio = primary[5]
-
-            for dup in duplicates:
-                # Keep longer title
-                if dup[2] and (not merged_title or len(dup[2]) > len(merged_title)):
-                    merged_title = dup[2]
-                # Keep longer affiliation string
-                if dup[3] and (not merged_affiliation or len(dup[3]) > len(merged_affiliation)):
-                    merged_affiliation = dup[3]
-                # Fill in primary affiliation if missing
-                if dup[4] and not merged_primary_aff:
-                    merged_primary_aff = dup[4]
-                # Keep longer bio
-                if dup[5] and (not merged_bio or len(dup[5]) > len(merged_bio)):
-                    merged_bio = dup[5]
-
-            # Update the primary record with merged information
-            cursor.execute('''
-                UPDATE speakers
-                SET title = ?, affiliation = ?, primary_affiliation = ?, bio = ?, last_updated = datetime('now')
-                WHERE speaker_id = ?
-            ''', (merged_title, merged_affiliation, merged_primary_aff, merged_bio, primary_id))
+                cursor.execute('SELECT name FROM speakers WHERE speaker_id = ?', (primary_id,))
+                print(f"Merging '{cursor.fetchone()[0]}': keeping ID={primary_id}, merging {len(duplicate_ids)} duplicates")
 
-            # Reassign all event links from duplicates to primary, then delete duplicates
-            for dup in duplicates:
-                dup_id = dup[0]
+            self.merge_speaker_fields(primary_id, speaker_ids)
 
+            # Reassign all event links from duplicates to primary, then delete duplicates
+            for dup_id in duplicate_ids:
                 # Get all events linked to this duplicate
                 cursor.execute('''
                     SELECT event_id, role_in_event, extracted_info
@@ -1587,6 +2480,75 @@ class SpeakerDatabase:
         self.conn.commit()
         return merged_count
 
+    # Completeness score used to pick which duplicate record to keep:
+    # +1 for a title, +length of affiliation, +1 for a primary affiliation, +length of bio
+    COMPLETENESS_SCORE_SQL = '''
+        (COALESCE(title, '') != '')
+        + COALESCE(LENGTH(affiliation), 0)
+        + (COALESCE(primary_affiliation, '') != '')
+        + COALESCE(LENGTH(bio), 0)
+    '''
+
+    def pick_primary_speaker(self, speaker_ids: List[int]) -> int:
+        """
+        Pick the most complete record from a group of duplicate speakers.
+
+        The completeness score is evaluated by SQLite in the ORDER BY, so no
+        rows are pulled into Python. Ties go to the lowest speaker_id.
+
+        Args:
+            speaker_ids: IDs of the speaker records in the duplicate group
+
+        Returns:
+            speaker_id of the record to keep as primary
+        """
+        cursor = self.conn.cursor()
+        placeholders = ','.join('?' * len(speaker_ids))
+        cursor.execute(f'''
+            SELECT speaker_id FROM speakers
+            WHERE speaker_id IN ({placeholders})
+            ORDER BY {self.COMPLETENESS_SCORE_SQL} DESC, speaker_id ASC
+            LIMIT 1
+        ''', speaker_ids)
+        return cursor.fetchone()[0]
+
+    def merge_speaker_fields(self, primary_id: int, speaker_ids: List[int]) -> None:
+        """
+        Copy the best field values from a duplicate group onto the primary record.
+
+        Runs as one UPDATE with correlated subqueries over the group:
+        - title, affiliation, bio: longest value wins (primary wins ties)
+        - primary_affiliation: primary's value, or the first non-empty one
+
+        Does not commit; the caller commits once the event links are moved.
+
+        Args:
+            primary_id: speaker_id of the record being kept
+            speaker_ids: IDs of every record in the group (including primary_id)
+        """
+        cursor = self.conn.cursor()
+        placeholders = ','.join('?' * len(speaker_ids))
+        cursor.execute(f'''
+            WITH grp AS (
+                SELECT speaker_id, title, affiliation, primary_affiliation, bio,
+                       speaker_id = ? AS is_primary
+                FROM speakers
+                WHERE speaker_id IN ({placeholders})
+            )
+            UPDATE speakers
+            SET title = (SELECT title FROM grp
+                         ORDER BY COALESCE(LENGTH(title), 0) DESC, is_primary DESC LIMIT 1),
+                affiliation = (SELECT affiliation FROM grp
+                               ORDER BY COALESCE(LENGTH(affiliation), 0) DESC, is_primary DESC LIMIT 1),
+                primary_affiliation = (SELECT primary_affiliation FROM grp
+                                       ORDER BY COALESCE(primary_affiliation, '') != '' DESC,
+                                                is_primary DESC, speaker_id ASC LIMIT 1),
+                bio = (SELECT bio FROM grp
+                       ORDER BY COALESCE(LENGTH(bio), 0) DESC, is_primary DESC LIMIT 1),
+                last_updated = datetime('now')
+            WHERE speaker_id = ?
+        ''', [primary_id, *speaker_ids, primary_id])
+
     def save_correction(
         self,
         speaker_id: int,
@@ -1859,6 +2821,36 @@ class SpeakerDatabase:
         result = cursor.fetchone()
         return result[0] if result else None
 
+    def get_cached_query_embedding(self, cache_key: str) -> Optional[bytes]:
+        """
+        Look up a stored query embedding.
+
+        Args:
+            cache_key: Key from EmbeddingEngine.query_cache_key
+
+        Returns:
+            Serialized embedding, or None on a cache miss
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT embedding FROM query_embedding_cache WHERE cache_key = ?', (cache_key,))
+        result = cursor.fetchone()
+        return result[0] if result else None
+
+    def save_cached_query_embedding(self, cache_key: str, embedding_blob: bytes) -> None:
+        """
+        Store a query embedding for reuse by later searches.
+
+        Args:
+            cache_key: Key from EmbeddingEngine.query_cache_key
+            embedding_blob: Serialized embedding
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO query_embedding_cache (cache_key, embedding, created_at)
+            VALUES (?, ?, ?)
+        ''', (cache_key, embedding_blob, datetime.now().isoformat()))
+        self.conn.commit()
+
     def log_search(
         self,
         query: str,
@@ -1967,9 +2959,31 @@ class SpeakerDatabase:
 
         return analytics
 
+    def analyze(self) -> None:
+        """
+        Refresh the query planner's table statistics (sqlite_stat1)
+
+        Run after bulk writes such as an enrichment run, so the planner
+        serves the per-speaker EXISTS / NOT EXISTS checks from the
+        speaker_id indexes rather than scanning the child tables.
+        """
+        self.conn.execute('ANALYZE')
+        self.conn.commit()
+
     def close(self):
-        """Close database connection"""
+        """
+        Close database connection
+
+        A connection that changed rows runs PRAGMA optimize first, so the
+        planner statistics (sqlite_stat1) follow the bulk writes made
+        through it; read-mostly callers (web_app requests) skip it.
+        """
         if self.conn:
+            if not self.read_only and self.conn.total_changes:
+                try:
+                    self.conn.execute('PRAGMA optimize')
+                except sqlite3.Error:
+                    pass  # Busy or locked: the statistics can wait a run
             self.conn.close()
 
     def __enter__(self):
@@ -1977,3 +2991,111 @@ class SpeakerDatabase:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class QuantizedEmbeddingMatrix:
+    """
+    Low-precision embedding matrix that scores like a float32 one.
+
+    `matrix @ query` widens the rows to float32 one tile at a time, so the
+    scratch space stays cache-sized, and applies each row's scale.
+    """
+
+    # Rows widened to float32 per step of a matrix-vector product
+    TILE_ROWS = 1024
+
+    def __init__(self, rows, scales=None):
+        """
+        Args:
+            rows: (N, D) array (e.g. int8, possibly memory-mapped)
+            scales: Optional (N,) float32 array of per-row dequantization scales
+        """
+        self.rows = rows
+        self.scales = scales
+        self.shape = rows.shape
+        self.dtype = rows.dtype
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index) -> 'QuantizedEmbeddingMatrix':
+        """Subset of rows (e.g. a shortlist), still quantized"""
+        scales = self.scales[index] if self.scales is not None else None
+        return QuantizedEmbeddingMatrix(self.rows[index], scales)
+
+    def __matmul__(self, query):
+        import numpy as np
+
+        query = np.asarray(query, dtype=np.float32)
+        scores = np.empty(len(self.rows), dtype=np.float32)
+        for start in range(0, len(self.rows), self.TILE_ROWS):
+            tile = self.rows[start:start + self.TILE_ROWS]
+            scores[start:start + len(tile)] = tile.astype(np.float32) @ query
+        if self.scales is not None:
+            scores *= self.scales
+        return scores
+
+
+class SpeakerDatabasePool:
+    """
+    Fixed-size pool of read-only SpeakerDatabase connections.
+
+    A single shared connection serializes every web request behind it. With
+    the database in WAL mode, any number of readers can run alongside the one
+    writer, so the Flask app checks a read-only connection out of this pool
+    for query-only routes (stats, leaderboard, speaker pages) and keeps using
+    a regular SpeakerDatabase for writes.
+
+    Example:
+        pool = SpeakerDatabasePool('speakers.db', size=4)
+        with pool.reader() as database:
+            stats = database.get_enhanced_statistics()
+    """
+
+    def __init__(self, db_path: str = 'speakers.db', size: int = 4):
+        """
+        Create the pool and open all of its connections.
+
+        Args:
+            db_path: Path to SQLite database file (default: 'speakers.db')
+            size: Number of read-only connections to keep open (default: 4)
+        """
+        self.db_path = db_path
+        self.size = size
+
+        # A regular connection first, so the schema exists and the file is in WAL mode
+        SpeakerDatabase(db_path).close()
+
+        self._readers = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._readers.put(SpeakerDatabase(db_path, read_only=True))
+
+    def acquire(self, timeout: Optional[float] = None) -> SpeakerDatabase:
+        """
+        Check a read-only connection out of the pool.
+
+        Blocks until one is free (or raises queue.Empty after timeout seconds).
+        Every acquire() must be paired with a release().
+        """
+        return self._readers.get(timeout=timeout)
+
+    def release(self, database: SpeakerDatabase) -> None:
+        """Return a connection obtained from acquire() to the pool."""
+        self._readers.put(database)
+
+    @contextmanager
+    def reader(self, timeout: Optional[float] = None):
+        """Context manager that checks out a read-only connection and returns it afterwards."""
+        database = self.acquire(timeout)
+        try:
+            yield database
+        finally:
+            self.release(database)
+
+    def close(self) -> None:
+        """Close every connection currently in the pool."""
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
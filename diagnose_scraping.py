@@ -4,9 +4,16 @@ Diagnostic script to understand Asia Society pagination limits
 Tests how many pages of events are available and what dates they cover
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from selenium_scraper import SeleniumEventScraper
 from database import SpeakerDatabase
 import os
+import threading
+
+PAGES_TO_TEST = 10
+# Each worker drives its own browser, so this also caps Chrome instances
+PAGE_WORKERS = 5
+
 
 def diagnose_pagination():
     """Check how far back the Asia Society pagination goes"""
@@ -18,42 +25,57 @@ def diagnose_pagination():
     print("PAGINATION DIAGNOSTIC")
     print("="*70)
 
-    scraper = SeleniumEventScraper(headless=True)
+    # A WebDriver isn't thread-safe, so every worker thread lazily gets its own
+    scrapers = []
+    scrapers_lock = threading.Lock()
+    local = threading.local()
+
+    def fetch_page_links(page):
+        """Fetch one listing page; returns (page_url, event_links or None)"""
+        if not hasattr(local, 'scraper'):
+            local.scraper = SeleniumEventScraper(headless=True)
+            with scrapers_lock:
+                scrapers.append(local.scraper)
+        page_url = f"{local.scraper.base_url}?page={page}"
+        html = local.scraper.fetch_page(page_url, wait_time=5)
+        if not html:
+            return page_url, None
+        return page_url, local.scraper.extract_event_links(html)
+
     db = SpeakerDatabase(db_path)
 
     try:
-        # Get already-scraped URLs
+        # Only count here; each page's links are checked against the index below
         cursor = db.conn.cursor()
-        cursor.execute('SELECT url FROM events')
-        already_scraped = set(row[0] for row in cursor.fetchall())
-        print(f"Already scraped: {len(already_scraped)} events\n")
+        cursor.execute('SELECT COUNT(*) FROM events')
+        print(f"Already scraped: {cursor.fetchone()[0]} events\n")
 
-        # Test first 10 pages to see what's available
-        print("Testing pagination (first 10 pages)...")
+        # Test first pages to see what's available; the fetches are mostly
+        # waiting on page loads, so run them concurrently
+        print(f"Testing pagination (first {PAGES_TO_TEST} pages, {PAGE_WORKERS} browsers)...")
         print("-"*70)
 
+        with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+            results = list(executor.map(fetch_page_links, range(PAGES_TO_TEST)))
+
         total_events_found = 0
         total_new_events = 0
         empty_pages = 0
 
-        for page in range(10):
-            page_url = f"{scraper.base_url}?page={page}"
+        for page, (page_url, event_links) in enumerate(results):
             print(f"\nPage {page}: {page_url}")
 
-            html = scraper.fetch_page(page_url, wait_time=5)
-            if not html:
+            if event_links is None:
                 print("  ❌ Failed to fetch page")
                 empty_pages += 1
                 continue
 
-            # Extract events from this page
-            event_links = scraper.extract_event_links(html)
-
             if not event_links:
                 print("  ⚠ No events found on page")
                 empty_pages += 1
                 continue
 
+            already_scraped = db.get_existing_event_urls(event_links)
             new_events = [l for l in event_links if l not in already_scraped]
             total_events_found += len(event_links)
             total_new_events += len(new_events)
@@ -69,14 +91,14 @@ def diagnose_pagination():
         print("\n" + "="*70)
         print("SUMMARY")
         print("="*70)
-        print(f"Pages tested: 10")
+        print(f"Pages tested: {PAGES_TO_TEST}")
         print(f"Empty pages: {empty_pages}")
         print(f"Total events found: {total_events_found}")
         print(f"New events found: {total_new_events}")
         print(f"Already scraped: {total_events_found - total_new_events}")
 
         if total_new_events == 0:
-            print("\n⚠ WARNING: No new events found in first 10 pages!")
+            print(f"\n⚠ WARNING: No new events found in first {PAGES_TO_TEST} pages!")
             print("This suggests you may have reached the limit of available")
             print("historical events on the Asia Society website.")
             print("\nPossible solutions:")
@@ -85,7 +107,8 @@ def diagnose_pagination():
             print("3. Contact Asia Society for historical event data")
 
     finally:
-        scraper.close()
+        for scraper in scrapers:
+            scraper.close()
         db.close()
 
 if __name__ == '__main__':
@@ -4,16 +4,228 @@ Supports multiple providers: Gemini (default, free), OpenAI (fallback), Voyage (
 """
 
 import os
+import base64
+import hashlib
+import itertools
+import threading
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from typing import Iterator, List, Dict, Optional, Tuple
 from dotenv import load_dotenv
 import pickle
 
+try:
+    import faiss
+except ImportError:
+    # Optional: SimilarityIndex falls back to an exact numpy scan
+    faiss = None
+
 # Load environment variables
 load_dotenv()
 
+# Stored embeddings are raw little-endian float32 bytes (dimension = len / 4)
+EMBEDDING_DTYPE = np.dtype('<f4')
+
+
+def _openai_vector(data) -> np.ndarray:
+    """
+    Decode one OpenAI embedding into a float32 array
+
+    Requests ask for encoding_format="base64", so the vector arrives as the
+    raw little-endian float32 bytes and decodes in one copy instead of a
+    JSON float parse per dimension. Plain float lists are accepted too.
+    """
+    if isinstance(data, str):
+        return np.frombuffer(base64.b64decode(data), dtype=EMBEDDING_DTYPE)
+    return np.asarray(data, dtype=np.float32)
+
+
+def _unit_query(query_embedding: np.ndarray) -> np.ndarray:
+    """Return the query as a unit-length float32 vector"""
+    query = np.asarray(query_embedding, dtype=np.float32)
+    query_norm = np.linalg.norm(query)
+    return query / query_norm if query_norm else query
+
+
+def top_k_by_inner_product(
+    query: np.ndarray,
+    ids: np.ndarray,
+    matrix: np.ndarray,
+    top_k: int
+) -> List[Tuple[int, float]]:
+    """
+    Score every row with one matrix-vector product and keep the top-k
+
+    The product runs in BLAS (SIMD, multithreaded). Selection uses
+    argpartition on the scores in place of a negated copy, so only the k
+    winners are sorted and the one temporary is the index array.
+
+    Args:
+        query: Unit query vector
+        ids: Speaker IDs, one per matrix row
+        matrix: (N, D) unit-row matrix (anything supporting `matrix @ query`)
+        top_k: Number of top results to return
+
+    Returns:
+        List of (speaker_id, score) tuples, sorted by score descending
+    """
+    scores = matrix @ query
+
+    if top_k < len(scores):
+        top = np.argpartition(scores, len(scores) - top_k)[-top_k:]
+    else:
+        top = np.arange(len(scores))
+    # Descending by score, ties in row order
+    top = top[np.lexsort((top, -scores[top]))]
+
+    return [(int(ids[i]), float(scores[i])) for i in top]
+
+
+# Set-bit count for every byte value (fallback for numpy < 2.0)
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def binarize_rows(matrix, tile_rows: int = 65536) -> np.ndarray:
+    """
+    Pack the sign of every component into bits (1 = positive)
+
+    A D-dimensional float32 row becomes D/8 bytes, 32x smaller, and the
+    Hamming distance between two packed rows tracks their angle closely
+    enough to shortlist candidates for an exact rescore.
+
+    Args:
+        matrix: (N, D) array, a QuantizedEmbeddingMatrix, or one (D,) vector
+        tile_rows: Rows compared per step, bounding the boolean temporary
+
+    Returns:
+        (N, ceil(D/8)) uint8 array, or (ceil(D/8),) for a single vector
+    """
+    rows = getattr(matrix, 'rows', matrix)
+    if np.ndim(rows) == 1:
+        return np.packbits(np.asarray(rows) > 0)
+    packed = np.empty((len(rows), (rows.shape[1] + 7) // 8), dtype=np.uint8)
+    for start in range(0, len(rows), tile_rows):
+        tile = np.asarray(rows[start:start + tile_rows])
+        packed[start:start + len(tile)] = np.packbits(tile > 0, axis=1)
+    return packed
+
+
+def hamming_distances(query_bits: np.ndarray, matrix_bits: np.ndarray) -> np.ndarray:
+    """Hamming distance from the packed query to every packed row (XOR + popcount)"""
+    diff = np.bitwise_xor(matrix_bits, query_bits)
+    if hasattr(np, 'bitwise_count'):
+        bits = np.bitwise_count(diff)
+    else:
+        bits = _POPCOUNT[diff]
+    return bits.sum(axis=1, dtype=np.uint32)
+
+
+class SimilarityIndex:
+    """
+    Reusable top-k index over unit-length speaker embeddings
+
+    Built once and queried many times. Uses FAISS when it is installed
+    (exact IndexFlatIP, or IndexHNSWFlat once the collection reaches
+    HNSW_THRESHOLD vectors) and an exact numpy scan otherwise. Without FAISS,
+    collections of BINARY_THRESHOLD vectors or more are first shortlisted by
+    Hamming distance over sign bits (see binarize_rows), then only the
+    shortlist is scored exactly.
+    """
+
+    # Collection size from which approximate HNSW search beats a flat scan
+    HNSW_THRESHOLD = 100_000
+    HNSW_NEIGHBORS = 32
+    HNSW_EF_SEARCH = 64
+    # Numpy path: size from which the 1-bit prefilter pays off, and how many
+    # rows it keeps for exact rescoring (at least BINARY_SHORTLIST_PER_RESULT
+    # per requested result)
+    BINARY_THRESHOLD = 100_000
+    BINARY_SHORTLIST = 4096
+    BINARY_SHORTLIST_PER_RESULT = 10
+
+    def __init__(self, ids: np.ndarray, matrix):
+        """
+        Args:
+            ids: Speaker IDs, one per matrix row
+            matrix: (N, D) unit-row matrix (see EmbeddingEngine.build_candidate_matrix)
+        """
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.matrix = matrix
+        self.index = None
+        self.binary = None
+
+        # FAISS needs float32 input; quantized matrices keep the numpy scan
+        if faiss is not None and isinstance(matrix, np.ndarray) and len(self.ids):
+            vectors = np.ascontiguousarray(matrix, dtype=np.float32)
+            dimension = vectors.shape[1]
+            if len(vectors) >= self.HNSW_THRESHOLD:
+                self.index = faiss.IndexHNSWFlat(dimension, self.HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT)
+                self.index.hnsw.efSearch = self.HNSW_EF_SEARCH
+            else:
+                self.index = faiss.IndexFlatIP(dimension)
+            self.index.add(vectors)
+        elif len(self.ids) >= self.BINARY_THRESHOLD:
+            self.binary = binarize_rows(matrix)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, query_embedding: np.ndarray, top_k: int = 50) -> List[Tuple[int, float]]:
+        """
+        Find the top-k rows most similar to the query
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of top results to return
+
+        Returns:
+            List of (speaker_id, similarity_score) tuples, sorted by score descending
+        """
+        if len(self.ids) == 0 or top_k <= 0:
+            return []
+
+        query = _unit_query(query_embedding)
+        if self.binary is not None:
+            return self._search_binary(query, top_k)
+        if self.index is None:
+            return top_k_by_inner_product(query, self.ids, self.matrix, top_k)
+
+        scores, rows = self.index.search(query.reshape(1, -1), min(top_k, len(self.ids)))
+        # FAISS pads with -1 when HNSW finds fewer than k neighbours
+        return [(int(self.ids[row]), float(score)) for score, row in zip(scores[0], rows[0]) if row >= 0]
+
+    def _search_binary(self, query: np.ndarray, top_k: int) -> List[Tuple[int, float]]:
+        """Shortlist rows by Hamming distance, then score only those exactly"""
+        shortlist_size = max(self.BINARY_SHORTLIST, top_k * self.BINARY_SHORTLIST_PER_RESULT)
+        if shortlist_size >= len(self.ids):
+            return top_k_by_inner_product(query, self.ids, self.matrix, top_k)
+
+        distances = hamming_distances(binarize_rows(query), self.binary)
+        # Sorted, so the rescoring gather walks the matrix front to back
+        shortlist = np.sort(np.argpartition(distances, shortlist_size)[:shortlist_size])
+        return top_k_by_inner_product(query, self.ids[shortlist], self.matrix[shortlist], top_k)
+
 
 class EmbeddingEngine:
+    # Gemini has no batch endpoint: max single-text requests in flight at once
+    GEMINI_MAX_CONCURRENCY = 8
+    # OpenAI/Voyage batch requests: texts are packed into requests of at most
+    # this many (approximate, len // 4) tokens and items, several sent at once
+    BATCH_MAX_TOKENS = 100_000
+    BATCH_MAX_ITEMS = {'openai': 2048, 'voyage': 1000}
+    BATCH_MAX_CONCURRENCY = 4
+    # Query embeddings kept in memory (least recently used are dropped first)
+    QUERY_CACHE_SIZE = 4096
+    # Labels for the name/title/affiliation/bio lines of build_embedding_text
+    TEXT_FIELD_LABELS = ('Name', 'Title', 'Affiliation', 'Bio')
+    # How much of a speaker build_embedding_text reads: the start of the bio
+    # (the rest is rarely signal but is billed as tokens), the most recent
+    # events and a preview of each event description
+    BIO_MAX_CHARS = 2000
+    TEXT_MAX_EVENTS = 10
+    EVENT_PREVIEW_CHARS = 500
+
     def __init__(self, provider='gemini', api_key=None):
         """
         Initialize embedding engine with specified provider
@@ -23,7 +235,12 @@ class EmbeddingEngine:
             api_key: API key for the provider (or loaded from env vars)
         """
         self.provider = provider.lower()
-        self._last_usage = None
+        # Per thread, so batches embedded concurrently report their own usage
+        self._usage = threading.local()
+        self._query_cache = OrderedDict()
+        # Optional persistent second tier: an object with
+        # get_cached_query_embedding/save_cached_query_embedding (SpeakerDatabase)
+        self.query_cache_store = None
 
         # Initialize the appropriate client
         if self.provider == 'gemini':
@@ -92,35 +309,24 @@ class EmbeddingEngine:
 
         Args:
             speaker: Dictionary with speaker data including optional:
-                    - 'tags': list of expertise tags
+                    - 'tags': list of expertise tags (strings, or
+                      get_speaker_tags rows)
                     - 'events': list of (event_title, role) tuples
 
         Returns:
             Text string for embedding
         """
-        parts = []
-
-        # Name (always present)
-        if speaker.get('name'):
-            parts.append(f"Name: {speaker['name']}")
-
-        # Title
-        if speaker.get('title'):
-            parts.append(f"Title: {speaker['title']}")
-
-        # Affiliation
+        # Name, title, affiliation, bio: one "Label: value" line each, if set
         affiliation = speaker.get('affiliation') or speaker.get('primary_affiliation')
-        if affiliation:
-            parts.append(f"Affiliation: {affiliation}")
-
-        # Bio
-        if speaker.get('bio'):
-            parts.append(f"Bio: {speaker['bio']}")
+        bio = (speaker.get('bio') or '')[:self.BIO_MAX_CHARS]
+        values = (speaker.get('name'), speaker.get('title'), affiliation, bio)
+        parts = [f"{label}: {value}" for label, value in zip(self.TEXT_FIELD_LABELS, values) if value]
 
-        # Tags (if provided)
-        if speaker.get('tags'):
-            tag_texts = [tag[0] if isinstance(tag, tuple) else tag for tag in speaker['tags']]
-            parts.append(f"Expertise: {', '.join(tag_texts)}")
+        # Tags (if provided; plain strings, or get_speaker_tags rows)
+        tags = speaker.get('tags')
+        if tags:
+            tags = [tag if isinstance(tag, str) else tag[0] for tag in tags]
+            parts.append(f"Expertise: {', '.join(tags)}")
 
         # Event participation (NEW - enables topic-based search)
         # Includes event titles + first 500 chars of description for context
@@ -131,14 +337,14 @@ class EmbeddingEngine:
             event_contexts = []
             keynote_count = 0
 
-            for event_title, role, event_description in events[:10]:  # Most recent 10 events
+            for event_title, role, event_description in events[:self.TEXT_MAX_EVENTS]:
                 if event_title:
                     # Build event context: title + cleaned description preview
                     context_parts = [event_title]
 
                     if event_description:
                         # Take first 500 chars and clean boilerplate
-                        desc_preview = event_description[:500]
+                        desc_preview = event_description[:self.EVENT_PREVIEW_CHARS]
                         desc_preview = desc_preview.replace('VIEW EVENT DETAILS', '').strip()
 
                         # Try to end at a sentence boundary if possible
@@ -194,9 +400,10 @@ class EmbeddingEngine:
             result = self.client.embeddings.create(
                 input=[text],
                 model=self.model,
+                encoding_format="base64",
                 timeout=timeout
             )
-            embedding = result.data[0].embedding
+            embedding = _openai_vector(result.data[0].embedding)
             self._last_usage = {'total_tokens': result.usage.total_tokens}
 
         elif self.provider == 'voyage':
@@ -204,63 +411,202 @@ class EmbeddingEngine:
             embedding = result.embeddings[0]
             self._last_usage = {'total_tokens': result.total_tokens}
 
-        return np.array(embedding)
+        return np.asarray(embedding, dtype=np.float32)
 
-    def generate_embeddings_batch(self, texts: List[str], timeout: int = 60) -> List[np.ndarray]:
+    def generate_embeddings_batch(self, texts: List[str], timeout: int = 60,
+                                  return_matrix: bool = False):
         """
         Generate embeddings for multiple texts in a batch
 
         Args:
             texts: List of texts to embed
             timeout: Timeout in seconds per request (default: 60)
+            return_matrix: Return one (len(texts), dimension) float32 array
+                           instead of a list of vectors (one allocation,
+                           ready for matrix math)
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors, or a float32 matrix with return_matrix
+
+        Raises:
+            TimeoutError: If API call exceeds timeout
+            Exception: For other API errors
+        """
+        if return_matrix:
+            matrix = None
+            for i, embedding in self.iter_embeddings(texts, timeout=timeout):
+                if matrix is None:
+                    matrix = np.empty((len(texts), len(embedding)), dtype=np.float32)
+                matrix[i] = embedding
+            return matrix if matrix is not None else np.empty((0, 0), dtype=np.float32)
+
+        embeddings = [None] * len(texts)
+        for i, embedding in self.iter_embeddings(texts, timeout=timeout):
+            embeddings[i] = embedding
+        return embeddings
+
+    def iter_embeddings(self, texts: List[str], timeout: int = 60) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Generate embeddings for multiple texts, yielding each as it's ready
+
+        Identical texts (speakers sharing a title, affiliation and bio, say)
+        are embedded once; the vector is yielded for each of their indices.
+        See _iter_unique_embeddings for how requests are sent.
+
+        Args:
+            texts: List of texts to embed
+            timeout: Timeout in seconds per request (default: 60)
+
+        Yields:
+            (index into texts, embedding vector) pairs
+
+        Raises:
+            TimeoutError: If API call exceeds timeout
+            Exception: For other API errors
+        """
+        positions = {}
+        for i, text in enumerate(texts):
+            positions.setdefault(text, []).append(i)
+        unique = list(positions)
+
+        for j, embedding in self._iter_unique_embeddings(unique, timeout):
+            for i in positions[unique[j]]:
+                yield i, embedding
+
+    def _iter_unique_embeddings(self, texts: List[str], timeout: int) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Embed texts, yielding (index, vector) pairs as requests complete
+
+        Lets callers save embeddings while later requests are still in
+        flight. Results arrive in completion order. With Gemini (one request
+        per text) at most 2 * GEMINI_MAX_CONCURRENCY requests are
+        outstanding; OpenAI and Voyage get the texts packed into
+        token-budgeted requests (see pack_batches), up to
+        BATCH_MAX_CONCURRENCY at a time.
+
+        Args:
+            texts: List of texts to embed
+            timeout: Timeout in seconds per request (default: 60)
+
+        Yields:
+            (index into texts, embedding vector) pairs
 
         Raises:
             TimeoutError: If API call exceeds timeout
             Exception: For other API errors
         """
         if not texts:
-            return []
+            return
 
         if self.provider == 'gemini':
-            # Gemini doesn't support batch embedding in the same way
-            # Process one by one (still fast and free!)
-            embeddings = []
-            total_tokens = 0
-            for text in texts:
+            # Gemini doesn't support batch embedding in the same way, so send
+            # one request per text, several in flight at once (the time goes
+            # on network round trips). Longest texts go first so a slow one
+            # doesn't hold up the end of the batch.
+            def embed_one(text):
                 result = self.client.embed_content(
                     model=self.model,
                     content=text,
                     task_type="retrieval_document",
                     request_options={'timeout': timeout}
                 )
-                embeddings.append(result['embedding'])
-                total_tokens += len(text.split())
-
-            self._last_usage = {'total_tokens': total_tokens}
-
-        elif self.provider == 'openai':
-            result = self.client.embeddings.create(
-                input=texts,
-                model=self.model,
-                timeout=timeout
-            )
-            embeddings = [item.embedding for item in result.data]
-            self._last_usage = {'total_tokens': result.usage.total_tokens}
+                return result['embedding']
+
+            order = iter(sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True))
+            workers = min(self.GEMINI_MAX_CONCURRENCY, len(texts))
+            executor = ThreadPoolExecutor(max_workers=workers)
+            pending = {}
+            try:
+                for i in itertools.islice(order, workers * 2):
+                    pending[executor.submit(embed_one, texts[i])] = i
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        i = pending.pop(future)
+                        embedding = np.asarray(future.result(), dtype=np.float32)
+                        j = next(order, None)
+                        if j is not None:
+                            pending[executor.submit(embed_one, texts[j])] = j
+                        yield i, embedding
+            finally:
+                # Consumer stopped early or a request failed: drop what's queued
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=True)
+
+            self._last_usage = {'total_tokens': sum(len(text.split()) for text in texts)}
+            return
+
+        def embed_batch(batch_texts):
+            """Embed one packed request; returns (embeddings, total_tokens)"""
+            if self.provider == 'openai':
+                result = self.client.embeddings.create(
+                    input=batch_texts,
+                    model=self.model,
+                    encoding_format="base64",
+                    timeout=timeout
+                )
+                return [_openai_vector(item.embedding) for item in result.data], result.usage.total_tokens
+
+            result = self.client.embed(batch_texts, model=self.model, input_type='document', timeout_seconds=timeout)
+            return result.embeddings, result.total_tokens
+
+        batches = self.pack_batches(texts, self.BATCH_MAX_ITEMS.get(self.provider, len(texts)))
+        total_tokens = 0
+        workers = min(self.BATCH_MAX_CONCURRENCY, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(embed_batch, [texts[i] for i in batch]): batch
+                for batch in batches
+            }
+            try:
+                for future in as_completed(futures):
+                    embeddings, tokens = future.result()
+                    total_tokens += tokens
+                    for i, embedding in zip(futures[future], embeddings):
+                        yield i, np.asarray(embedding, dtype=np.float32)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        self._last_usage = {'total_tokens': total_tokens}
+
+    def pack_batches(self, texts: List[str], max_items: int) -> List[List[int]]:
+        """
+        Group text indices into requests under BATCH_MAX_TOKENS and max_items
 
-        elif self.provider == 'voyage':
-            result = self.client.embed(texts, model=self.model, input_type='document', timeout_seconds=timeout)
-            embeddings = result.embeddings
-            self._last_usage = {'total_tokens': result.total_tokens}
+        Longest texts are packed first, so long and short texts end up in
+        separate requests and a slow request holds up fewer short texts. A
+        single text over the budget still gets its own request.
 
-        return [np.array(emb) for emb in embeddings]
+        Returns:
+            List of batches, each a list of indices into texts
+        """
+        batches = []
+        batch, batch_tokens = [], 0
+        for i in sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True):
+            tokens = len(texts[i]) // 4 + 1
+            if batch and (batch_tokens + tokens > self.BATCH_MAX_TOKENS or len(batch) >= max_items):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(i)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def query_cache_key(self, query: str) -> str:
+        """Cache key for a query embedding (provider, model and task type included)"""
+        digest = hashlib.sha1(query.encode('utf-8')).hexdigest()
+        return f"{self.provider}:{self.model}:retrieval_query:{digest}"
 
     def generate_query_embedding(self, query: str, timeout: int = 60) -> np.ndarray:
         """
         Generate embedding for a search query
 
+        Identical queries are served from an in-memory LRU cache, then from
+        query_cache_store if one is set, before calling the API.
+
         Args:
             query: Search query text
             timeout: Timeout in seconds (default: 60)
@@ -272,6 +618,33 @@ class EmbeddingEngine:
             TimeoutError: If API call exceeds timeout
             Exception: For other API errors
         """
+        key = self.query_cache_key(query)
+        if key in self._query_cache:
+            self._query_cache.move_to_end(key)
+            return self._query_cache[key]
+
+        if self.query_cache_store is not None:
+            blob = self.query_cache_store.get_cached_query_embedding(key)
+            if blob is not None:
+                embedding = self.deserialize_embedding(blob)
+                self._remember_query_embedding(key, embedding)
+                return embedding
+
+        embedding = self._embed_query(query, timeout)
+        self._remember_query_embedding(key, embedding)
+        if self.query_cache_store is not None:
+            self.query_cache_store.save_cached_query_embedding(key, self.serialize_embedding(embedding))
+        return embedding
+
+    def _remember_query_embedding(self, key: str, embedding: np.ndarray) -> None:
+        """Add a query embedding to the in-memory LRU cache"""
+        self._query_cache[key] = embedding
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+
+    def _embed_query(self, query: str, timeout: int) -> np.ndarray:
+        """Call the provider API to embed a search query"""
         if self.provider == 'gemini':
             result = self.client.embed_content(
                 model=self.model,
@@ -286,9 +659,10 @@ class EmbeddingEngine:
             result = self.client.embeddings.create(
                 input=[query],
                 model=self.model,
+                encoding_format="base64",
                 timeout=timeout
             )
-            embedding = result.data[0].embedding
+            embedding = _openai_vector(result.data[0].embedding)
             self._last_usage = {'total_tokens': result.usage.total_tokens}
 
         elif self.provider == 'voyage':
@@ -296,7 +670,7 @@ class EmbeddingEngine:
             embedding = result.embeddings[0]
             self._last_usage = {'total_tokens': result.total_tokens}
 
-        return np.array(embedding)
+        return np.asarray(embedding, dtype=np.float32)
 
     def cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """
@@ -307,16 +681,124 @@ class EmbeddingEngine:
             vec2: Second vector
 
         Returns:
-            Similarity score (0.0 to 1.0)
+            Similarity score (-1.0 to 1.0; 0.0 if either vector is all zeros)
+        """
+        # One dot product over the two norms, without normalized copies
+        norms = np.linalg.norm(vec1) * np.linalg.norm(vec2)
+        if not norms:
+            return 0.0
+        return float(np.dot(vec1, vec2) / norms)
+
+    def cosine_similarity_matrix(self, queries: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of every query against every row, in one matmul
+
+        Args:
+            queries: (Q, D) array of query vectors
+            matrix: (N, D) array of embeddings
+
+        Returns:
+            (Q, N) float32 array of similarities (0.0 where either vector is all zeros)
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        matrix = np.asarray(matrix, dtype=np.float32)
+        scores = queries @ matrix.T
+        norms = np.linalg.norm(queries, axis=1, keepdims=True) * np.linalg.norm(matrix, axis=1)
+        return np.divide(scores, norms, out=np.zeros_like(scores), where=norms != 0)
+
+    def normalize_rows(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize each row of an embedding matrix
+
+        Args:
+            matrix: (N, D) array of embeddings
+
+        Returns:
+            Contiguous float32 (N, D) array of unit rows (all-zero rows stay zero)
+        """
+        matrix = np.array(matrix, dtype=np.float32, order='C')
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        return matrix
+
+    def build_candidate_matrix(
+        self,
+        candidate_embeddings: List[Tuple[int, np.ndarray]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stack (speaker_id, embedding) pairs into one normalized matrix
+
+        Args:
+            candidate_embeddings: List of (speaker_id, embedding) tuples
+
+        Returns:
+            (ids, matrix): int64 speaker IDs and the (N, D) float32 unit-row matrix
+        """
+        if not candidate_embeddings:
+            return np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32)
+
+        ids = np.fromiter((speaker_id for speaker_id, _ in candidate_embeddings), dtype=np.int64)
+        matrix = np.stack([embedding for _, embedding in candidate_embeddings])
+        return ids, self.normalize_rows(matrix)
+
+    def decode_candidate_matrix(
+        self,
+        embedding_rows: List[Tuple[int, bytes]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        # Normalize vectors
-        vec1_norm = vec1 / np.linalg.norm(vec1)
-        vec2_norm = vec2 / np.linalg.norm(vec2)
+        Decode stored (speaker_id, embedding BLOB) rows into one normalized matrix
 
-        # Compute dot product
-        similarity = np.dot(vec1_norm, vec2_norm)
+        Raw float32 BLOBs of equal length are joined and viewed as an (N, D)
+        array in a single np.frombuffer call, with no per-row array objects.
+        Legacy pickled rows fall back to decoding one by one.
 
-        return float(similarity)
+        Args:
+            embedding_rows: (speaker_id, blob) rows, e.g. from get_all_embeddings()
+
+        Returns:
+            (ids, matrix): int64 speaker IDs and the (N, D) float32 unit-row matrix
+        """
+        if not embedding_rows:
+            return np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32)
+
+        blobs = [blob for _, blob in embedding_rows]
+        row_bytes = len(blobs[0])
+        if any(len(blob) != row_bytes or self.is_legacy_embedding(blob) for blob in blobs):
+            return self.build_candidate_matrix([
+                (speaker_id, self.deserialize_embedding(blob)) for speaker_id, blob in embedding_rows
+            ])
+
+        ids = np.fromiter((speaker_id for speaker_id, _ in embedding_rows), dtype=np.int64, count=len(blobs))
+        matrix = np.frombuffer(b''.join(blobs), dtype=EMBEDDING_DTYPE).reshape(len(blobs), -1)
+        return ids, self.normalize_rows(matrix)
+
+    def search_candidate_matrix(
+        self,
+        query_embedding: np.ndarray,
+        ids: np.ndarray,
+        matrix: np.ndarray,
+        top_k: int = 50
+    ) -> List[Tuple[int, float]]:
+        """
+        Find top-k rows of a normalized candidate matrix most similar to query
+
+        Scores every candidate with one matrix-vector product, then selects
+        the top-k with argpartition instead of sorting all N scores.
+
+        Args:
+            query_embedding: Query embedding vector
+            ids: Speaker IDs, one per matrix row
+            matrix: (N, D) unit-row matrix (see build_candidate_matrix)
+            top_k: Number of top results to return
+
+        Returns:
+            List of (speaker_id, similarity_score) tuples, sorted by score descending
+        """
+        if len(ids) == 0 or top_k <= 0:
+            return []
+
+        return top_k_by_inner_product(_unit_query(query_embedding), ids, matrix, top_k)
 
     def search_by_similarity(
         self,
@@ -335,44 +817,61 @@ class EmbeddingEngine:
         Returns:
             List of (speaker_id, similarity_score) tuples, sorted by score descending
         """
-        similarities = []
-
-        for speaker_id, embedding in candidate_embeddings:
-            score = self.cosine_similarity(query_embedding, embedding)
-            similarities.append((speaker_id, score))
-
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
-
-        # Return top-k
-        return similarities[:top_k]
+        ids, matrix = self.build_candidate_matrix(candidate_embeddings)
+        return self.search_candidate_matrix(query_embedding, ids, matrix, top_k)
 
     def serialize_embedding(self, embedding: np.ndarray) -> bytes:
         """
         Serialize embedding for database storage
 
+        Embeddings are stored as unit-length float32 vectors: only their
+        direction matters for cosine similarity, and normalizing once here
+        keeps norms out of the search hot path.
+
         Args:
             embedding: Numpy array
 
         Returns:
             Serialized bytes
         """
-        return pickle.dumps(embedding)
+        embedding = np.asarray(embedding, dtype=np.float32)
+        embedding = embedding / (np.linalg.norm(embedding) + 1e-12)
+        return np.ascontiguousarray(embedding, dtype=EMBEDDING_DTYPE).tobytes()
 
     def deserialize_embedding(self, data: bytes) -> np.ndarray:
         """
         Deserialize embedding from database
 
         Args:
-            data: Serialized bytes
+            data: Serialized bytes (raw float32, or a legacy pickled array)
 
         Returns:
-            Numpy array
+            Numpy array (read-only view over the bytes for raw float32 data)
+        """
+        if self.is_legacy_embedding(data):
+            return np.asarray(pickle.loads(data), dtype=np.float32)
+        return np.frombuffer(data, dtype=EMBEDDING_DTYPE)
+
+    @staticmethod
+    def is_legacy_embedding(data: bytes) -> bool:
         """
-        return pickle.loads(data)
+        Check whether a stored embedding is in the old pickle format
+
+        Pickled numpy arrays start with the pickle protocol marker and name
+        the numpy module right after it; raw float32 data never does.
+        """
+        return data[:1] == b'\x80' and b'numpy' in data[:64]
+
+    @property
+    def _last_usage(self) -> Optional[Dict]:
+        return getattr(self._usage, 'last', None)
+
+    @_last_usage.setter
+    def _last_usage(self, usage: Optional[Dict]) -> None:
+        self._usage.last = usage
 
     def get_last_usage(self) -> Optional[Dict]:
-        """Get token usage from last API call"""
+        """Get token usage from this thread's last API call"""
         return self._last_usage
 
 
@@ -454,7 +953,9 @@ def test_embedding_engine():
 
             deserialized = engine.deserialize_embedding(serialized)
             print(f"Deserialized shape: {deserialized.shape}")
-            print(f"Arrays equal: {np.array_equal(embedding, deserialized)}")
+            # Stored vectors are unit length, so compare with the normalized input
+            normalized = embedding / np.linalg.norm(embedding)
+            print(f"Round trip matches: {np.allclose(normalized, deserialized, atol=1e-6)}")
             print("-" * 60)
 
             print(f"\n✓ {provider.upper()} tests passed!")
@@ -5,25 +5,34 @@ Saves ~50% cost and time vs separate tagging + enrichment
 """
 
 import argparse
+import functools
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 from database import SpeakerDatabase
 from speaker_enricher import UnifiedSpeakerEnricher
 
 
+@functools.lru_cache(maxsize=1)
 def get_db_path():
-    """Get database path - /data/speakers.db on Railway, ./speakers.db locally"""
+    """Get database path - /data/speakers.db on Railway, ./speakers.db locally (cached)"""
     if os.path.exists('/data'):
         return '/data/speakers.db'
     return './speakers.db'
 
 
+# Concurrent web search + Claude calls; each speaker spends almost all its
+# time waiting on the network, so a handful of workers gives a near-linear speedup
+DEFAULT_WORKERS = 4
+
+
 def enrich_speakers(
     batch_size=10,
     limit=None,
     skip_existing=True,
-    verbose=True
+    verbose=True,
+    workers=DEFAULT_WORKERS
 ):
     """
     Unified enrichment: tags + demographics + locations + languages in one pass
@@ -33,35 +42,36 @@ def enrich_speakers(
         limit: Maximum number of speakers to process (None = all)
         skip_existing: Skip speakers that already have enrichment data
         verbose: Print progress messages
+        workers: Number of speakers fetched concurrently (1 = sequential)
     """
-    # Get list of speakers to process (then close connection)
+    # One connection for the whole run (WAL mode lets readers work alongside it)
     db = SpeakerDatabase(get_db_path())
-    all_speakers = db.get_all_speakers()
+    try:
+        _enrich_speakers(db, batch_size, limit, skip_existing, verbose, workers)
+    finally:
+        db.close()
+
+
+def _enrich_speakers(db, batch_size, limit, skip_existing, verbose, workers=DEFAULT_WORKERS):
+    """
+    Body of enrich_speakers, run on a single open database connection
 
-    if not all_speakers:
+    Only the network half of each speaker (enricher.fetch_enrichment) runs on
+    the worker threads; loading and saving stay on this thread, which owns db.
+    """
+    if not db.count_speakers():
         if verbose:
             print("No speakers found in database!")
-        db.close()
         return
 
-    # Filter out speakers with existing enrichment if requested
+    # Skip speakers with existing enrichment (demographics OR tags) if requested;
+    # the filter and the limit both run in SQL
     if skip_existing:
-        speakers_to_process = []
-        for speaker_data in all_speakers:
-            speaker_id = speaker_data[0]
-            # Check for either demographics OR tags
-            demographics = db.get_speaker_demographics(speaker_id)
-            tags = db.get_speaker_tags(speaker_id)
-            if not demographics and not tags:
-                speakers_to_process.append(speaker_data)
-        speakers_data = speakers_to_process
+        speakers_data = db.get_unenriched_speakers(limit or None)
     else:
-        speakers_data = all_speakers
-
-    db.close()  # Close initial connection
-
-    if limit:
-        speakers_data = speakers_data[:limit]
+        speakers_data = db.get_all_speakers()
+        if limit:
+            speakers_data = speakers_data[:limit]
 
     if not speakers_data:
         if verbose:
@@ -75,6 +85,7 @@ def enrich_speakers(
         print("="*70)
         print(f"\nProcessing: {total} speakers")
         print(f"Batch size: {batch_size}")
+        print(f"Workers: {workers}")
         print(f"\nExtracting in ONE pass:")
         print("  • Expertise tags (3 per speaker)")
         print("  • Demographics (gender, nationality)")
@@ -90,64 +101,91 @@ def enrich_speakers(
 
     enricher = UnifiedSpeakerEnricher()
 
-    # Process speakers
-    for i, speaker_data in enumerate(speakers_data, 1):
-        speaker_id, name, title, affiliation, bio, first_seen, last_updated = speaker_data
+    def record(i, name, result):
+        """Tally and print one finished speaker"""
+        nonlocal succeeded, failed, processed
 
         if verbose and i % batch_size == 1:
             print(f"\nBatch {(i-1)//batch_size + 1} (speakers {i}-{min(i+batch_size-1, total)}/{total})...")
 
-        try:
-            # Build speaker dict
-            speaker = {
-                'speaker_id': speaker_id,
-                'name': name,
-                'title': title,
-                'affiliation': affiliation,
-                'bio': bio
-            }
-
+        if result['success']:
+            succeeded += 1
+            if verbose:
+                tags_str = ', '.join([t['text'] for t in result['tags']])
+                print(f"  {i}/{total}: {name}... ✓ ({tags_str})")
+        else:
+            failed += 1
             if verbose:
-                print(f"  {i}/{total}: {name}...", end=" ")
+                error_msg = result.get('error', 'Unknown error')
+                print(f"  {i}/{total}: {name}... ✗ ({error_msg[:50]})")
 
-            # Perform unified enrichment
-            # Open fresh database connection for this speaker
-            db = SpeakerDatabase(get_db_path())
+        processed += 1
 
-            try:
-                result = enricher.enrich_speaker(speaker_id, db)
-
-                if result['success']:
-                    succeeded += 1
-                    if verbose:
-                        tags_str = ', '.join([t['text'] for t in result['tags']])
-                        print(f"✓ ({tags_str})")
-                else:
-                    failed += 1
-                    if verbose:
-                        error_msg = result.get('error', 'Unknown error')
-                        print(f"✗ ({error_msg[:50]})")
-
-            finally:
-                db.close()  # Always close connection after each speaker
-
-            # Track usage
-            usage = enricher.get_last_usage()
+    def finish(i, speaker_id, speaker, future):
+        """Save a completed fetch on this (the database) thread"""
+        nonlocal total_tokens
+        try:
+            fetched = future.result()
+
+            # Track usage (per extraction, so concurrent calls don't overwrite it)
+            usage = fetched['extraction'].get('usage')
             if usage:
                 total_tokens += usage['input_tokens'] + usage['output_tokens']
 
+            # Atomic per speaker: a failed save rolls back only its own savepoint
+            result = enricher.save_enrichment(speaker_id, speaker, fetched, db)
         except Exception as e:
-            failed += 1
-            if verbose:
-                print(f"✗ (Exception: {str(e)[:50]})")
+            result = {'success': False, 'error': f"Exception: {e}"}
 
-        processed += 1
+        record(i, speaker['name'], result)
 
-        # Rate limiting already handled in enricher
-        # time.sleep(1.5)
+    def save_group(done):
+        """
+        Save every fetch that finished together in one transaction
+
+        One commit per group instead of one per speaker, and the write lock
+        is only held while saving, never while waiting on the network.
+        """
+        with db.atomic():
+            for future in done:
+                finish(*in_flight.pop(future), future)
+
+    # Keep a bounded window of fetches in flight so memory stays flat and
+    # results are saved while later speakers are still being fetched
+    max_in_flight = max(1, workers) * 2
+    in_flight = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for i, speaker_data in enumerate(speakers_data, 1):
+            speaker_id, name = speaker_data[0], speaker_data[1]
+
+            try:
+                loaded = enricher.load_speaker(speaker_id, db)
+            except Exception as e:
+                record(i, name, {'success': False, 'error': f"Exception: {e}"})
+                continue
+            if loaded is None:
+                record(i, name, {'success': False, 'error': 'Speaker not found'})
+                continue
+
+            speaker, events = loaded
+            future = executor.submit(enricher.fetch_enrichment, speaker, events)
+            in_flight[future] = (i, speaker_id, speaker)
+
+            while len(in_flight) >= max_in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                save_group(done)
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            save_group(done)
 
     elapsed = time.time() - start_time
 
+    # Fresh planner statistics now that the child tables have grown
+    if succeeded:
+        db.analyze()
+
     # Print summary
     if verbose:
         print("\n" + "="*70)
@@ -167,27 +205,15 @@ def enrich_speakers(
         if processed > 0:
             print(f"Avg time per speaker: {elapsed/processed:.1f}s")
 
-        # Check database stats (open fresh connection)
-        db = SpeakerDatabase(get_db_path())
-        stats = db.get_statistics()
-
-        # Count enriched speakers
-        cursor = db.conn.cursor()
-        cursor.execute('SELECT COUNT(*) FROM speaker_demographics')
-        demographics_count = cursor.fetchone()[0]
-        cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_locations')
-        locations_count = cursor.fetchone()[0]
-        cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_languages')
-        languages_count = cursor.fetchone()[0]
-
-        db.close()
+        # Check database stats (one query for all the counts)
+        counts = db.get_enrichment_counts()
 
         print(f"\n📊 Updated Database Status:")
-        print(f"  Total speakers: {stats['total_speakers']}")
-        print(f"  Tagged speakers: {stats['tagged_speakers']}")
-        print(f"  With demographics: {demographics_count}")
-        print(f"  With locations: {locations_count}")
-        print(f"  With languages: {languages_count}")
+        print(f"  Total speakers: {counts['total_speakers']}")
+        print(f"  Tagged speakers: {counts['tagged_speakers']}")
+        print(f"  With demographics: {counts['with_demographics']}")
+        print(f"  With locations: {counts['with_locations']}")
+        print(f"  With languages: {counts['with_languages']}")
 
         print("\n✓ Enrichment complete!")
 
@@ -196,49 +222,32 @@ def show_stats(verbose=True):
     """Show statistics about enrichment coverage"""
     db = SpeakerDatabase(get_db_path())
 
-    stats = db.get_statistics()
-    total_speakers = stats['total_speakers']
+    # Every coverage count in one query
+    counts = db.get_enrichment_counts()
+    total_speakers = counts['total_speakers']
+    tagged_speakers = counts['tagged_speakers']
+    demographics_count = counts['with_demographics']
+    locations_count = counts['with_locations']
+    languages_count = counts['with_languages']
 
-    # Count enriched speakers
     cursor = db.conn.cursor()
 
-    cursor.execute('SELECT COUNT(*) FROM speaker_demographics')
-    demographics_count = cursor.fetchone()[0]
-
-    cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_locations')
-    locations_count = cursor.fetchone()[0]
-
-    cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_languages')
-    languages_count = cursor.fetchone()[0]
-
     if verbose:
         print("\n" + "="*70)
         print("📊 ENRICHMENT STATISTICS")
         print("="*70)
         print(f"Total speakers: {total_speakers}")
-        print(f"Tagged speakers: {stats['tagged_speakers']} ({stats['tagged_speakers']/total_speakers*100:.1f}%)")
+        print(f"Tagged speakers: {tagged_speakers} ({tagged_speakers/total_speakers*100:.1f}%)")
         print(f"With demographics: {demographics_count} ({demographics_count/total_speakers*100:.1f}%)")
         print(f"With locations: {locations_count} ({locations_count/total_speakers*100:.1f}%)")
         print(f"With languages: {languages_count} ({languages_count/total_speakers*100:.1f}%)")
 
         # Count fully enriched (has ALL data)
-        cursor.execute('''
-            SELECT COUNT(DISTINCT s.speaker_id)
-            FROM speakers s
-            JOIN speaker_tags st ON s.speaker_id = st.speaker_id
-            JOIN speaker_demographics sd ON s.speaker_id = sd.speaker_id
-        ''')
-        fully_enriched = cursor.fetchone()[0]
+        fully_enriched = counts['fully_enriched']
         print(f"Fully enriched (tags + demographics): {fully_enriched} ({fully_enriched/total_speakers*100:.1f}%)")
 
         # Calculate remaining
-        cursor.execute('''
-            SELECT COUNT(*)
-            FROM speakers s
-            WHERE s.speaker_id NOT IN (SELECT speaker_id FROM speaker_demographics)
-            AND s.speaker_id NOT IN (SELECT DISTINCT speaker_id FROM speaker_tags)
-        ''')
-        remaining = cursor.fetchone()[0]
+        remaining = counts['remaining']
         print(f"\nRemaining to enrich: {remaining}")
         if remaining > 0:
             est_cost = (remaining * 0.01)
@@ -299,6 +308,8 @@ Examples:
                        help='Show enrichment statistics')
     parser.add_argument('--quiet', action='store_true',
                        help='Suppress progress messages')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                       help=f'Speakers enriched concurrently (default: {DEFAULT_WORKERS})')
 
     args = parser.parse_args()
 
@@ -313,5 +324,6 @@ Examples:
             batch_size=args.batch_size,
             limit=args.limit,
             skip_existing=skip_existing,
-            verbose=verbose
+            verbose=verbose,
+            workers=args.workers
         )
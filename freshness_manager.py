@@ -3,10 +3,41 @@ Freshness manager for tracking speaker data staleness and managing refreshes
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
 from database import SpeakerDatabase
 from speaker_enricher import UnifiedSpeakerEnricher
-import time
+
+
+# Concurrent web search + Claude calls when refreshing (see enrich_speakers)
+DEFAULT_WORKERS = 4
+
+# Scoring rules, shared by calculate_staleness/calculate_priority and the
+# SQL in update_freshness_tracking so the two cannot drift apart.
+# Tiers are (more than this many events, value), checked in order.
+AGING_TIERS = ((10, 1.5), (5, 1.2))   # Staleness multiplier: busy speakers age faster
+EVENT_BOOSTS = ((10, 0.5), (5, 0.3))  # Priority boost for speakers with many events
+TAG_BOOST_MIN, TAG_BOOST = 3, 0.2     # Priority boost for speakers with this many tags
+MAX_STALENESS = 2.0
+STALE_THRESHOLD = 0.6                 # needs_refresh above this staleness
+
+# Speakers enriched at most this many days ago cannot need a refresh: even
+# at the fastest aging rate their staleness stays <= STALE_THRESHOLD
+FRESH_DAYS = int(STALE_THRESHOLD * 365 / AGING_TIERS[0][1])
+
+
+def _tier(event_count: int, tiers, default: float) -> float:
+    """Value of the first tier event_count is above"""
+    for above, value in tiers:
+        if event_count > above:
+            return value
+    return default
+
+
+def _tier_sql(column: str, tiers, default: float) -> str:
+    """_tier as an SQL CASE expression over column"""
+    whens = ' '.join(f'WHEN {column} > {above} THEN {value}' for above, value in tiers)
+    return f'CASE {whens} ELSE {default} END'
 
 
 class FreshnessManager:
@@ -33,16 +64,11 @@ class FreshnessManager:
         enrichment_dt = datetime.fromisoformat(last_enrichment_date)
         days_old = (datetime.now() - enrichment_dt).days
 
-        # Base staleness: 1 year = 1.0 staleness
-        staleness = days_old / 365.0
-
-        # Adjustment for high-profile speakers (more events = ages faster)
-        if event_count > 10:
-            staleness *= 1.5  # High-profile speakers age 50% faster
-        elif event_count > 5:
-            staleness *= 1.2  # Active speakers age 20% faster
+        # Base staleness: 1 year = 1.0 staleness, adjusted for high-profile
+        # speakers (more events = ages faster)
+        staleness = days_old / 365.0 * _tier(event_count, AGING_TIERS, 1.0)
 
-        return min(staleness, 2.0)  # Cap at 2.0
+        return min(staleness, MAX_STALENESS)
 
     def calculate_priority(self, speaker_id: int, staleness: float, event_count: int) -> float:
         """
@@ -56,19 +82,13 @@ class FreshnessManager:
         Returns:
             Priority score (higher = more urgent to refresh)
         """
-        # Base priority from staleness
-        priority = staleness
-
-        # Boost priority for speakers with many events
-        if event_count > 10:
-            priority += 0.5
-        elif event_count > 5:
-            priority += 0.3
+        # Base priority from staleness, boosted for speakers with many events
+        priority = staleness + _tier(event_count, EVENT_BOOSTS, 0.0)
 
         # Boost priority for speakers with tags
         tags = self.db.get_speaker_tags(speaker_id)
-        if len(tags) >= 3:
-            priority += 0.2
+        if len(tags) >= TAG_BOOST_MIN:
+            priority += TAG_BOOST
 
         return priority
 
@@ -76,62 +96,96 @@ class FreshnessManager:
         """
         Update freshness tracking for all speakers
 
-        Calculates staleness and priority scores
+        Calculates staleness and priority scores. The whole computation is a
+        single INSERT ... SELECT (calculate_staleness and calculate_priority
+        built in SQL from the same scoring constants), so no rows pass
+        through Python.
+        Speakers enriched within FRESH_DAYS are not rescored at all; any of
+        them still queued from an earlier pass are just taken off the queue.
         """
-        cursor = self.db.conn.cursor()
-
-        # Get all speakers with their enrichment dates
-        cursor.execute('''
-            SELECT s.speaker_id, d.enriched_at
-            FROM speakers s
-            LEFT JOIN speaker_demographics d ON s.speaker_id = d.speaker_id
-        ''')
-        speakers_data = cursor.fetchall()
-
         if verbose:
-            print(f"Updating freshness tracking for {len(speakers_data)} speakers...")
+            print("Updating freshness tracking...")
             print("=" * 60)
 
-        updated = 0
-
-        for speaker_id, enriched_at in speakers_data:
-            # Get event count
-            events = self.db.get_speaker_events(speaker_id)
-            event_count = len(events) if events else 0
-
-            # Calculate staleness
-            staleness = self.calculate_staleness(enriched_at, event_count)
-
-            # Calculate priority
-            priority = self.calculate_priority(speaker_id, staleness, event_count)
-
-            # Determine if refresh is needed (staleness > 0.6)
-            needs_refresh = staleness > 0.6
-
-            # Calculate next refresh date
-            if enriched_at:
-                enrichment_dt = datetime.fromisoformat(enriched_at)
-                # High priority: refresh in 6 months, normal: 1 year
-                refresh_interval = 180 if priority > 1.5 else 365
-                next_refresh = enrichment_dt + timedelta(days=refresh_interval)
-                next_refresh_str = next_refresh.isoformat()
-            else:
-                next_refresh_str = datetime.now().isoformat()
-
-            # Save to database
-            try:
+        # Read the clock once for the whole pass
+        now_str = datetime.now().isoformat()
+
+        # Enrichment age in whole days (integer epoch seconds)
+        days_old = '''(CAST(strftime('%s', :now) AS INTEGER)
+                       - CAST(strftime('%s', d.enriched_at) AS INTEGER)) / 86400'''
+
+        # base: speakers that may be stale (never enriched, or older than
+        #       FRESH_DAYS) with their age plus event and tag counts (each an
+        #       index range on speaker_id, only run for the rows kept)
+        # scored: staleness (1 year = 1.0, high-profile speakers age faster,
+        #       never enriched = fully stale, capped at 2.0)
+        # prioritized: staleness plus the event and tag boosts
+        # Next refresh: 6 months out for high priority, 1 year otherwise;
+        #       the fraction of enriched_at (chars 20+) is carried over so the
+        #       value keeps datetime.isoformat()'s format
+        params = {'now': now_str, 'fresh_days': FRESH_DAYS,
+                  'max_staleness': MAX_STALENESS, 'stale_threshold': STALE_THRESHOLD,
+                  'tag_boost_min': TAG_BOOST_MIN, 'tag_boost': TAG_BOOST}
+        cursor = self.db.conn.cursor()
+        try:
+            with self.db.atomic():
                 cursor.execute('''
+                    WITH base AS (
+                        SELECT s.speaker_id, d.enriched_at,
+                               {days_old} AS days_old,
+                               (SELECT COUNT(*) FROM event_speakers es
+                                JOIN events e ON e.event_id = es.event_id
+                                WHERE es.speaker_id = s.speaker_id) AS event_count,
+                               (SELECT COUNT(*) FROM speaker_tags t
+                                WHERE t.speaker_id = s.speaker_id) AS tag_count
+                        FROM speakers s
+                        LEFT JOIN speaker_demographics d ON s.speaker_id = d.speaker_id
+                        WHERE COALESCE({days_old} > :fresh_days, 1)
+                    ),
+                    scored AS (
+                        SELECT *,
+                               CASE WHEN days_old IS NULL THEN 1.0
+                                    ELSE MIN(days_old / 365.0 * {aging}, :max_staleness)
+                               END AS staleness
+                        FROM base
+                    ),
+                    prioritized AS (
+                        SELECT *,
+                               staleness + {event_boost}
+                               + CASE WHEN tag_count >= :tag_boost_min THEN :tag_boost
+                                      ELSE 0.0 END AS priority
+                        FROM scored
+                    )
                     INSERT OR REPLACE INTO speaker_freshness
                     (speaker_id, last_enrichment_date, staleness_score, needs_refresh,
                      priority_score, next_refresh_date)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (speaker_id, enriched_at, staleness, needs_refresh, priority, next_refresh_str))
-                updated += 1
-            except Exception as e:
-                if verbose:
-                    print(f"Error updating speaker {speaker_id}: {e}")
-
-        self.db.conn.commit()
+                    SELECT speaker_id, enriched_at, staleness, staleness > :stale_threshold, priority,
+                           CASE WHEN days_old IS NULL THEN :now
+                                ELSE strftime('%Y-%m-%dT%H:%M:%S', enriched_at,
+                                              CASE WHEN priority > 1.5 THEN '+180 days'
+                                                   ELSE '+365 days' END)
+                                     || substr(enriched_at, 20)
+                           END
+                    FROM prioritized
+                '''.format(days_old=days_old,
+                           aging=_tier_sql('event_count', AGING_TIERS, 1.0),
+                           event_boost=_tier_sql('event_count', EVENT_BOOSTS, 0.0)), params)
+                # cursor.rowcount is -1 for a statement starting with WITH
+                updated = cursor.execute('SELECT changes()').fetchone()[0]
+
+                # Re-enriched since the last pass: no longer queued
+                cursor.execute('''
+                    UPDATE speaker_freshness SET needs_refresh = 0
+                    WHERE needs_refresh = 1 AND speaker_id IN (
+                        SELECT d.speaker_id FROM speaker_demographics d
+                        WHERE {days_old} <= :fresh_days
+                    )
+                '''.format(days_old=days_old), params)
+                updated += cursor.rowcount
+        except Exception as e:
+            if verbose:
+                print(f"Error updating freshness tracking: {e}")
+            return
 
         if verbose:
             print(f"✓ Updated freshness tracking for {updated} speakers")
@@ -183,7 +237,8 @@ class FreshnessManager:
 
         return results
 
-    def refresh_stale_speakers(self, limit=10, min_priority=1.0, verbose=True):
+    def refresh_stale_speakers(self, limit=10, min_priority=1.0, verbose=True,
+                               workers=DEFAULT_WORKERS):
         """
         Refresh data for stale speakers
 
@@ -191,12 +246,13 @@ class FreshnessManager:
             limit: Maximum number of speakers to refresh
             min_priority: Minimum priority score to refresh
             verbose: Print progress
+            workers: Number of speakers fetched concurrently (1 = sequential)
         """
         cursor = self.db.conn.cursor()
 
         # Get speakers to refresh
         cursor.execute('''
-            SELECT s.speaker_id, s.name, s.title, s.affiliation, s.bio,
+            SELECT s.speaker_id, s.name, s.title, s.affiliation, s.primary_affiliation, s.bio,
                    f.priority_score
             FROM speaker_freshness f
             JOIN speakers s ON f.speaker_id = s.speaker_id
@@ -218,59 +274,22 @@ class FreshnessManager:
 
         succeeded = 0
         failed = 0
+        refreshed_at = datetime.now()
 
-        for i, (speaker_id, name, title, affiliation, bio, priority) in enumerate(speakers, 1):
+        def finish(i, row, speaker, future):
+            """Save a completed fetch on this (the database) thread"""
+            nonlocal succeeded, failed
+            # Rows lead with the db.get_speaker_by_id() columns
+            speaker_id, name, priority = row[0], row[1], row[6]
             if verbose:
                 print(f"\n{i}/{len(speakers)}: {name} (Priority: {priority:.2f})...", end=" ")
 
             try:
-                # Build speaker dict
-                speaker = {
-                    'speaker_id': speaker_id,
-                    'name': name,
-                    'title': title,
-                    'affiliation': affiliation,
-                    'bio': bio
-                }
-
-                # Perform enrichment
-                result = self.enricher.enrich_speaker(speaker)
+                # Saves tags, demographics, locations and languages; atomic
+                # per speaker, so a failed save rolls back only its own savepoint
+                result = self.enricher.save_enrichment(speaker_id, speaker, future.result(), self.db)
 
                 if result['success']:
-                    # Save updated data
-                    demographics = result.get('demographics', {})
-                    if demographics:
-                        self.db.save_speaker_demographics(
-                            speaker_id,
-                            gender=demographics.get('gender'),
-                            gender_confidence=demographics.get('gender_confidence'),
-                            nationality=demographics.get('nationality'),
-                            nationality_confidence=demographics.get('nationality_confidence'),
-                            birth_year=demographics.get('birth_year')
-                        )
-
-                    # Update locations and languages
-                    for loc in result.get('locations', []):
-                        self.db.save_speaker_location(
-                            speaker_id,
-                            location_type=loc.get('location_type', 'unknown'),
-                            city=loc.get('city'),
-                            country=loc.get('country'),
-                            region=loc.get('region'),
-                            is_primary=loc.get('is_primary', False),
-                            confidence=loc.get('confidence'),
-                            source='refresh'
-                        )
-
-                    for lang in result.get('languages', []):
-                        self.db.save_speaker_language(
-                            speaker_id,
-                            language=lang.get('language'),
-                            proficiency=lang.get('proficiency'),
-                            confidence=lang.get('confidence'),
-                            source='refresh'
-                        )
-
                     # Update freshness tracking
                     cursor.execute('''
                         UPDATE speaker_freshness
@@ -280,8 +299,8 @@ class FreshnessManager:
                             priority_score = 0.0,
                             next_refresh_date = ?
                         WHERE speaker_id = ?
-                    ''', (datetime.now().isoformat(),
-                          (datetime.now() + timedelta(days=365)).isoformat(),
+                    ''', (refreshed_at.isoformat(),
+                          (refreshed_at + timedelta(days=365)).isoformat(),
                           speaker_id))
 
                     succeeded += 1
@@ -298,10 +317,37 @@ class FreshnessManager:
                 if verbose:
                     print(f"✗ (Exception: {str(e)[:50]})")
 
-            # Rate limiting
-            time.sleep(1.5)
+        def save_group(done):
+            """Save every fetch that finished together in one transaction"""
+            with self.db.atomic():
+                for future in done:
+                    finish(*in_flight.pop(future), future)
+
+        # Only the network half (fetch_enrichment) runs on worker threads;
+        # loading and saving stay on this thread, which owns the connection.
+        # The enricher paces its own searches and Claude calls across threads.
+        max_in_flight = max(1, workers) * 2
+        in_flight = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for i, row in enumerate(speakers, 1):
+                try:
+                    speaker, events = self.enricher.load_speaker(row[0], self.db, row[:6])
+                except Exception as e:
+                    failed += 1
+                    if verbose:
+                        print(f"\n{i}/{len(speakers)}: {row[1]}... ✗ (Exception: {str(e)[:50]})")
+                    continue
+                future = executor.submit(self.enricher.fetch_enrichment, speaker, events)
+                in_flight[future] = (i, row, speaker)
+
+                while len(in_flight) >= max_in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    save_group(done)
 
-        self.db.conn.commit()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                save_group(done)
 
         if verbose:
             print("\n" + "=" * 60)
@@ -340,6 +386,8 @@ Examples:
                        help='Minimum priority score for refresh (default: 1.0)')
     parser.add_argument('--quiet', action='store_true',
                        help='Suppress progress messages')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                       help=f'Speakers refreshed concurrently (default: {DEFAULT_WORKERS})')
 
     args = parser.parse_args()
 
@@ -356,7 +404,8 @@ Examples:
             manager.refresh_stale_speakers(
                 limit=args.limit,
                 min_priority=args.min_priority,
-                verbose=verbose
+                verbose=verbose,
+                workers=args.workers
             )
         else:
             parser.print_help()
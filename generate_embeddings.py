@@ -4,13 +4,230 @@ Uses Voyage AI to create semantic embeddings for search
 """
 
 import argparse
+import functools
+import itertools
+import os
 from database import SpeakerDatabase
 from embedding_engine import EmbeddingEngine
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import time
 
 
-def generate_embeddings(batch_size=50, limit=None, provider='openai', verbose=True, db_path=None):
+# Batches embedded concurrently; the time is almost all API latency, and the
+# engine already splits each batch into a few parallel requests
+BATCH_WORKERS = 4
+
+
+def get_db_path():
+    """Get database path - /data/speakers.db on Railway, ./speakers.db locally"""
+    if os.path.exists('/data'):
+        return '/data/speakers.db'
+    return 'speakers.db'
+
+
+@functools.lru_cache(maxsize=None)
+def get_engine(provider):
+    """
+    EmbeddingEngine for a provider, created once per process
+
+    Repeated runs in a long-lived process (the web app, the cron pipeline)
+    reuse the engine and its API client. Failures are not cached.
+    """
+    return EmbeddingEngine(provider=provider)
+
+
+# Provider to try next when one can't be initialized
+_FALLBACK_PROVIDERS = {'gemini': 'openai', 'openai': 'voyage'}
+
+
+def _init_engine(provider, verbose=True):
+    """Shared engine for provider, falling back gemini -> openai -> voyage"""
+    while True:
+        try:
+            return get_engine(provider)
+        except Exception as e:
+            fallback = _FALLBACK_PROVIDERS.get(provider)
+            if fallback is None:
+                raise
+            if verbose:
+                print(f"⚠ {provider} failed: {e}")
+                print(f"Falling back to {fallback}...")
+            provider = fallback
+
+
+def refresh_embedding_matrix(db, engine, verbose=True):
+    """
+    Rebuild the contiguous on-disk embedding matrix used by search.
+
+    Called after embeddings are written so searches can memory-map every
+    vector in one read instead of decoding BLOB rows one by one. The
+    EMBEDDING_MATRIX_DTYPE env var picks the element type ('float32',
+    'float16' or 'int8'); a matrix in another type is rebuilt.
+    """
+    dtype = os.getenv('EMBEDDING_MATRIX_DTYPE', 'float32')
+    try:
+        current = db.get_embedding_matrix()
+        if current is not None and current[1].dtype == dtype:
+            return
+        rows = db.rebuild_embedding_matrix(engine.deserialize_embedding, dtype=dtype)
+        if verbose and rows:
+            print(f"✓ Embedding matrix rebuilt ({rows} rows)")
+    except Exception as e:
+        # Search falls back to the BLOB rows, so this is never fatal
+        if verbose:
+            print(f"⚠ Could not rebuild embedding matrix: {e}")
+
+
+def convert_legacy_embeddings(db_path, engine, verbose=True):
+    """
+    Rewrite pickled embedding BLOBs in the raw float32 format.
+
+    deserialize_embedding still reads the old format, so this is optional;
+    it shrinks the stored vectors and takes pickle out of the load path.
+
+    Returns:
+        Number of embeddings converted
+    """
+    db = SpeakerDatabase(db_path)
+    try:
+        converted = [
+            (engine.serialize_embedding(engine.deserialize_embedding(blob)), speaker_id)
+            for speaker_id, blob in db.get_all_embeddings()
+            if engine.is_legacy_embedding(blob)
+        ]
+        cursor = db.conn.cursor()
+        cursor.executemany(
+            'UPDATE speaker_embeddings SET embedding = ? WHERE speaker_id = ?', converted
+        )
+        db.conn.commit()
+    finally:
+        db.close()
+
+    if verbose:
+        print(f"✓ Converted {len(converted)} embeddings to raw float32")
+    return len(converted)
+
+
+def _fetch_batch(engine, texts):
+    """Embed one batch on a worker thread; returns ((index, embedding) pairs, usage)"""
+    results = list(engine.iter_embeddings(texts))
+    return results, engine.get_last_usage()
+
+
+def _iter_speakers(db, **filters):
+    """
+    Stream speakers for embedding, with bios and event descriptions cut in
+    SQL to the part build_embedding_text reads
+    """
+    return db.iter_speakers_for_embedding(
+        bio_chars=EmbeddingEngine.BIO_MAX_CHARS,
+        max_events=EmbeddingEngine.TEXT_MAX_EVENTS,
+        event_chars=EmbeddingEngine.EVENT_PREVIEW_CHARS,
+        **filters
+    )
+
+
+def _prepare_batches(engine, speakers, batch_size):
+    """
+    Group streamed speaker rows into batches and build their embedding texts
+
+    Args:
+        speakers: Rows from SpeakerDatabase.iter_speakers_for_embedding
+
+    Yields:
+        (batch_start, batch_speakers, batch_texts) tuples
+    """
+    speakers = iter(speakers)
+    batch_start = 0
+    while True:
+        batch = list(itertools.islice(speakers, batch_size))
+        if not batch:
+            return
+
+        batch_speakers = []
+        batch_texts = []
+        for speaker_id, name, title, affiliation, primary_affiliation, bio, tags, events in batch:
+            # Build speaker dict with tags and events
+            speaker = {
+                'speaker_id': speaker_id,
+                'name': name,
+                'title': title,
+                'affiliation': affiliation,
+                'primary_affiliation': primary_affiliation,
+                'bio': bio,
+                'tags': tags,
+                'events': events  # (title, role, description) for event context
+            }
+
+            batch_speakers.append(speaker)
+            # Build embedding text (includes event context)
+            batch_texts.append(engine.build_embedding_text(speaker))
+
+        yield batch_start, batch_speakers, batch_texts
+        batch_start += len(batch)
+
+
+def _fetch_batches(engine, batches, workers):
+    """
+    Embed prepared batches with up to `workers` in flight
+
+    Batches are pulled from the (lazy) iterable only as slots free up.
+    Yields (batch, future) in order, so the caller saves each result while
+    the following batches are still being embedded.
+    """
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    todo = iter(batches)
+
+    def submit(batch):
+        # The texts are the last item of each prepared batch
+        return batch, executor.submit(_fetch_batch, engine, batch[-1])
+
+    in_flight = deque(submit(batch) for batch in itertools.islice(todo, max(1, workers)))
+    try:
+        while in_flight:
+            batch, future = in_flight.popleft()
+            following = next(todo, None)
+            if following is not None:
+                in_flight.append(submit(following))
+            yield batch, future
+    finally:
+        # Consumer stopped early: drop what's queued
+        for _, future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _save_pending(db, engine, pending, failed_speakers, verbose):
+    """
+    Write a batch's embeddings with one executemany and one commit
+
+    Args:
+        pending: (speaker, embedding_blob, text) tuples
+        failed_speakers: (name, error) list the batch reports from
+
+    Returns:
+        Number of embeddings saved
+    """
+    if not pending:
+        return 0
+    try:
+        with db.atomic():
+            db.save_speaker_embeddings(
+                [(speaker['speaker_id'], blob, text) for speaker, blob, text in pending],
+                model=engine.model
+            )
+    except Exception as e:
+        failed_speakers.extend((speaker['name'], str(e)) for speaker, _, _ in pending)
+        if verbose:
+            print(f"  ✗ Failed to save {len(pending)} embeddings: {e}")
+        return 0
+    return len(pending)
+
+
+def generate_embeddings(batch_size=50, limit=None, provider='openai', verbose=True, db_path=None,
+                        workers=BATCH_WORKERS):
     """
     Generate embeddings for all speakers without embeddings
 
@@ -20,58 +237,35 @@ def generate_embeddings(batch_size=50, limit=None, provider='openai', verbose=Tr
         provider: Embedding provider ('openai' default, 'gemini', or 'voyage')
         verbose: Print progress messages
         db_path: Path to database (None = auto-detect Railway vs local)
+        workers: Number of batches embedded concurrently (1 = one at a time)
     """
-    # Auto-detect database path if not provided
     if db_path is None:
-        import os
-        if os.path.exists('/data'):
-            db_path = '/data/speakers.db'
-        else:
-            db_path = 'speakers.db'
+        db_path = get_db_path()
 
-    # Get speakers list first, then close connection to avoid locking
+    # One connection for the whole run (WAL mode lets readers work alongside it)
     db = SpeakerDatabase(db_path)
-    speakers_data = db.get_speakers_without_embeddings()
-
-    # Pre-fetch tags and events for all speakers to avoid repeated connections
-    speakers_with_data = []
-    for speaker_data in speakers_data:
-        speaker_id = speaker_data[0]
-        tags = db.get_speaker_tags(speaker_id)
-        # Fetch events with descriptions for embedding context
-        events = db.get_speaker_events_with_descriptions(speaker_id)
-        # Format: (event_id, title, role_in_event, body_text)
-        # Convert to (title, role, description) for embedding
-        event_data = [(title, role, body_text) for _, title, role, body_text in events]
-        speakers_with_data.append((speaker_data, tags, event_data))
-
-    db.close()  # Close initial connection
-
-    # Try to initialize engine with preferred provider, fall back if needed
     try:
-        engine = EmbeddingEngine(provider=provider)
-    except Exception as e:
-        if verbose:
-            print(f"⚠ {provider} failed: {e}")
-            if provider == 'gemini':
-                print("Falling back to OpenAI...")
-                provider = 'openai'
-            elif provider == 'openai':
-                print("Falling back to Voyage...")
-                provider = 'voyage'
-            else:
-                raise
-        engine = EmbeddingEngine(provider=provider)
+        _generate_embeddings(db, batch_size, limit, provider, verbose, workers)
+    finally:
+        db.close()
+
 
+def _generate_embeddings(db, batch_size, limit, provider, verbose, workers=BATCH_WORKERS):
+    """Body of generate_embeddings, run on a single open database connection"""
+    # Preferred provider, falling back if it can't be initialized
+    engine = _init_engine(provider, verbose)
+
+    # Missing embeddings, and ones left over from a different model
+    total = db.count_speakers_for_embedding(missing_only=True, model=engine.model)
     if limit:
-        speakers_with_data = speakers_with_data[:limit]
+        total = min(total, limit)
 
-    if not speakers_with_data:
+    if not total:
         if verbose:
             print("✓ All speakers already have embeddings!")
+        refresh_embedding_matrix(db, engine, verbose)
         return
 
-    total = len(speakers_with_data)
     if verbose:
         print(f"Generating embeddings for {total} speakers")
         print(f"Batch size: {batch_size}")
@@ -81,129 +275,94 @@ def generate_embeddings(batch_size=50, limit=None, provider='openai', verbose=Tr
     total_tokens = 0
     processed = 0
 
-    # Process in batches
-    for batch_start in range(0, total, batch_size):
-        batch_end = min(batch_start + batch_size, total)
-        batch = speakers_with_data[batch_start:batch_end]
-
+    # Speakers are streamed off the cursor and prepared a batch at a time, so
+    # only the batches in flight are held in memory. Up to `workers` batches
+    # are embedded concurrently; each is saved here, in order, so the
+    # database keeps a single writer
+    speakers = _iter_speakers(db, missing_only=True, model=engine.model, limit=limit or None)
+    batches = _prepare_batches(engine, speakers, batch_size)
+    for (batch_start, batch_speakers, batch_texts), fetch in _fetch_batches(engine, batches, workers):
+        batch_end = batch_start + len(batch_speakers)
         if verbose:
             print(f"\nProcessing batch {batch_start//batch_size + 1} ({batch_start+1}-{batch_end}/{total})...")
 
-        # Prepare batch data
-        batch_speakers = []
-        batch_texts = []
-
-        for speaker_data, tags, events in batch:
-            speaker_id, name, title, affiliation, primary_affiliation, bio = speaker_data
-
-            # Build speaker dict with tags and events
-            speaker = {
-                'speaker_id': speaker_id,
-                'name': name,
-                'title': title,
-                'affiliation': affiliation,
-                'primary_affiliation': primary_affiliation,
-                'bio': bio,
-                'tags': tags,
-                'events': events  # NEW: Include event data for embedding
-            }
-
-            # Build embedding text (now includes event context)
-            text = engine.build_embedding_text(speaker)
-
-            batch_speakers.append(speaker)
-            batch_texts.append(text)
-
-        # Open database connection for this batch
-        save_db = SpeakerDatabase(db_path)
         failed_speakers = []
+        # (speaker, blob, text) waiting to be written in one executemany
+        pending = []
+        # One lookup for the whole batch to prevent duplicates
+        existing = db.get_embedded_speaker_ids((s['speaker_id'] for s in batch_speakers), engine.model)
 
+        # Try batch processing first (more efficient)
         try:
-            # Try batch processing first (more efficient)
-            try:
-                embeddings = engine.generate_embeddings_batch(batch_texts)
-
-                # Save to database individually (allows partial success)
-                for speaker, embedding, text in zip(batch_speakers, embeddings, batch_texts):
-                    try:
-                        # Check for existing embedding to prevent duplicates
-                        cursor = save_db.conn.cursor()
-                        cursor.execute(
-                            'SELECT COUNT(*) FROM speaker_embeddings WHERE speaker_id = ?',
-                            (speaker['speaker_id'],)
-                        )
-                        if cursor.fetchone()[0] > 0:
-                            if verbose:
-                                print(f"  ⚠ Skipping {speaker['name']} (already has embedding)")
-                            continue
-
-                        embedding_blob = engine.serialize_embedding(embedding)
-                        save_db.save_speaker_embedding(
-                            speaker['speaker_id'],
-                            embedding_blob,
-                            text,
-                            model=engine.model
-                        )
-                        processed += 1
-
-                    except Exception as e:
-                        failed_speakers.append((speaker['name'], str(e)))
+            # The whole batch is written with one commit below
+            results, usage = fetch.result()
+            for i, embedding in results:
+                speaker, text = batch_speakers[i], batch_texts[i]
+                try:
+                    # Skip speakers that already have an embedding
+                    if speaker['speaker_id'] in existing:
                         if verbose:
-                            print(f"  ✗ Failed to save {speaker['name']}: {e}")
+                            print(f"  ⚠ Skipping {speaker['name']} (already has a current embedding)")
+                        continue
 
-                # Track usage
-                usage = engine.get_last_usage()
-                if usage:
-                    total_tokens += usage['total_tokens']
+                    embedding_blob = engine.serialize_embedding(embedding)
+                    pending.append((speaker, embedding_blob, text))
+
+                except Exception as e:
+                    failed_speakers.append((speaker['name'], str(e)))
+                    if verbose:
+                        print(f"  ✗ Failed to save {speaker['name']}: {e}")
 
-                if verbose:
-                    successful = len(batch) - len(failed_speakers)
-                    print(f"  ✓ Generated {successful} embeddings")
+            # Track usage
+            if usage:
+                total_tokens += usage['total_tokens']
+
+            if verbose:
+                successful = len(batch_speakers) - len(failed_speakers)
+                print(f"  ✓ Generated {successful} embeddings")
+                if usage:
+                    print(f"  Tokens: {usage['total_tokens']}")
+
+        except Exception as batch_error:
+            # Batch processing failed - fall back to individual processing
+            if verbose:
+                print(f"  ⚠ Batch failed ({batch_error}), processing individually...")
+
+            # Keep what the stream already returned (allows partial success;
+            # the fallback below skips what was already saved)
+            saved = _save_pending(db, engine, pending, failed_speakers, verbose)
+            if saved:
+                processed += saved
+                existing.update(speaker['speaker_id'] for speaker, _, _ in pending)
+            pending = []
+
+            for speaker, text in zip(batch_speakers, batch_texts):
+                try:
+                    # Check for existing embedding
+                    if speaker['speaker_id'] in existing:
+                        continue
+
+                    embedding = engine.generate_embedding(text)
+                    embedding_blob = engine.serialize_embedding(embedding)
+                    pending.append((speaker, embedding_blob, text))
+
+                    usage = engine.get_last_usage()
                     if usage:
-                        print(f"  Tokens: {usage['total_tokens']}")
-
-            except Exception as batch_error:
-                # Batch processing failed - fall back to individual processing
-                if verbose:
-                    print(f"  ⚠ Batch failed ({batch_error}), processing individually...")
-
-                for speaker, text in zip(batch_speakers, batch_texts):
-                    try:
-                        # Check for existing embedding
-                        cursor = save_db.conn.cursor()
-                        cursor.execute(
-                            'SELECT COUNT(*) FROM speaker_embeddings WHERE speaker_id = ?',
-                            (speaker['speaker_id'],)
-                        )
-                        if cursor.fetchone()[0] > 0:
-                            continue
-
-                        embedding = engine.generate_embedding(text)
-                        embedding_blob = engine.serialize_embedding(embedding)
-                        save_db.save_speaker_embedding(
-                            speaker['speaker_id'],
-                            embedding_blob,
-                            text,
-                            model=engine.model
-                        )
-                        processed += 1
-
-                        usage = engine.get_last_usage()
-                        if usage:
-                            total_tokens += usage.get('total_tokens', 0)
-
-                    except Exception as e:
-                        failed_speakers.append((speaker['name'], str(e)))
-                        if verbose:
-                            print(f"  ✗ Failed {speaker['name']}: {e}")
+                        total_tokens += usage.get('total_tokens', 0)
+
+                except Exception as e:
+                    failed_speakers.append((speaker['name'], str(e)))
+                    if verbose:
+                        print(f"  ✗ Failed {speaker['name']}: {e}")
 
-        finally:
-            save_db.close()
+        processed += _save_pending(db, engine, pending, failed_speakers, verbose)
 
         # Report failed speakers for this batch
         if failed_speakers and verbose:
             print(f"  ⚠ {len(failed_speakers)} speakers failed in this batch")
 
+    refresh_embedding_matrix(db, engine, verbose)
+
     elapsed = time.time() - start_time
 
     # Print summary
@@ -227,17 +386,16 @@ def generate_embeddings(batch_size=50, limit=None, provider='openai', verbose=Tr
         print(f"Time elapsed: {elapsed:.1f}s")
         print(f"Avg time per speaker: {elapsed/processed:.2f}s" if processed > 0 else "")
 
-        # Check database stats (open fresh connection)
-        db = SpeakerDatabase()
+        # Check database stats
         total_with_embeddings = db.count_embeddings()
-        total_speakers_query = db.get_statistics()['total_speakers']
-        db.close()
+        total_speakers_query = db.count_speakers()
         print(f"\nTotal speakers with embeddings: {total_with_embeddings}/{total_speakers_query}")
 
         print("\n✓ Embedding generation complete!")
 
 
-def regenerate_all_embeddings(batch_size=50, provider='openai', verbose=True, db_path=None):
+def regenerate_all_embeddings(batch_size=50, provider='openai', verbose=True, db_path=None,
+                              workers=BATCH_WORKERS):
     """
     Regenerate embeddings for ALL speakers (even those with existing embeddings)
     WARNING: This will overwrite existing embeddings!
@@ -247,55 +405,31 @@ def regenerate_all_embeddings(batch_size=50, provider='openai', verbose=True, db
         provider: Embedding provider ('openai' default, 'gemini', or 'voyage')
         verbose: Print progress messages
         db_path: Path to database (None = auto-detect Railway vs local)
+        workers: Number of batches embedded concurrently (1 = one at a time)
     """
-    # Auto-detect database path if not provided
     if db_path is None:
-        import os
-        if os.path.exists('/data'):
-            db_path = '/data/speakers.db'
-        else:
-            db_path = 'speakers.db'
+        db_path = get_db_path()
 
-    # Get speakers list first, then close connection to avoid locking
+    # One connection for the whole run (WAL mode lets readers work alongside it)
     db = SpeakerDatabase(db_path)
-    speakers_data = db.get_all_speakers()
-
-    # Pre-fetch tags and events for all speakers to avoid repeated connections
-    speakers_with_data = []
-    for speaker_data in speakers_data:
-        speaker_id = speaker_data[0]
-        tags = db.get_speaker_tags(speaker_id)
-        # Fetch events with descriptions for embedding context
-        events = db.get_speaker_events_with_descriptions(speaker_id)
-        # Format: (event_id, title, role_in_event, body_text)
-        # Convert to (title, role, description) for embedding
-        event_data = [(title, role, body_text) for _, title, role, body_text in events]
-        speakers_with_data.append((speaker_data, tags, event_data))
-
-    db.close()  # Close initial connection
-
-    # Try to initialize engine with preferred provider, fall back if needed
     try:
-        engine = EmbeddingEngine(provider=provider)
-    except Exception as e:
-        if verbose:
-            print(f"⚠ {provider} failed: {e}")
-            if provider == 'gemini':
-                print("Falling back to OpenAI...")
-                provider = 'openai'
-            elif provider == 'openai':
-                print("Falling back to Voyage...")
-                provider = 'voyage'
-            else:
-                raise
-        engine = EmbeddingEngine(provider=provider)
+        _regenerate_all_embeddings(db, batch_size, provider, verbose, workers)
+    finally:
+        db.close()
+
 
-    if not speakers_with_data:
+def _regenerate_all_embeddings(db, batch_size, provider, verbose, workers=BATCH_WORKERS):
+    """Body of regenerate_all_embeddings, run on a single open database connection"""
+    # Preferred provider, falling back if it can't be initialized
+    engine = _init_engine(provider, verbose)
+
+    total = db.count_speakers_for_embedding(missing_only=False)
+
+    if not total:
         if verbose:
             print("No speakers found in database!")
         return
 
-    total = len(speakers_with_data)
     if verbose:
         print(f"Regenerating embeddings for {total} speakers")
         print("WARNING: This will overwrite existing embeddings!")
@@ -305,128 +439,94 @@ def regenerate_all_embeddings(batch_size=50, provider='openai', verbose=True, db
     total_tokens = 0
     processed = 0
 
-    # Process in batches
-    for batch_start in range(0, total, batch_size):
-        batch_end = min(batch_start + batch_size, total)
-        batch = speakers_with_data[batch_start:batch_end]
-
+    # Speakers are streamed off the cursor and prepared a batch at a time, so
+    # only the batches in flight are held in memory. Up to `workers` batches
+    # are embedded concurrently; each is saved here, in order, so the
+    # database keeps a single writer
+    speakers = _iter_speakers(db, missing_only=False, limit=None)
+    batches = _prepare_batches(engine, speakers, batch_size)
+    for (batch_start, batch_speakers, batch_texts), fetch in _fetch_batches(engine, batches, workers):
+        batch_end = batch_start + len(batch_speakers)
         if verbose:
             print(f"\nProcessing batch {batch_start//batch_size + 1} ({batch_start+1}-{batch_end}/{total})...")
 
-        # Prepare batch data
-        batch_speakers = []
-        batch_texts = []
-
-        for speaker_data, tags, events in batch:
-            speaker_id, name, title, affiliation, bio, first_seen, last_updated = speaker_data
-
-            # Build speaker dict with tags and events
-            speaker = {
-                'speaker_id': speaker_id,
-                'name': name,
-                'title': title,
-                'affiliation': affiliation,
-                'bio': bio,
-                'tags': tags,
-                'events': events  # NEW: Include event data for embedding
-            }
-
-            # Build embedding text (now includes event context)
-            text = engine.build_embedding_text(speaker)
-
-            batch_speakers.append(speaker)
-            batch_texts.append(text)
-
-        # Open database connection for this batch
-        save_db = SpeakerDatabase(db_path)
         failed_speakers = []
+        # (speaker, blob, text) waiting to be written in one executemany
+        pending = []
+        # One lookup for the whole batch to prevent duplicates
+        existing = db.get_embedded_speaker_ids((s['speaker_id'] for s in batch_speakers), engine.model)
 
+        # Try batch processing first (more efficient)
         try:
-            # Try batch processing first (more efficient)
-            try:
-                embeddings = engine.generate_embeddings_batch(batch_texts)
-
-                # Save to database individually (allows partial success)
-                for speaker, embedding, text in zip(batch_speakers, embeddings, batch_texts):
-                    try:
-                        # Check for existing embedding to prevent duplicates
-                        cursor = save_db.conn.cursor()
-                        cursor.execute(
-                            'SELECT COUNT(*) FROM speaker_embeddings WHERE speaker_id = ?',
-                            (speaker['speaker_id'],)
-                        )
-                        if cursor.fetchone()[0] > 0:
-                            if verbose:
-                                print(f"  ⚠ Skipping {speaker['name']} (already has embedding)")
-                            continue
-
-                        embedding_blob = engine.serialize_embedding(embedding)
-                        save_db.save_speaker_embedding(
-                            speaker['speaker_id'],
-                            embedding_blob,
-                            text,
-                            model=engine.model
-                        )
-                        processed += 1
-
-                    except Exception as e:
-                        failed_speakers.append((speaker['name'], str(e)))
+            # The whole batch is written with one commit below
+            results, usage = fetch.result()
+            for i, embedding in results:
+                speaker, text = batch_speakers[i], batch_texts[i]
+                try:
+                    # Skip speakers that already have an embedding
+                    if speaker['speaker_id'] in existing:
                         if verbose:
-                            print(f"  ✗ Failed to save {speaker['name']}: {e}")
+                            print(f"  ⚠ Skipping {speaker['name']} (already has a current embedding)")
+                        continue
 
-                # Track usage
-                usage = engine.get_last_usage()
-                if usage:
-                    total_tokens += usage['total_tokens']
+                    embedding_blob = engine.serialize_embedding(embedding)
+                    pending.append((speaker, embedding_blob, text))
+
+                except Exception as e:
+                    failed_speakers.append((speaker['name'], str(e)))
+                    if verbose:
+                        print(f"  ✗ Failed to save {speaker['name']}: {e}")
+
+            # Track usage
+            if usage:
+                total_tokens += usage['total_tokens']
 
-                if verbose:
-                    successful = len(batch) - len(failed_speakers)
-                    print(f"  ✓ Generated {successful} embeddings")
+            if verbose:
+                successful = len(batch_speakers) - len(failed_speakers)
+                print(f"  ✓ Generated {successful} embeddings")
+                if usage:
+                    print(f"  Tokens: {usage['total_tokens']}")
+
+        except Exception as batch_error:
+            # Batch processing failed - fall back to individual processing
+            if verbose:
+                print(f"  ⚠ Batch failed ({batch_error}), processing individually...")
+
+            # Keep what the stream already returned (allows partial success;
+            # the fallback below skips what was already saved)
+            saved = _save_pending(db, engine, pending, failed_speakers, verbose)
+            if saved:
+                processed += saved
+                existing.update(speaker['speaker_id'] for speaker, _, _ in pending)
+            pending = []
+
+            for speaker, text in zip(batch_speakers, batch_texts):
+                try:
+                    # Check for existing embedding
+                    if speaker['speaker_id'] in existing:
+                        continue
+
+                    embedding = engine.generate_embedding(text)
+                    embedding_blob = engine.serialize_embedding(embedding)
+                    pending.append((speaker, embedding_blob, text))
+
+                    usage = engine.get_last_usage()
                     if usage:
-                        print(f"  Tokens: {usage['total_tokens']}")
-
-            except Exception as batch_error:
-                # Batch processing failed - fall back to individual processing
-                if verbose:
-                    print(f"  ⚠ Batch failed ({batch_error}), processing individually...")
-
-                for speaker, text in zip(batch_speakers, batch_texts):
-                    try:
-                        # Check for existing embedding
-                        cursor = save_db.conn.cursor()
-                        cursor.execute(
-                            'SELECT COUNT(*) FROM speaker_embeddings WHERE speaker_id = ?',
-                            (speaker['speaker_id'],)
-                        )
-                        if cursor.fetchone()[0] > 0:
-                            continue
-
-                        embedding = engine.generate_embedding(text)
-                        embedding_blob = engine.serialize_embedding(embedding)
-                        save_db.save_speaker_embedding(
-                            speaker['speaker_id'],
-                            embedding_blob,
-                            text,
-                            model=engine.model
-                        )
-                        processed += 1
-
-                        usage = engine.get_last_usage()
-                        if usage:
-                            total_tokens += usage.get('total_tokens', 0)
-
-                    except Exception as e:
-                        failed_speakers.append((speaker['name'], str(e)))
-                        if verbose:
-                            print(f"  ✗ Failed {speaker['name']}: {e}")
+                        total_tokens += usage.get('total_tokens', 0)
 
-        finally:
-            save_db.close()
+                except Exception as e:
+                    failed_speakers.append((speaker['name'], str(e)))
+                    if verbose:
+                        print(f"  ✗ Failed {speaker['name']}: {e}")
+
+        processed += _save_pending(db, engine, pending, failed_speakers, verbose)
 
         # Report failed speakers for this batch
         if failed_speakers and verbose:
             print(f"  ⚠ {len(failed_speakers)} speakers failed in this batch")
 
+    refresh_embedding_matrix(db, engine, verbose)
+
     elapsed = time.time() - start_time
 
     # Print summary
@@ -465,18 +565,25 @@ if __name__ == '__main__':
                        help='Regenerate ALL embeddings (overwrite existing)')
     parser.add_argument('--quiet', action='store_true',
                        help='Suppress progress messages')
+    parser.add_argument('--workers', type=int, default=BATCH_WORKERS,
+                       help=f'Batches embedded concurrently (default: {BATCH_WORKERS})')
+    parser.add_argument('--convert-legacy', action='store_true',
+                       help='Rewrite pickled embeddings as raw float32 bytes and exit')
 
     args = parser.parse_args()
 
     verbose = not args.quiet
 
-    if args.regenerate:
+    if args.convert_legacy:
+        convert_legacy_embeddings(get_db_path(), get_engine(args.provider), verbose=verbose)
+    elif args.regenerate:
         response = input("WARNING: This will regenerate ALL embeddings and overwrite existing ones. Continue? (yes/no): ")
         if response.lower() == 'yes':
             regenerate_all_embeddings(
                 batch_size=args.batch_size,
                 provider=args.provider,
-                verbose=verbose
+                verbose=verbose,
+                workers=args.workers
             )
         else:
             print("Regeneration cancelled.")
@@ -485,5 +592,6 @@ if __name__ == '__main__':
             batch_size=args.batch_size,
             limit=args.limit,
             provider=args.provider,
-            verbose=verbose
+            verbose=verbose,
+            workers=args.workers
         )
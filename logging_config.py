@@ -10,12 +10,19 @@ Log Levels:
 - ERROR: Failures, exceptions, data integrity issues
 """
 
+import atexit
 import logging
+import queue
 import sys
-from datetime import datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Dict, Any
 
 
+# Logger name -> component: underscores become dots
+_COMPONENT_TRANS = str.maketrans({'_': '.'})
+
+
 class StructuredFormatter(logging.Formatter):
     """
     Formats log messages with structured fields for easy parsing.
@@ -24,21 +31,133 @@ class StructuredFormatter(logging.Formatter):
     Example: [INFO] 2026-02-24T10:30:45Z | pipeline.extraction | Event processed | event_id=123 speakers=5
     """
 
+    # (epoch second, formatted timestamp) of the last record: records logged
+    # within the same second reuse the string instead of formatting it again
+    _timestamp_cache = (-1, '')
+
+    def __init__(self, component: Optional[str] = None):
+        super().__init__()
+        # Logger name -> displayed component ("pipeline_cron.extraction" ->
+        # "pipeline.cron.extraction"), translated once per logger rather
+        # than once per record
+        self._components = {}
+        if component:
+            self._components[component] = component.translate(_COMPONENT_TRANS)
+
+    def component_for(self, name: str) -> str:
+        """Displayed component for a logger name"""
+        component = self._components.get(name)
+        if component is None:
+            component = self._components[name] = name.translate(_COMPONENT_TRANS)
+        return component
+
+    def format_timestamp(self, created: float) -> str:
+        """UTC ISO-8601 timestamp (whole seconds) for a record's created time"""
+        second = int(created)
+        cached_second, timestamp = self._timestamp_cache
+        if second != cached_second:
+            t = time.gmtime(second)
+            # Fixed format: %-interpolation of the fields skips strftime's
+            # format parsing
+            timestamp = '%04d-%02d-%02dT%02d:%02d:%02dZ' % (
+                t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec)
+            # One tuple assignment, so threads never see a mismatched pair
+            self._timestamp_cache = (second, timestamp)
+        return timestamp
+
     def format(self, record: logging.LogRecord) -> str:
-        timestamp = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+        timestamp = self.format_timestamp(record.created)
+        component = self.component_for(record.name)
+
+        parts = ['[', record.levelname, '] ', timestamp, ' | ', component, ' | ', record.getMessage()]
+
+        # Add extra fields if provided, into the same list: one join per record
+        extra_fields = getattr(record, 'extra_fields', None)
+        if extra_fields:
+            for key, value in extra_fields.items():
+                parts.append(f" | {key}={value}")
+
+        return ''.join(parts)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that leaves flushing to its caller.
+
+    StreamHandler flushes after every record (one write() per log line);
+    here records collect in the stream's buffer until flush_buffer() is
+    called (see DrainingQueueListener).
+    """
+
+    def flush(self):
+        pass
 
-        # Extract component from logger name (e.g., "pipeline.extraction" from "pipeline_cron.extraction")
-        component = record.name.replace('_', '.')
+    def flush_buffer(self):
+        super().flush()
 
-        # Build base message
-        base = f"[{record.levelname}] {timestamp} | {component} | {record.getMessage()}"
 
-        # Add extra fields if provided
-        if hasattr(record, 'extra_fields') and record.extra_fields:
-            fields = ' | '.join([f"{k}={v}" for k, v in record.extra_fields.items()])
-            return f"{base} | {fields}"
+class BufferedStdoutHandler(BufferedStreamHandler):
+    """
+    BufferedStreamHandler bound to whatever sys.stdout is at write time
+
+    Like logging's own lastResort handler for stderr: records land in the
+    same stream (and buffer) as print(), even if sys.stdout is replaced
+    after import.
+    """
+
+    def __init__(self):
+        super().__init__(sys.stdout)
 
-        return base
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class DrainingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry"""
+
+    def handle(self, record):
+        super().handle(record)
+        # A burst of records goes out in one write; a lone record is
+        # still written straight away
+        if self.queue.empty():
+            self.flush()
+
+    def flush(self):
+        for handler in self.handlers:
+            getattr(handler, 'flush_buffer', handler.flush)()
+
+    def stop(self):
+        super().stop()
+        self.flush()
+
+
+# Loggers only enqueue records; one background listener formats them and
+# does the (possibly blocking) stdout write, off the pipeline's threads
+_log_queue = queue.Queue(-1)
+# sys.stdout itself (not a second writer on fd 1), so log lines share one
+# buffer with print() output and stay in order with it
+_stdout_handler = BufferedStdoutHandler()
+_stdout_handler.setFormatter(StructuredFormatter())
+_listener = DrainingQueueListener(_log_queue, _stdout_handler, respect_handler_level=True)
+_listener.start()
+# Write out whatever is still queued or buffered on exit
+atexit.register(_listener.stop)
+
+
+def flush_logs():
+    """
+    Wait until every record logged so far has been written and flushed.
+
+    Call before print()ing output that has to appear after those records
+    (e.g. a step summary following per-item log lines).
+    """
+    _log_queue.join()
+    _listener.flush()
 
 
 def setup_logging(component: str, level: int = logging.INFO) -> logging.Logger:
@@ -58,10 +177,10 @@ def setup_logging(component: str, level: int = logging.INFO) -> logging.Logger:
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
 
-    # Console handler with structured format
-    handler = logging.StreamHandler(sys.stdout)
+    # Queue handler: the listener writes to stdout in structured format
+    handler = QueueHandler(_log_queue)
     handler.setLevel(level)
-    handler.setFormatter(StructuredFormatter())
+    _stdout_handler.formatter.component_for(component)
 
     logger.addHandler(handler)
     logger.propagate = False  # Don't propagate to root logger
@@ -83,6 +202,10 @@ def log_with_context(logger: logging.Logger, level: int, message: str, **context
         log_with_context(logger, logging.INFO, "Event processed",
                         event_id=123, speakers=5, duration_ms=234)
     """
+    # Filtered out: skip building the record
+    if not logger.isEnabledFor(level):
+        return
+
     # Create a log record with extra fields
     if context:
         logger.log(level, message, extra={'extra_fields': context})
@@ -93,40 +216,54 @@ def log_with_context(logger: logging.Logger, level: int, message: str, **context
 # Convenience functions for common log patterns
 def log_phase_start(logger: logging.Logger, phase: str, **context):
     """Log the start of a pipeline phase"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     log_with_context(logger, logging.INFO, f"Starting {phase} phase", phase=phase, **context)
 
 
 def log_phase_complete(logger: logging.Logger, phase: str, **context):
     """Log successful completion of a pipeline phase"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     log_with_context(logger, logging.INFO, f"✓ {phase} phase complete", phase=phase, **context)
 
 
 def log_phase_failed(logger: logging.Logger, phase: str, error: str, **context):
     """Log failure of a pipeline phase"""
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     log_with_context(logger, logging.ERROR, f"✗ {phase} phase failed",
                      phase=phase, error=error, **context)
 
 
 def log_item_processed(logger: logging.Logger, item_type: str, item_name: str, **context):
     """Log successful processing of an item"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     log_with_context(logger, logging.INFO, f"✓ Processed {item_type}: {item_name}",
                      item_type=item_type, item_name=item_name, **context)
 
 
 def log_item_skipped(logger: logging.Logger, item_type: str, item_name: str, reason: str, **context):
     """Log when an item is skipped (WARNING level)"""
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     log_with_context(logger, logging.WARNING, f"⚠ Skipped {item_type}: {item_name} - {reason}",
                      item_type=item_type, item_name=item_name, reason=reason, **context)
 
 
 def log_item_failed(logger: logging.Logger, item_type: str, item_name: str, error: str, **context):
     """Log when an item fails to process (ERROR level)"""
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     log_with_context(logger, logging.ERROR, f"✗ Failed {item_type}: {item_name} - {error}",
                      item_type=item_type, item_name=item_name, error=error, **context)
 
 
 def log_retry(logger: logging.Logger, operation: str, attempt: int, max_attempts: int, **context):
     """Log retry attempts (WARNING level)"""
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     log_with_context(logger, logging.WARNING,
                      f"⚠ Retrying {operation} (attempt {attempt}/{max_attempts})",
                      operation=operation, attempt=attempt, max_attempts=max_attempts, **context)
@@ -136,6 +273,8 @@ def log_api_call(logger: logging.Logger, service: str, operation: str, success:
                  duration_ms: Optional[int] = None, **context):
     """Log API calls with timing and success status"""
     level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
     status = "✓" if success else "✗"
     msg = f"{status} API call: {service}.{operation}"
 
@@ -148,15 +287,28 @@ def log_api_call(logger: logging.Logger, service: str, operation: str, success:
 
 def log_stats(logger: logging.Logger, title: str, stats: Dict[str, Any]):
     """Log statistics/metrics"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     msg = f"📊 {title}"
     log_with_context(logger, logging.INFO, msg, **stats)
 
 
-# Pre-configured loggers for common components
-pipeline_logger = setup_logging("pipeline")
-extraction_logger = setup_logging("pipeline.extraction")
-enrichment_logger = setup_logging("pipeline.enrichment")
-embedding_logger = setup_logging("pipeline.embedding")
-scraping_logger = setup_logging("pipeline.scraping")
-web_logger = setup_logging("web")
-db_logger = setup_logging("database")
+# Pre-configured loggers for common components, built on first use
+# (module __getattr__, PEP 562) so an import only sets up the ones it names
+_COMPONENT_NAMES = {
+    'pipeline_logger': "pipeline",
+    'extraction_logger': "pipeline.extraction",
+    'enrichment_logger': "pipeline.enrichment",
+    'embedding_logger': "pipeline.embedding",
+    'scraping_logger': "pipeline.scraping",
+    'web_logger': "web",
+    'db_logger': "database",
+}
+
+
+def __getattr__(name: str) -> logging.Logger:
+    component = _COMPONENT_NAMES.get(name)
+    if component is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    logger = globals()[name] = setup_logging(component)
+    return logger
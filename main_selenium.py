@@ -5,6 +5,7 @@ With optional timing and API cost tracking (--stats flag)
 
 import os
 import argparse
+import functools
 import time
 from datetime import datetime
 from database import SpeakerDatabase
@@ -12,7 +13,11 @@ from selenium_scraper import SeleniumEventScraper
 from speaker_extractor import SpeakerExtractor
 from speaker_tagger import SpeakerTagger
 from generate_embeddings import generate_embeddings
-import json
+from logging_config import extraction_logger, flush_logs, log_item_failed, log_item_processed, log_with_context
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import chain
+from dotenv import load_dotenv
 
 
 def get_db_path():
@@ -23,6 +28,53 @@ def get_db_path():
     return './speakers.db'
 
 
+# Console banners, built once rather than on every print
+BANNER = "=" * 70
+DIVIDER = "-" * 70
+HDR_SCRAPE = "\n🌐 STEP 1: SCRAPING EVENTS FROM WEBSITE (SELENIUM)\n" + BANNER
+HDR_EXTRACT = "\n\n🤖 STEP 2: EXTRACTING SPEAKERS WITH AI\n" + BANNER
+HDR_TAG = "\n\n🏷️  STEP 3: TAGGING SPEAKERS WITH AI\n" + BANNER
+HDR_EMBED = "\n\n🔍 STEP 4: GENERATING EMBEDDINGS FOR SEARCH\n" + BANNER
+HDR_STATS = "\n\n📊 DATABASE STATISTICS\n" + BANNER
+HDR_EXPORT = "\n\n💾 EXPORTING SPEAKERS TO CSV\n" + BANNER
+
+TITLE = "\n".join([
+    BANNER,
+    "ASIA SOCIETY - SPEAKER DATABASE BUILDER",
+    "(Selenium Version - bypasses 403 errors)",
+    BANNER,
+])
+ABOUT = "\n".join([
+    "\nThis tool will:",
+    "1. Scrape event pages using Selenium (real browser)",
+    "2. Use AI to extract speaker information",
+    "3. Optionally tag speakers with expertise tags (--tag)",
+    "4. Generate embeddings to make speakers searchable",
+    "5. Store everything in a SQLite database",
+    "",
+    DIVIDER,
+    "NOTE: This requires Chrome browser to be installed.",
+    DIVIDER,
+])
+COMPLETE = "\n".join([
+    "\n" + BANNER,
+    "✓ COMPLETE",
+    BANNER,
+    "\nDatabase saved as: speakers.db",
+    "You can:",
+    "  - Run this script again to scrape more events",
+    "  - View the database with SQLite browser",
+    "  - Use the database for further analysis",
+])
+
+
+# Concurrent Claude calls during speaker extraction
+EXTRACTION_WORKERS = 4
+
+# Short events sent to Claude together in one extraction call
+EXTRACTION_BATCH_SIZE = 5
+
+
 # Anthropic pricing (as of 2024) - per million tokens
 PRICING = {
     'claude-sonnet-4-20250514': {
@@ -81,33 +133,33 @@ class PipelineStats:
         if not self.enabled or not self.steps:
             return
 
-        print("\n" + "="*70)
+        print("\n" + BANNER)
         print("📊 PIPELINE EXECUTION SUMMARY")
-        print("="*70)
+        print(BANNER)
 
         total_duration = sum(s['duration'] for s in self.steps.values())
 
         print(f"\n⏱️  TIMING")
-        print("-"*70)
+        print(DIVIDER)
         for name, data in self.steps.items():
             duration = data['duration']
             items = data['items_processed']
             pct = (duration / total_duration * 100) if total_duration > 0 else 0
             items_str = f" ({items} items)" if items > 0 else ""
             print(f"  {name:30} {duration:8.2f}s  ({pct:5.1f}%){items_str}")
-        print("-"*70)
+        print(DIVIDER)
         print(f"  {'TOTAL':30} {total_duration:8.2f}s")
 
         if self.api_calls > 0:
             print(f"\n🤖 API USAGE")
-            print("-"*70)
+            print(DIVIDER)
             print(f"  Total API calls:        {self.api_calls:,}")
             print(f"  Total input tokens:     {self.total_input_tokens:,}")
             print(f"  Total output tokens:    {self.total_output_tokens:,}")
             print(f"  Total tokens:           {self.total_input_tokens + self.total_output_tokens:,}")
 
             print(f"\n💰 ESTIMATED COST (Claude Sonnet)")
-            print("-"*70)
+            print(DIVIDER)
             pricing = PRICING['claude-sonnet-4-20250514']
             input_cost = (self.total_input_tokens / 1_000_000) * pricing['input']
             output_cost = (self.total_output_tokens / 1_000_000) * pricing['output']
@@ -118,7 +170,7 @@ class PipelineStats:
 
             # Per-step breakdown
             print(f"\n📈 API USAGE BY STEP")
-            print("-"*70)
+            print(DIVIDER)
             for name, data in self.steps.items():
                 if data['api_calls'] > 0:
                     step_input = data['input_tokens']
@@ -129,23 +181,16 @@ class PipelineStats:
                     print(f"    API calls: {data['api_calls']}, Tokens: {step_input + step_output:,}, Cost: ${step_cost:.4f}")
 
 
+@functools.lru_cache(maxsize=1)
 def load_api_key():
-    """Load API key from .env file or environment"""
-    if os.path.exists('.env'):
-        with open('.env', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('ANTHROPIC_API_KEY='):
-                    key = line.split('=', 1)[1].strip()
-                    os.environ['ANTHROPIC_API_KEY'] = key
-                    return key
+    """Load API key from .env file or environment (cached - .env is read once per run)"""
+    load_dotenv()  # No-op when there's no .env file
     return os.getenv('ANTHROPIC_API_KEY')
 
 
 def scrape_events(db, limit=None, headless=True, max_pages=1, base_url=None, stats=None):
     """Step 1: Scrape events from website using Selenium and save to database"""
-    print("\n" + "🌐 STEP 1: SCRAPING EVENTS FROM WEBSITE (SELENIUM)")
-    print("="*70)
+    print(HDR_SCRAPE)
 
     if stats:
         stats.start_step("1. Scraping")
@@ -159,7 +204,7 @@ def scrape_events(db, limit=None, headless=True, max_pages=1, base_url=None, sta
     db_stats = db.get_statistics()
     print(f"\n📊 Current Database Status:")
     print(f"   Total events in database: {db_stats['total_events']}")
-    print(f"   Unprocessed events: {db_stats['total_events'] - db_stats['processed_events']}")
+    print(f"   Unprocessed events: {db_stats['pending_events']}")
 
     if stats:
         stats.end_step(count)
@@ -167,10 +212,25 @@ def scrape_events(db, limit=None, headless=True, max_pages=1, base_url=None, sta
     return count
 
 
-def extract_speakers(db, stats=None):
-    """Step 2: Use AI to extract speakers from scraped events"""
-    print("\n\n" + "🤖 STEP 2: EXTRACTING SPEAKERS WITH AI")
-    print("="*70)
+def _extraction_groups(events, batch_size, max_chars):
+    """Group events for extract_speakers_batch: at most batch_size events and max_chars of text per group, long ones alone"""
+    batch = []
+    batch_chars = 0
+    for event in events:
+        size = len(event[3] or '')
+        if batch and (batch_chars + size > max_chars or len(batch) >= max(1, batch_size)):
+            yield batch
+            batch = []
+            batch_chars = 0
+        batch.append(event)
+        batch_chars += size
+    if batch:
+        yield batch
+
+
+def extract_speakers(db, stats=None, workers=EXTRACTION_WORKERS, batch_size=EXTRACTION_BATCH_SIZE):
+    """Step 2: Use AI to extract speakers from scraped events (workers Claude calls at once, batch_size short events per call)"""
+    print(HDR_EXTRACT)
 
     if stats:
         stats.start_step("2. Extraction")
@@ -185,66 +245,90 @@ def extract_speakers(db, stats=None):
 
     print("✓ API key loaded")
 
-    unprocessed = db.get_unprocessed_events()
+    # Events stream off the cursor rather than all being loaded up front
+    unprocessed = db.iter_unprocessed_events()
+    first = next(unprocessed, None)
 
-    if not unprocessed:
+    if first is None:
         print("\n✓ All events have been processed!")
         if stats:
             stats.end_step(0)
         return 0
 
-    print(f"\nFound {len(unprocessed)} unprocessed event(s)")
-    print("-"*70)
+    print(DIVIDER)
 
     extractor = SpeakerExtractor(api_key=api_key)
     total_speakers = 0
+    total_events = 0
 
-    for event_id, url, title, body_text in unprocessed:
-        print(f"\n📄 Processing Event ID {event_id}")
-        print(f"   Title: {title[:70]}...")
-
-        result = extractor.extract_speakers(title, body_text)
-
-        # Track API usage
-        if stats and hasattr(extractor, '_last_usage'):
+    def save_event(event_id, title, result):
+        """Save one event's extraction (main thread, one transaction)"""
+        # Track API usage (per result - concurrent calls share _last_usage)
+        usage = result.get('usage')
+        if stats and usage:
             stats.add_api_usage(
-                extractor._last_usage.get('input_tokens', 0),
-                extractor._last_usage.get('output_tokens', 0)
+                usage.get('input_tokens', 0),
+                usage.get('output_tokens', 0)
             )
 
-        if result['success']:
-            speakers = result['speakers']
-            print(f"   ✓ Found {len(speakers)} speaker(s)")
-
-            for speaker_data in speakers:
-                speaker_id = db.add_speaker(
-                    name=speaker_data.get('name'),
-                    title=speaker_data.get('title'),
-                    affiliation=speaker_data.get('affiliation'),
-                    primary_affiliation=speaker_data.get('primary_affiliation'),
-                    bio=speaker_data.get('bio')
-                )
-
-                db.link_speaker_to_event(
-                    event_id=event_id,
-                    speaker_id=speaker_id,
-                    role_in_event=speaker_data.get('role_in_event'),
-                    extracted_info=json.dumps(speaker_data)
-                )
-
-                print(f"     - {speaker_data.get('name')} ({speaker_data.get('role_in_event', 'participant')})")
-                total_speakers += 1
-
-            db.mark_event_processed(event_id, 'completed')
-        else:
-            print(f"   ❌ Error: {result['error']}")
+        if not result['success']:
+            log_item_failed(extraction_logger, "event", title[:70], result['error'],
+                            event_id=event_id)
             db.mark_event_processed(event_id, 'failed')
+            return 0
+
+        speakers = result['speakers']
+        speaker_ids = db.save_extracted_speakers(event_id, speakers)
+        if extraction_logger.isEnabledFor(logging.DEBUG):
+            for speaker_id, speaker_data in zip(speaker_ids, speakers):
+                log_with_context(extraction_logger, logging.DEBUG, "Speaker linked",
+                                 event_id=event_id, speaker_id=speaker_id,
+                                 role=speaker_data.get('role_in_event', 'participant'))
+        log_item_processed(extraction_logger, "event", title[:70],
+                           event_id=event_id, speakers=len(speaker_ids))
+        return len(speaker_ids)
+
+    def save_group(group, future):
+        """Save the events of one Claude call"""
+        try:
+            results = future.result()
+        except Exception as e:
+            results = [{'success': False, 'error': str(e)} for _ in group]
+        return sum(save_event(event_id, title, result)
+                   for (event_id, title), result in zip(group, results))
+
+    groups = _extraction_groups(chain([first], unprocessed), batch_size,
+                                extractor.BATCH_MAX_CHARS)
+
+    # Claude calls run on worker threads; at most workers * 2 are
+    # submitted ahead so a large backlog isn't queued all at once.
+    # Results are saved here as they finish, so the connection stays
+    # on this thread.
+    max_in_flight = max(1, workers) * 2
+    in_flight = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for group in groups:
+            total_events += len(group)
+            future = executor.submit(extractor.extract_speakers_batch,
+                                     [(title, body_text) for _, _, title, body_text in group])
+            in_flight[future] = [(event_id, title) for event_id, _, title, _ in group]
+
+            if len(in_flight) >= max_in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    total_speakers += save_group(in_flight.pop(future), future)
+
+        for future in list(in_flight):
+            total_speakers += save_group(in_flight.pop(future), future)
+
+    # Per-event lines go through the log queue; let them out before printing
+    flush_logs()
 
     # Clean up any duplicates that slipped through fuzzy matching
     merged = db.merge_duplicates(verbose=True)
 
-    print("\n" + "="*70)
-    print(f"✓ Extraction complete: {total_speakers} speaker records created")
+    print("\n" + BANNER)
+    print(f"✓ Extraction complete: {total_speakers} speaker records created from {total_events} event(s)")
     if merged:
         print(f"✓ Merged {merged} duplicate speaker(s)")
 
@@ -256,8 +340,7 @@ def extract_speakers(db, stats=None):
 
 def tag_speakers(db, limit=None, stats=None):
     """Step 3: Tag speakers with expertise tags using web search and Claude AI"""
-    print("\n\n" + "🏷️  STEP 3: TAGGING SPEAKERS WITH AI")
-    print("="*70)
+    print(HDR_TAG)
 
     if stats:
         stats.start_step("3. Tagging")
@@ -284,7 +367,7 @@ def tag_speakers(db, limit=None, stats=None):
         print(f"\nLimiting to {limit} speaker(s)")
 
     print(f"\nFound {len(untagged)} untagged speaker(s)")
-    print("-"*70)
+    print(DIVIDER)
 
     tagger = SpeakerTagger(api_key=api_key)
     tagged_count = 0
@@ -313,7 +396,7 @@ def tag_speakers(db, limit=None, stats=None):
 
         time.sleep(1.5)  # Rate limiting for web search
 
-    print("\n" + "="*70)
+    print("\n" + BANNER)
     print(f"✓ Tagging complete: {tagged_count} speakers tagged")
 
     if stats:
@@ -324,8 +407,7 @@ def tag_speakers(db, limit=None, stats=None):
 
 def generate_speaker_embeddings_step(db, limit=None, stats=None):
     """Step 4: Generate embeddings for speakers to make them searchable"""
-    print("\n\n" + "🔍 STEP 4: GENERATING EMBEDDINGS FOR SEARCH")
-    print("="*70)
+    print(HDR_EMBED)
 
     if stats:
         stats.start_step("4. Embeddings")
@@ -339,9 +421,9 @@ def generate_speaker_embeddings_step(db, limit=None, stats=None):
 
         # Get count of speakers with embeddings
         total_with_embeddings = db.count_embeddings()
-        total_speakers = db.get_statistics()['total_speakers']
+        total_speakers = db.count_speakers()
 
-        print("\n" + "="*70)
+        print("\n" + BANNER)
         print(f"✓ Embedding generation complete")
         print(f"  Speakers with embeddings: {total_with_embeddings}/{total_speakers}")
 
@@ -362,15 +444,14 @@ def generate_speaker_embeddings_step(db, limit=None, stats=None):
 
 def show_statistics(db):
     """Display database statistics and sample data"""
-    print("\n\n" + "📊 DATABASE STATISTICS")
-    print("="*70)
+    print(HDR_STATS)
 
     db_stats = db.get_statistics()
 
     print(f"\nEvents:")
     print(f"  Total events: {db_stats['total_events']}")
     print(f"  Processed: {db_stats['processed_events']}")
-    print(f"  Pending: {db_stats['total_events'] - db_stats['processed_events']}")
+    print(f"  Pending: {db_stats['pending_events']}")
 
     print(f"\nSpeakers:")
     print(f"  Total unique speakers: {db_stats['total_speakers']}")
@@ -380,8 +461,10 @@ def show_statistics(db):
 
     speakers = db.get_all_speakers()
     if speakers:
+        # One grouped query instead of a get_speaker_events call per speaker
+        event_counts = db.get_speaker_event_counts()
         print(f"\n📋 Sample Speakers (showing first 10):")
-        print("-"*70)
+        print(DIVIDER)
         for speaker in speakers[:10]:
             speaker_id, name, title, affiliation, bio, first_seen, last_updated = speaker
             print(f"\n  {name}")
@@ -390,9 +473,9 @@ def show_statistics(db):
             if affiliation:
                 print(f"    Affiliation: {affiliation}")
 
-            events = db.get_speaker_events(speaker_id)
-            if events:
-                print(f"    Events: {len(events)}")
+            event_count = event_counts.get(speaker_id, 0)
+            if event_count:
+                print(f"    Events: {event_count}")
 
             tags = db.get_speaker_tags(speaker_id)
             if tags:
@@ -404,38 +487,36 @@ def export_speakers_to_csv(db, stats=None):
     """Export all speakers to a CSV file"""
     import csv
 
-    print("\n\n" + "💾 EXPORTING SPEAKERS TO CSV")
-    print("="*70)
+    print(HDR_EXPORT)
 
     if stats:
         stats.start_step("4. Export")
 
-    speakers = db.get_all_speakers()
+    # Rows stream from one query, a batch at a time
+    batches = db.iter_speakers_with_event_counts()
+    first = next(batches, None)
 
-    if not speakers:
+    if not first:
         print("No speakers to export")
         if stats:
             stats.end_step(0)
         return
 
     filename = f"speakers_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    exported = 0
 
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(['ID', 'Name', 'Title', 'Affiliation', 'Bio', 'Tags', 'First Seen', 'Last Updated', 'Number of Events'])
 
-        for speaker in speakers:
-            speaker_id, name, title, affiliation, bio, first_seen, last_updated = speaker
-            events = db.get_speaker_events(speaker_id)
-            tags = db.get_speaker_tags(speaker_id)
-            tags_str = '; '.join([t[0] for t in tags]) if tags else ''
-
-            writer.writerow([speaker_id, name, title or '', affiliation or '', bio or '', tags_str, first_seen, last_updated, len(events)])
+        for rows in chain([first], batches):
+            writer.writerows(rows)
+            exported += len(rows)
 
-    print(f"✓ Exported {len(speakers)} speakers to {filename}")
+    print(f"✓ Exported {exported} speakers to {filename}")
 
     if stats:
-        stats.end_step(len(speakers))
+        stats.end_step(exported)
 
 
 def main():
@@ -501,24 +582,12 @@ def main():
     # Initialize stats tracker
     stats = PipelineStats(enabled=args.stats)
 
-    print("="*70)
-    print("ASIA SOCIETY - SPEAKER DATABASE BUILDER")
-    print("(Selenium Version - bypasses 403 errors)")
-    print("="*70)
+    print(TITLE)
 
     if args.stats:
         print(f"\nStarted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    print("\nThis tool will:")
-    print("1. Scrape event pages using Selenium (real browser)")
-    print("2. Use AI to extract speaker information")
-    print("3. Optionally tag speakers with expertise tags (--tag)")
-    print("4. Generate embeddings to make speakers searchable")
-    print("5. Store everything in a SQLite database")
-
-    print("\n" + "-"*70)
-    print("NOTE: This requires Chrome browser to be installed.")
-    print("-"*70)
+    print(ABOUT)
 
     # Use a single database connection for the entire pipeline
     db_path = get_db_path()
@@ -564,14 +633,7 @@ def main():
         if args.export:
             export_speakers_to_csv(db, stats=stats)
 
-    print("\n" + "="*70)
-    print("✓ COMPLETE")
-    print("="*70)
-    print(f"\nDatabase saved as: speakers.db")
-    print("You can:")
-    print("  - Run this script again to scrape more events")
-    print("  - View the database with SQLite browser")
-    print("  - Use the database for further analysis")
+    print(COMPLETE)
 
     # Print stats summary if enabled
     stats.print_summary()
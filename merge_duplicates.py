@@ -62,66 +62,29 @@ def merge_speakers(db, speaker_ids, dry_run=True):
     """
     cursor = db.conn.cursor()
 
-    # Get details for all speakers
-    speakers = [get_speaker_details(db, sid) for sid in speaker_ids]
-
-    # Score each speaker by completeness
-    def completeness_score(s):
-        score = 0
-        if s[2]:  # title
-            score += 1
-        if s[3]:  # affiliation
-            score += len(s[3])  # longer affiliation = more info
-        if s[4]:  # primary_affiliation
-            score += 1
-        if s[5]:  # bio
-            score += len(s[5]) if s[5] else 0
-        return score
-
-    # Sort by completeness, most complete first
-    speakers_sorted = sorted(speakers, key=completeness_score, reverse=True)
-    primary = speakers_sorted[0]
-    primary_id = primary[0]
-    duplicates = speakers_sorted[1:]
+    # Pick the most complete record inside SQLite (no Python-side scoring)
+    primary_id = db.pick_primary_speaker(speaker_ids)
+    primary = get_speaker_details(db, primary_id)
+    duplicates = [get_speaker_details(db, sid) for sid in speaker_ids if sid != primary_id]
 
     print(f"\n  Primary (keeping): ID={primary_id}, name='{primary[1]}'")
     print(f"    affiliation: {primary[3]}")
     print(f"    events linked: {get_event_count(db, primary_id)}")
 
-    # Merge info from duplicates into primary
-    merged_title = primary[2]
-    merged_affiliation = primary[3]
-    merged_primary_aff = primary[4]
-    merged_bio = primary[5]
-
     for dup in duplicates:
         dup_id = dup[0]
         print(f"  Duplicate (merging): ID={dup_id}, name='{dup[1]}'")
         print(f"    affiliation: {dup[3]}")
         print(f"    events linked: {get_event_count(db, dup_id)}")
 
-        # Take longer/more complete values
-        if dup[2] and (not merged_title or len(dup[2]) > len(merged_title)):
-            merged_title = dup[2]
-        if dup[3] and (not merged_affiliation or len(dup[3]) > len(merged_affiliation)):
-            merged_affiliation = dup[3]
-        if dup[4] and not merged_primary_aff:
-            merged_primary_aff = dup[4]
-        if dup[5] and (not merged_bio or len(dup[5]) > len(merged_bio)):
-            merged_bio = dup[5]
-
     if dry_run:
         print(f"  [DRY RUN] Would update primary speaker with merged info")
         print(f"  [DRY RUN] Would reassign {sum(get_event_count(db, d[0]) for d in duplicates)} event links")
         print(f"  [DRY RUN] Would delete {len(duplicates)} duplicate records")
         return
 
-    # Update primary speaker with merged info
-    cursor.execute('''
-        UPDATE speakers
-        SET title = ?, affiliation = ?, primary_affiliation = ?, bio = ?, last_updated = datetime('now')
-        WHERE speaker_id = ?
-    ''', (merged_title, merged_affiliation, merged_primary_aff, merged_bio, primary_id))
+    # Update primary speaker with the longest/most complete values from the group
+    db.merge_speaker_fields(primary_id, speaker_ids)
 
     # Reassign event_speakers links from duplicates to primary
     for dup in duplicates:
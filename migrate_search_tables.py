@@ -72,16 +72,15 @@ def migrate_database(db_path='speakers.db', verbose=True):
         'name': 'speaker_languages',
         'sql': '''
             CREATE TABLE IF NOT EXISTS speaker_languages (
-                language_id INTEGER PRIMARY KEY AUTOINCREMENT,
                 speaker_id INTEGER NOT NULL,
                 language TEXT NOT NULL,
                 proficiency TEXT,
                 confidence REAL,
                 source TEXT,
                 created_at TEXT NOT NULL,
-                FOREIGN KEY (speaker_id) REFERENCES speakers(speaker_id) ON DELETE CASCADE,
-                UNIQUE(speaker_id, language)
-            )
+                PRIMARY KEY (speaker_id, language),
+                FOREIGN KEY (speaker_id) REFERENCES speakers(speaker_id) ON DELETE CASCADE
+            ) WITHOUT ROWID
         '''
     })
 
@@ -117,23 +116,22 @@ def migrate_database(db_path='speakers.db', verbose=True):
             else:
                 print(f"  ✗ Table {migration['name']} already existed or failed to create")
 
-    # Create indexes for better query performance
+    # Create indexes for better query performance (speaker_embeddings and
+    # speaker_demographics need none: speaker_id is their primary key)
     indexes = [
-        ('idx_embeddings_speaker', 'speaker_embeddings', 'speaker_id'),
-        ('idx_demographics_speaker', 'speaker_demographics', 'speaker_id'),
-        ('idx_locations_speaker', 'speaker_locations', 'speaker_id'),
-        ('idx_locations_primary', 'speaker_locations', 'is_primary'),
-        ('idx_languages_speaker', 'speaker_languages', 'speaker_id'),
-        ('idx_freshness_needs_refresh', 'speaker_freshness', 'needs_refresh'),
-        ('idx_freshness_priority', 'speaker_freshness', 'priority_score'),
+        ('idx_locations_speaker', 'speaker_locations', 'speaker_id', None),
+        ('idx_locations_primary', 'speaker_locations', 'is_primary', None),
+        # Refresh queue: only rows with needs_refresh = 1, highest priority first
+        ('idx_freshness_refresh', 'speaker_freshness', 'priority_score DESC', 'needs_refresh = 1'),
     ]
 
     if verbose:
         print("\nCreating indexes for performance...")
 
-    for idx_name, table_name, column_name in indexes:
+    for idx_name, table_name, column_name, where in indexes:
         try:
-            cursor.execute(f'CREATE INDEX IF NOT EXISTS {idx_name} ON {table_name}({column_name})')
+            partial = f' WHERE {where}' if where else ''
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {idx_name} ON {table_name}({column_name}){partial}')
             if verbose:
                 print(f"  ✓ Index {idx_name} created")
         except sqlite3.Error as e:
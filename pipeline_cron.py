@@ -139,10 +139,11 @@ def scrape_events(db, event_limit=20):
     total_scraped = 0
     newly_scraped_ids = []
 
-    # Get event IDs before scraping to identify new ones
+    # Highest event ID before scraping; event_id is AUTOINCREMENT, so every
+    # event added by this run has a larger one
     cursor = db.conn.cursor()
-    cursor.execute('SELECT event_id FROM events')
-    existing_ids_before = set(row[0] for row in cursor.fetchall())
+    cursor.execute('SELECT COALESCE(MAX(event_id), 0) FROM events')
+    max_id_before = cursor.fetchone()[0]
 
     # PHASE 1: Scrape new events (recent publications)
     log("Phase 1: Scraping new events...")
@@ -180,10 +181,9 @@ def scrape_events(db, event_limit=20):
         finally:
             scraper_historical.close()
 
-    # Get newly scraped event IDs by finding the difference
-    cursor.execute('SELECT event_id FROM events')
-    existing_ids_after = set(row[0] for row in cursor.fetchall())
-    newly_scraped_ids = list(existing_ids_after - existing_ids_before)
+    # Get newly scraped event IDs from the primary key range, not a full-table diff
+    cursor.execute('SELECT event_id FROM events WHERE event_id > ? ORDER BY event_id', (max_id_before,))
+    newly_scraped_ids = [row[0] for row in cursor]
 
     log(f"Scraping complete: {total_scraped} total events ({new_count} new + {total_scraped - new_count} historical)")
     log(f"  Event IDs to extract immediately: {newly_scraped_ids[:5]}..." if len(newly_scraped_ids) > 5 else f"  Event IDs to extract immediately: {newly_scraped_ids}")
@@ -287,7 +287,7 @@ def extract_speakers(db, newly_scraped_ids=None, pending_limit=None):
             return value[:max_length]
         return value if value else None
 
-    initial_speaker_count = db.get_statistics()['total_speakers']
+    initial_speaker_count = db.count_speakers()
 
     for event in events_to_process:
         event_id = event[0]
@@ -304,48 +304,40 @@ def extract_speakers(db, newly_scraped_ids=None, pending_limit=None):
             if result['success']:
                 # Extraction succeeded
                 if result['speakers']:
-                    # Begin transaction for atomic speaker insertion
-                    db.conn.execute('BEGIN')
-
+                    # One transaction per event: its speakers, links and
+                    # status commit together (add_speaker still dedupes one
+                    # at a time; the links go in one executemany)
                     try:
-                        speakers_added = 0
-                        # Add each speaker to database
-                        for speaker_data in result['speakers']:
-                            # Skip speakers with no name (Claude extraction issue)
-                            speaker_name = speaker_data.get('name')
-                            if not speaker_name or not speaker_name.strip():
-                                log_item_skipped(extraction_logger, "speaker", "unknown",
-                                               "no name provided", speaker_data=str(speaker_data))
-                                continue
-
-                            # Validate and sanitize fields
-                            speaker_id = db.add_speaker(
-                                name=speaker_name.strip(),
-                                title=validate_speaker_field(speaker_data.get('title'), 'title'),
-                                affiliation=validate_speaker_field(speaker_data.get('affiliation'), 'affiliation'),
-                                bio=validate_speaker_field(speaker_data.get('bio'), 'bio', max_length=2000)
-                            )
-
-                            # Link speaker to event
-                            if speaker_id:
-                                db.link_speaker_to_event(
-                                    event_id=event_id,
-                                    speaker_id=speaker_id,
-                                    role_in_event=speaker_data.get('role', 'speaker')
+                        with db.atomic():
+                            links = []
+                            for speaker_data in result['speakers']:
+                                # Skip speakers with no name (Claude extraction issue)
+                                speaker_name = speaker_data.get('name')
+                                if not speaker_name or not speaker_name.strip():
+                                    log_item_skipped(extraction_logger, "speaker", "unknown",
+                                                   "no name provided", speaker_data=str(speaker_data))
+                                    continue
+
+                                # Validate and sanitize fields
+                                speaker_id = db.add_speaker(
+                                    name=speaker_name.strip(),
+                                    title=validate_speaker_field(speaker_data.get('title'), 'title'),
+                                    affiliation=validate_speaker_field(speaker_data.get('affiliation'), 'affiliation'),
+                                    bio=validate_speaker_field(speaker_data.get('bio'), 'bio', max_length=2000)
                                 )
-                                speakers_added += 1
 
-                        # Commit transaction - all speakers added successfully
-                        db.conn.commit()
+                                if speaker_id:
+                                    links.append((speaker_id, speaker_data.get('role', 'speaker'), None))
+
+                            db.link_speakers_to_event(event_id, links)
+                            db.mark_event_processed(event_id, 'completed')
 
-                        # Mark event as completed
-                        db.mark_event_processed(event_id, 'completed')
+                        speakers_added = len(links)
                         log_item_processed(extraction_logger, "event", event_title,
                                          speakers_extracted=speakers_added, event_id=event_id)
 
                     except Exception as e:
-                        # Rollback transaction on any error during speaker insertion
-                        db.conn.rollback()
+                        # atomic() has rolled back this event's speakers and links
                         db.mark_event_processed(event_id, 'failed')
                         log_item_failed(extraction_logger, "event", event_title,
                                       f"Database error: {e}", event_id=event_id)
@@ -388,7 +380,7 @@ def extract_speakers(db, newly_scraped_ids=None, pending_limit=None):
                            event_id=event_id, error=str(e))
             db.mark_event_processed(event_id, 'failed')
 
-    final_speaker_count = db.get_statistics()['total_speakers']
+    final_speaker_count = db.count_speakers()
     new_speakers = final_speaker_count - initial_speaker_count
 
     log_phase_complete(extraction_logger, "speaker extraction",
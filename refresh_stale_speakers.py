@@ -17,7 +17,6 @@ Options:
 import os
 import sys
 import argparse
-import time
 from datetime import datetime
 from database import SpeakerDatabase
 from speaker_enricher import UnifiedSpeakerEnricher
@@ -106,7 +105,9 @@ def refresh_stale_speakers(limit=20, months=6, dry_run=False, non_interactive=Fa
 
         # Initialize unified enricher (v2 - tags + demographics in one pass) and affiliation checker
         enricher = UnifiedSpeakerEnricher()
-        affiliation_checker = AffiliationChecker(model='claude-3-haiku-20240307')
+        # Sharing the enricher shares its search pacing, so no fixed sleep
+        # between speakers is needed
+        affiliation_checker = AffiliationChecker(model='claude-3-haiku-20240307', enricher=enricher)
 
         # Tracking stats
         refreshed_count = 0
@@ -120,67 +121,23 @@ def refresh_stale_speakers(limit=20, months=6, dry_run=False, non_interactive=Fa
             print(f"  {i}/{len(stale_speakers)}: {name}...", end=" ")
 
             try:
-                # Get speaker data for affiliation checking
-                cursor = database.conn.cursor()
-                cursor.execute('''
-                    SELECT name, title, affiliation
-                    FROM speakers
-                    WHERE speaker_id = ?
-                ''', (speaker_id,))
-                row = cursor.fetchone()
+                # Get speaker data for affiliation checking (also handed to
+                # the enricher so it doesn't read the speaker again)
+                row = database.get_speaker_by_id(speaker_id)
 
                 if not row:
                     print("✗ (Not found)")
                     failed_count += 1
                     continue
 
-                speaker_name, title, affiliation = row
+                speaker_name, title, affiliation = row[1], row[2], row[3]
 
-                # Perform unified enrichment (v2 - gets speaker data itself)
-                result = enricher.enrich_speaker(speaker_id, database)
+                # Perform unified enrichment (v2)
+                result = enricher.enrich_speaker(speaker_id, database, row)
 
+                # enrich_speaker has already saved tags, demographics,
+                # locations and languages in one transaction
                 if result['success']:
-                    # Save demographics (this will update enriched_at timestamp)
-                    demographics = result.get('demographics', {})
-                    if demographics and any([
-                        demographics.get('gender'),
-                        demographics.get('nationality'),
-                        demographics.get('birth_year')
-                    ]):
-                        database.save_speaker_demographics(
-                            speaker_id,
-                            gender=demographics.get('gender'),
-                            gender_confidence=demographics.get('gender_confidence'),
-                            nationality=demographics.get('nationality'),
-                            nationality_confidence=demographics.get('nationality_confidence'),
-                            birth_year=demographics.get('birth_year')
-                        )
-
-                    # Save locations
-                    locations = result.get('locations', [])
-                    for loc in locations:
-                        database.save_speaker_location(
-                            speaker_id,
-                            location_type=loc.get('location_type', 'unknown'),
-                            city=loc.get('city'),
-                            country=loc.get('country'),
-                            region=loc.get('region'),
-                            is_primary=loc.get('is_primary', False),
-                            confidence=loc.get('confidence'),
-                            source='web_search'
-                        )
-
-                    # Save languages
-                    languages = result.get('languages', [])
-                    for lang in languages:
-                        database.save_speaker_language(
-                            speaker_id,
-                            language=lang.get('language'),
-                            proficiency=lang.get('proficiency'),
-                            confidence=lang.get('confidence'),
-                            source='web_search'
-                        )
-
                     refreshed_count += 1
                     total_tokens += result.get('tokens_used', 0)
                     total_cost += result.get('cost', 0)
@@ -266,10 +223,6 @@ def refresh_stale_speakers(limit=20, months=6, dry_run=False, non_interactive=Fa
                 failed_count += 1
                 print(f"✗ (Error: {str(e)[:50]})")
 
-            # Small delay to avoid rate limits
-            if i < len(stale_speakers):
-                time.sleep(0.5)
-
         print(f"\n✓ Refreshed {refreshed_count}/{len(stale_speakers)} speakers")
         print(f"Actual cost: ${total_cost:.4f}")
         print(f"Affiliation updates: {affiliation_changes}")
@@ -32,7 +32,7 @@ def main():
             print("\nCurrent database statistics:")
             print(f"  Total events: {stats['total_events']}")
             print(f"  Processed: {stats['processed_events']}")
-            print(f"  Pending: {stats['total_events'] - stats['processed_events']}")
+            print(f"  Pending: {stats['pending_events']}")
 
             # Count failed events specifically
             cursor = db.conn.cursor()
@@ -12,8 +12,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 import re
 from database import SpeakerDatabase
@@ -21,13 +24,116 @@ from database import SpeakerDatabase
 # Configure logging - writes to pipeline_debug.log file
 logger = logging.getLogger(__name__)
 if not logger.handlers:
-    handler = logging.FileHandler('pipeline_debug.log', mode='a')
+    # delay: the file is only created once something is logged
+    handler = logging.FileHandler('pipeline_debug.log', mode='a', delay=True)
     handler.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s'))
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
 
 
+# hrefs of every <a> with /events/ in its path
+_EVENT_HREFS_XPATH = etree.XPath('//a[contains(@href, "/events/")]/@href', smart_strings=False)
+
+# Patterns that capture the full date string, compiled once for every page
+_DATE_PATTERNS = [re.compile(pattern, re.I) for pattern in (
+    # Full month name: January 20, 2026
+    r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})',
+    # Abbreviated month: Jan 20, 2026 or 20 Jan 2026
+    r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4})',
+    # Day abbreviation + date: Mon 19 Jan 2026, Tue 20 Jan 2026
+    r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4})',
+    # European format: 20 January 2026 or 20 Jan 2026
+    r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4})',
+    # ISO format: 2026-01-20
+    r'(\d{4}-\d{2}-\d{2})',
+    # US format: 01/20/2026
+    r'(\d{1,2}/\d{1,2}/\d{4})',
+)]
+
+_ISO_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+# Elements with date-related classes, checked in order
+_DATE_CLASS_RE = re.compile('date', re.I)
+_EVENT_DATE_CLASS_RE = re.compile('event-date', re.I)
+_META_CLASS_RE = re.compile('meta', re.I)
+_DATE_SELECTORS = [
+    ('time', {}),
+    ('span', {'class': _DATE_CLASS_RE}),
+    ('div', {'class': _DATE_CLASS_RE}),
+    ('p', {'class': _DATE_CLASS_RE}),
+    ('span', {'class': _EVENT_DATE_CLASS_RE}),
+    ('div', {'class': _EVENT_DATE_CLASS_RE}),
+    ('span', {'class': _META_CLASS_RE}),
+    ('div', {'class': _META_CLASS_RE}),
+]
+
+
+class _BrowserPool:
+    """
+    Thread pool whose workers each drive their own browser
+
+    A WebDriver isn't thread-safe, so every worker thread lazily opens its
+    own SeleniumEventScraper; close() quits them all.
+    """
+
+    def __init__(self, base_url, headless, workers, page_delay):
+        self.base_url = base_url
+        self.headless = headless
+        self.workers = workers
+        self.page_delay = page_delay
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._local = threading.local()
+        self._scrapers = []
+        self._lock = threading.Lock()
+
+    def _fetch(self, url):
+        local = self._local
+        if not hasattr(local, 'scraper'):
+            try:
+                local.scraper = SeleniumEventScraper(base_url=self.base_url, headless=self.headless)
+            except Exception:
+                local.scraper = None
+            if local.scraper:
+                with self._lock:
+                    self._scrapers.append(local.scraper)
+        if local.scraper is None:
+            return url, None
+        html = local.scraper.fetch_page(url)
+        time.sleep(self.page_delay)  # Be polite - wait between requests
+        return url, html
+
+    def submit(self, url):
+        """Start loading url; the future resolves to (url, html or None)"""
+        return self._executor.submit(self._fetch, url)
+
+    def close(self):
+        # Drop pages nobody will read (e.g. listing pages past a stop)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for scraper in self._scrapers:
+            scraper.close()
+
+
 class SeleniumEventScraper:
+    # Pages fetched concurrently; each worker drives its own browser,
+    # so this also caps the extra Chrome instances
+    EVENT_WORKERS = 3
+
+    # Polite pause after each page load, per browser
+    PAGE_DELAY = 2
+
+    # Persist each page's full HTML in events.raw_html. Nothing downstream
+    # reads it (extraction uses body_text) and it is many times larger, so
+    # it's only worth turning on while debugging the parser.
+    STORE_RAW_HTML = False
+
+    # First path segment of an event URL is its location slug
+    # (https://asiasociety.org/<location>/events/event-name)
+    _LOCATION_SLUG_RE = re.compile(r'(?:https://asiasociety\.org/)?([^/]*)')
+
+    # Slug -> readable name, shared across instances; a crawl sees only
+    # a dozen or so distinct locations across thousands of URLs
+    _location_names = {}
+
     def __init__(self, base_url="https://asiasociety.org/events/past", headless=True):
         """
         Initialize Selenium scraper
@@ -105,12 +211,16 @@ class SeleniumEventScraper:
 
     def extract_event_links(self, html):
         """Extract event page URLs from the events listing page"""
-        soup = BeautifulSoup(html, 'html.parser')
         event_links = []
         seen_urls = set()  # For deduplication
 
-        # Find all links
-        links = soup.find_all('a', href=True)
+        # Find all links to event pages; lxml parses and runs the XPath in C,
+        # so only the candidate hrefs ever reach Python
+        try:
+            hrefs = _EVENT_HREFS_XPATH(lxml_html.fromstring(html))
+        except etree.ParserError:
+            # Empty or markup-free document
+            return event_links
 
         # Patterns to EXCLUDE (known bad links)
         exclude_patterns = [
@@ -123,13 +233,7 @@ class SeleniumEventScraper:
             '/podcast/',
         ]
 
-        for link in links:
-            href = link['href']
-
-            # Look for event-specific URLs with /events/ in path
-            if '/events/' not in href:
-                continue
-
+        for href in hrefs:
             # Convert relative URLs to absolute
             if href.startswith('http'):
                 full_url = href
@@ -167,13 +271,13 @@ class SeleniumEventScraper:
     def extract_location_from_url(self, url):
         """Extract location from URL path (e.g., /switzerland/, /new-york/)"""
         try:
-            # Parse URL: https://asiasociety.org/location/events/event-name
-            parts = url.replace('https://asiasociety.org/', '').split('/')
-            if len(parts) >= 1:
-                location_slug = parts[0]
+            location_slug = self._LOCATION_SLUG_RE.match(url).group(1)
+            location = self._location_names.get(location_slug)
+            if location is None:
                 # Convert slug to readable name
                 location = location_slug.replace('-', ' ').title()
-                return location
+                self._location_names[location_slug] = location
+            return location
         except Exception:
             pass
         return "Unknown"
@@ -184,49 +288,22 @@ class SeleniumEventScraper:
 
         Returns date string or None
         """
-        # Patterns that capture the full date string
-        date_patterns = [
-            # Full month name: January 20, 2026
-            r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})',
-            # Abbreviated month: Jan 20, 2026 or 20 Jan 2026
-            r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4})',
-            # Day abbreviation + date: Mon 19 Jan 2026, Tue 20 Jan 2026
-            r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4})',
-            # European format: 20 January 2026 or 20 Jan 2026
-            r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4})',
-            # ISO format: 2026-01-20
-            r'(\d{4}-\d{2}-\d{2})',
-            # US format: 01/20/2026
-            r'(\d{1,2}/\d{1,2}/\d{4})',
-        ]
-
         # Strategy 0: Look specifically for event-details widget (Asia Society specific)
         event_details = soup.find('div', class_='event-details-wdgt')
         if event_details:
             text = event_details.get_text(separator=' ', strip=True)
-            for pattern in date_patterns:
-                match = re.search(pattern, text, re.I)
+            for pattern in _DATE_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     return match.group(1)
 
         # Strategy 1: Look for elements with date-related classes/attributes
-        date_selectors = [
-            ('time', {}),
-            ('span', {'class': re.compile('date', re.I)}),
-            ('div', {'class': re.compile('date', re.I)}),
-            ('p', {'class': re.compile('date', re.I)}),
-            ('span', {'class': re.compile('event-date', re.I)}),
-            ('div', {'class': re.compile('event-date', re.I)}),
-            ('span', {'class': re.compile('meta', re.I)}),
-            ('div', {'class': re.compile('meta', re.I)}),
-        ]
-
-        for tag, attrs in date_selectors:
+        for tag, attrs in _DATE_SELECTORS:
             elements = soup.find_all(tag, attrs) if attrs else soup.find_all(tag)
             for elem in elements:
                 text = elem.get_text(strip=True)
-                for pattern in date_patterns:
-                    match = re.search(pattern, text, re.I)
+                for pattern in _DATE_PATTERNS:
+                    match = pattern.search(text)
                     if match:
                         return match.group(1)
 
@@ -236,7 +313,7 @@ class SeleniumEventScraper:
             datetime_attr = time_elem.get('datetime')
             if datetime_attr:
                 # Try to extract date from datetime attribute
-                date_match = re.search(r'(\d{4}-\d{2}-\d{2})', datetime_attr)
+                date_match = _ISO_DATE_RE.search(datetime_attr)
                 if date_match:
                     return date_match.group(1)
 
@@ -247,15 +324,15 @@ class SeleniumEventScraper:
             name = meta.get('name', '').lower()
             prop = meta.get('property', '').lower()
             if 'date' in name or 'date' in prop:
-                for pattern in date_patterns:
-                    match = re.search(pattern, content, re.I)
+                for pattern in _DATE_PATTERNS:
+                    match = pattern.search(content)
                     if match:
                         return match.group(1)
 
         # Strategy 4: Search entire body text for date patterns (more thorough)
         body_text = soup.get_text(separator=' ', strip=True)
-        for pattern in date_patterns:
-            match = re.search(pattern, body_text, re.I)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(body_text)
             if match:
                 return match.group(1)
 
@@ -321,6 +398,34 @@ class SeleniumEventScraper:
 
         return "Unknown Event"
 
+    def _fetch_event_pages(self, event_urls, pool):
+        """
+        Fetch event pages, yielding lists of (url, html) as they complete
+
+        html is None when a page failed to load. Without a pool the pages
+        are fetched in order on this scraper's own browser.
+        """
+        if pool is None:
+            for url in event_urls:
+                html = self.fetch_page(url)
+                time.sleep(self.PAGE_DELAY)  # Be polite - wait between requests
+                yield [(url, html)]
+            return
+
+        # Bounded window so finished pages are handed back (and saved)
+        # while later ones are still loading
+        max_in_flight = pool.workers * 2
+        in_flight = set()
+        for url in event_urls:
+            in_flight.add(pool.submit(url))
+            if len(in_flight) >= max_in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                yield [future.result() for future in done]
+
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            yield [future.result() for future in done]
+
     def parse_event_page(self, html, url):
         """Extract event information from an event page"""
         soup = BeautifulSoup(html, 'html.parser')
@@ -400,7 +505,8 @@ class SeleniumEventScraper:
         # Minimum page 30 to avoid re-scraping early pages
         return max(30, calculated_page)
 
-    def scrape_events(self, db: SpeakerDatabase, limit=None, mode='new', start_page=None, max_pages='auto'):
+    def scrape_events(self, db: SpeakerDatabase, limit=None, mode='new', start_page=None, max_pages='auto',
+                      workers=None):
         """
         Main scraping workflow with two modes:
 
@@ -420,7 +526,13 @@ class SeleniumEventScraper:
             mode: 'new' or 'historical' (default: 'new')
             start_page: Override auto-calculated start page (historical mode only)
             max_pages: Maximum pages to check ('auto' or number)
+            workers: Pages fetched concurrently (default: EVENT_WORKERS).
+                Listing pages are prefetched this many ahead, so a stop
+                condition may leave up to workers - 1 of them unread.
         """
+        if workers is None:
+            workers = self.EVENT_WORKERS
+
         # Determine starting page based on mode
         if mode == 'new':
             page = 0
@@ -441,17 +553,38 @@ class SeleniumEventScraper:
         else:
             raise ValueError(f"Invalid mode: {mode}. Must be 'new' or 'historical'")
 
+        # Started only once the arguments are valid: the finally below is
+        # what shuts its browsers down
+        pool = None
+        if workers > 1:
+            pool = _BrowserPool(self.base_url, self.headless, workers, self.PAGE_DELAY)
+        listing_pages = {}
+
+        def fetch_listing_page(page):
+            """Fetch one listing page, keeping the next few loading behind it"""
+            if pool is None:
+                return self.fetch_page(f"{self.base_url}?page={page}")
+            last = page + workers
+            if max_pages and max_pages != 'auto':
+                last = min(last, max_pages)
+            for ahead in range(page, last):
+                if ahead not in listing_pages:
+                    listing_pages[ahead] = pool.submit(f"{self.base_url}?page={ahead}")
+            return listing_pages.pop(page).result()[1]
+
         try:
-            # Fetch events from listing pages (with pagination)
+            # Fetch events from listing pages (with pagination); the set
+            # mirrors the ordered list for O(1) dedupe across pages
             all_event_links = []
+            seen_links = set()
+            new_event_links = []  # Collected links not yet in the database
 
             logger.info(f"\n1. Fetching events listing pages...")
 
-            # Get already-scraped URLs from database
-            cursor = db.conn.cursor()
-            cursor.execute('SELECT url FROM events')
-            already_scraped = set(row[0] for row in cursor.fetchall())
-            logger.info(f"   Database contains {len(already_scraped)} already-scraped events")
+            # Only count here; each page's links are checked against the
+            # events.url index below instead of loading every URL
+            events_in_db = db.conn.execute('SELECT COUNT(*) FROM events').fetchone()[0]
+            logger.info(f"   Database contains {events_in_db} already-scraped events")
 
             consecutive_empty_pages = 0
             consecutive_scraped_pages = 0  # Track pages with all already-scraped events (new mode)
@@ -461,7 +594,7 @@ class SeleniumEventScraper:
             while True:
                 page_url = f"{self.base_url}?page={page}"
                 logger.info(f"   Page {page}: {page_url}")
-                html = self.fetch_page(page_url)
+                html = fetch_listing_page(page)
 
                 if not html:
                     logger.error("   ❌ Failed to fetch page")
@@ -486,13 +619,15 @@ class SeleniumEventScraper:
                 # Reset empty page counter when we find events
                 consecutive_empty_pages = 0
 
-                new_links = [l for l in page_links if l not in all_event_links]
+                new_links = [l for l in page_links if l not in seen_links]
+                seen_links.update(new_links)
                 all_event_links.extend(new_links)
 
                 # Count how many are actually new (not in DB)
-                new_on_page = [l for l in page_links if l not in already_scraped]
-                new_unscraped = [l for l in all_event_links if l not in already_scraped]
-                logger.info(f"   Found {len(new_links)} events on page ({len(new_on_page)} new, total collected: {len(new_unscraped)})")
+                new_on_page = db.get_new_event_urls(page_links)
+                unscraped = set(new_on_page)
+                new_event_links.extend(l for l in new_links if l in unscraped)
+                logger.info(f"   Found {len(new_links)} events on page ({len(new_on_page)} new, total collected: {len(new_event_links)})")
 
                 # MODE-SPECIFIC STOP LOGIC
                 if mode == 'new':
@@ -513,17 +648,17 @@ class SeleniumEventScraper:
                     break
 
                 # For historical mode, stop when we have enough new events
-                if mode == 'historical' and limit and len(new_unscraped) >= limit:
-                    logger.info(f"   ✓ Found {len(new_unscraped)} new events, meeting limit")
+                if mode == 'historical' and limit and len(new_event_links) >= limit:
+                    logger.info(f"   ✓ Found {len(new_event_links)} new events, meeting limit")
                     break
 
                 # For auto mode, keep going until we hit consecutive empty pages
                 # (handled by consecutive_empty_pages logic above)
 
-                time.sleep(1)  # Brief pause between listing pages
+                if pool is None:
+                    time.sleep(1)  # Brief pause between listing pages
 
-            # Filter to only new events
-            new_event_links = [l for l in all_event_links if l not in already_scraped]
+            # Only new events were collected into new_event_links
             logger.info(f"\n2. Total unique events found: {len(all_event_links)} ({len(new_event_links)} new)")
 
             event_links = new_event_links
@@ -535,48 +670,50 @@ class SeleniumEventScraper:
             else:
                 logger.info(f"   Will scrape {len(event_links)} new events")
 
-            # Scrape each event
+            # Scrape each event; pages load on worker browsers while this
+            # thread parses and saves the ones already fetched
             logger.info(f"\n3. Scraping individual event pages...")
             scraped_count = 0
-
-            for i, event_url in enumerate(event_links, 1):
-                logger.info(f"\n   [{i}/{len(event_links)}]")
-
-                event_html = self.fetch_page(event_url)
-                if not event_html:
-                    logger.warning("      ⚠ Failed to fetch")
-                    continue
-
-                # Parse event data
-                event_data = self.parse_event_page(event_html, event_url)
-
-                if not event_data['body_text'] or len(event_data['body_text']) < 100:
-                    logger.warning("      ⚠ Insufficient content found")
-                    continue
-
-                # Save to database
-                try:
-                    event_id = db.add_event(
-                        url=event_data['url'],
-                        title=event_data['title'],
-                        body_text=event_data['body_text'],
-                        raw_html=event_data['raw_html'],
-                        event_date=event_data['event_date'],
-                        location=event_data['location']
-                    )
-                    logger.info(f"      ✓ Saved (Event ID: {event_id})")
-                    logger.info(f"        Title: {event_data['title'][:60]}...")
-                    logger.info(f"        Location: {event_data['location']}")
-                    if event_data['event_date']:
-                        logger.info(f"        Date: {event_data['event_date']}")
-                    logger.info(f"        Content length: {len(event_data['body_text'])} chars")
-                    scraped_count += 1
-
-                except Exception as e:
-                    logger.error(f"      ❌ Database error: {e}")
-
-                # Be polite - wait between requests
-                time.sleep(2)
+            i = 0
+
+            for group in self._fetch_event_pages(event_links, pool):
+                # One commit per group of pages that finished together
+                with db.atomic():
+                    for event_url, event_html in group:
+                        i += 1
+                        logger.info(f"\n   [{i}/{len(event_links)}] {event_url}")
+
+                        if not event_html:
+                            logger.warning("      ⚠ Failed to fetch")
+                            continue
+
+                        # Parse event data
+                        event_data = self.parse_event_page(event_html, event_url)
+
+                        if not event_data['body_text'] or len(event_data['body_text']) < 100:
+                            logger.warning("      ⚠ Insufficient content found")
+                            continue
+
+                        # Save to database
+                        try:
+                            event_id = db.add_event(
+                                url=event_data['url'],
+                                title=event_data['title'],
+                                body_text=event_data['body_text'],
+                                raw_html=event_data['raw_html'] if self.STORE_RAW_HTML else None,
+                                event_date=event_data['event_date'],
+                                location=event_data['location']
+                            )
+                            logger.info(f"      ✓ Saved (Event ID: {event_id})")
+                            logger.info(f"        Title: {event_data['title'][:60]}...")
+                            logger.info(f"        Location: {event_data['location']}")
+                            if event_data['event_date']:
+                                logger.info(f"        Date: {event_data['event_date']}")
+                            logger.info(f"        Content length: {len(event_data['body_text'])} chars")
+                            scraped_count += 1
+
+                        except Exception as e:
+                            logger.error(f"      ❌ Database error: {e}")
 
             logger.info("\n" + "="*70)
             logger.info(f"Scraping complete: {scraped_count} events saved to database")
@@ -585,7 +722,9 @@ class SeleniumEventScraper:
             return scraped_count
 
         finally:
-            # Always close the browser
+            # Always close the browsers
+            if pool is not None:
+                pool.close()
             self.close()
 
     def close(self):
@@ -620,4 +759,4 @@ if __name__ == "__main__":
         logger.info(f"\nDatabase Statistics:")
         logger.info(f"  Total events: {stats['total_events']}")
         logger.info(f"  Processed: {stats['processed_events']}")
-        logger.info(f"  Pending: {stats['total_events'] - stats['processed_events']}")
+        logger.info(f"  Pending: {stats['pending_events']}")
@@ -7,6 +7,8 @@ Saves ~50% cost and time vs running tagging and enrichment separately
 import anthropic
 import json
 import os
+import re
+import threading
 import time
 import logging
 from typing import Dict, List, Optional
@@ -18,7 +20,118 @@ from logging_config import enrichment_logger, log_with_context
 load_dotenv()
 
 
+_WHITESPACE_RE = re.compile(r'\s+')
+# No split after title-like abbreviations ("Dr.", "Mrs.", "Prof."): a
+# fragment such as "Dr." would otherwise be deduplicated on its own
+_SENTENCE_SPLIT_RE = re.compile(
+    r'(?<!\b[A-Z][a-z]\.)(?<!\b[A-Z][a-z]{2}\.)(?<!\b[A-Z][a-z]{3}\.)(?<=[.!?])\s+')
+# Only fragments this long count as sentences worth deduplicating
+_MIN_DEDUPE_WORDS = 4
+
+
+def compress_text(text: str, max_chars: int) -> str:
+    """
+    Shrink free text before it goes into a prompt (no model involved)
+
+    Collapses whitespace, drops sentences of at least _MIN_DEDUPE_WORDS words
+    repeated verbatim (scraped bios often carry the same boilerplate line more
+    than once), then cuts at the last sentence boundary within max_chars.
+    """
+    text = _WHITESPACE_RE.sub(' ', text).strip()
+
+    seen = set()
+    sentences = []
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        if sentence.count(' ') + 1 < _MIN_DEDUPE_WORDS:
+            sentences.append(sentence)
+            continue
+        key = sentence.lower()
+        if key not in seen:
+            seen.add(key)
+            sentences.append(sentence)
+    text = ' '.join(sentences)
+
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars + 1]
+    boundary = max(cut.rfind('. '), cut.rfind('! '), cut.rfind('? '))
+    if boundary >= max_chars // 2:
+        return cut[:boundary + 1]
+    return text[:max_chars].rstrip() + '…'
+
+
+class RequestPacer:
+    """
+    Spaces out calls to a rate-limited service, across threads
+
+    Each wait() reserves the next start slot at least `interval` seconds after
+    the previous one, then sleeps until it (outside the lock). With calls
+    already that far apart, wait() returns immediately.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self, interval: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class TokenBucket:
+    """
+    Tokens-per-minute budget for a rate-limited API, across threads
+
+    The bucket holds up to `per_minute` tokens and refills continuously.
+    acquire(n) reserves n tokens up front (an estimate, before the request
+    is sent) and sleeps off any shortfall, so callers queue behind earlier
+    reservations instead of learning about the limit from a 429. Once the
+    real usage is known, adjust() credits back an over-estimate.
+    """
+
+    def __init__(self, per_minute: int):
+        self.per_minute = per_minute
+        self._lock = threading.Lock()
+        self._tokens = float(per_minute)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.per_minute, self._tokens + elapsed * self.per_minute / 60)
+        self._updated = now
+
+    def acquire(self, tokens: int) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            # May go negative: the debt is what later callers wait behind
+            self._tokens -= min(tokens, self.per_minute)
+            shortfall = -self._tokens
+        if shortfall > 0:
+            time.sleep(shortfall * 60 / self.per_minute)
+
+    def adjust(self, tokens: int) -> None:
+        """Return (positive) or charge (negative) tokens after the fact"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.per_minute, self._tokens + tokens)
+
+
 class UnifiedSpeakerEnricher:
+    # Claude request and token (input + output) caps, shared by every thread
+    # using this enricher; set them to the account's rate limits
+    CLAUDE_REQUESTS_PER_MINUTE = 50
+    CLAUDE_TOKENS_PER_MINUTE = 100_000
+    EXTRACTION_MAX_TOKENS = 1500
+
+    # Prompt budget for free text (~4 chars a token); the extraction needs
+    # facts from a bio, not all of it
+    BIO_MAX_CHARS = 2000
+    SEARCH_SNIPPET_MAX_CHARS = 500
+
     def __init__(self, api_key=None):
         """Initialize with Anthropic API key"""
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
@@ -31,6 +144,10 @@ class UnifiedSpeakerEnricher:
         # Cost: $0.0008 vs $0.0096 per speaker. See ENRICHMENT_COST_OPTIMIZATION.md for details.
         self.model = "claude-3-haiku-20240307"
         self.search_delay = 1.5  # Rate limit for DuckDuckGo searches
+        # Keep those limits when fetch_enrichment runs on several threads
+        self._search_pacer = RequestPacer()
+        self._claude_pacer = RequestPacer()
+        self._claude_tokens = TokenBucket(self.CLAUDE_TOKENS_PER_MINUTE)
 
     def web_search(self, query: str, max_results: int = 5, timeout: int = 30) -> Dict:
         """
@@ -44,6 +161,7 @@ class UnifiedSpeakerEnricher:
         Returns a dictionary with search results
         """
         try:
+            self._search_pacer.wait(self.search_delay)
             with DDGS(timeout=timeout) as ddgs:
                 results = list(ddgs.text(query, max_results=max_results))
 
@@ -94,7 +212,7 @@ class UnifiedSpeakerEnricher:
             search_context = "\n\nWeb Search Results:\n"
             for i, result in enumerate(search_results[:5], 1):
                 title = result.get('title', 'No title')
-                body = result.get('body', 'No description')
+                body = compress_text(result.get('body') or 'No description', self.SEARCH_SNIPPET_MAX_CHARS)
                 search_context += f"{i}. {title}\n   {body}\n\n"
 
         # Build events context
@@ -106,13 +224,17 @@ class UnifiedSpeakerEnricher:
                 role = event[4] if len(event) > 4 else 'participant'
                 events_context += f"- {event_title} (Role: {role})\n"
 
+        bio = speaker.get('bio', 'Not available')
+        if bio:
+            bio = compress_text(bio, self.BIO_MAX_CHARS)
+
         prompt = f"""You are analyzing information about a speaker to extract comprehensive profile data.
 
 Speaker Information:
 - Name: {speaker.get('name', 'Unknown')}
 - Title: {speaker.get('title', 'Not specified')}
 - Affiliation: {speaker.get('affiliation', 'Not specified')}
-- Bio: {speaker.get('bio', 'Not available')}
+- Bio: {bio}
 {events_context}
 {search_context}
 
@@ -192,20 +314,33 @@ Return your response as a JSON object:
 Important: Return ONLY the JSON, no other text."""
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=1500,  # Increased for comprehensive extraction
-                timeout=60.0,  # 60 second timeout to prevent hanging
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            # Track token usage
-            self._last_usage = {
-                'input_tokens': message.usage.input_tokens,
-                'output_tokens': message.usage.output_tokens
-            }
+            # Throttle before sending rather than after a 429: reserve a
+            # worst-case estimate (~4 chars per input token, full output)
+            estimated_tokens = len(prompt) // 4 + self.EXTRACTION_MAX_TOKENS
+            self._claude_tokens.acquire(estimated_tokens)
+            used_tokens = 0
+            try:
+                self._claude_pacer.wait(60 / self.CLAUDE_REQUESTS_PER_MINUTE)
+                message = self.client.messages.create(
+                    model=self.model,
+                    max_tokens=self.EXTRACTION_MAX_TOKENS,  # Increased for comprehensive extraction
+                    timeout=60.0,  # 60 second timeout to prevent hanging
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                )
+
+                # Track token usage (also returned, for callers running several
+                # extractions at once where _last_usage would be shared)
+                usage = {
+                    'input_tokens': message.usage.input_tokens,
+                    'output_tokens': message.usage.output_tokens
+                }
+                self._last_usage = usage
+                used_tokens = usage['input_tokens'] + usage['output_tokens']
+            finally:
+                # Credit back what the call did not use (all of it if it failed)
+                self._claude_tokens.adjust(estimated_tokens - used_tokens)
 
             response_text = message.content[0].text.strip()
 
@@ -227,7 +362,8 @@ Important: Return ONLY the JSON, no other text."""
                 'locations': result.get('locations', []),
                 'languages': result.get('languages', []),
                 'reasoning': result.get('reasoning', ''),
-                'raw_response': response_text
+                'raw_response': response_text,
+                'usage': usage
             }
 
         except json.JSONDecodeError as e:
@@ -241,6 +377,17 @@ Important: Return ONLY the JSON, no other text."""
                 'raw_response': response_text if 'response_text' in locals() else None,
                 'is_transient': False  # JSON parsing errors are permanent
             }
+        except anthropic.RateLimitError as e:
+            return {
+                'success': False,
+                'error': f'Rate limited: {str(e)}',
+                'tags': [],
+                'demographics': {},
+                'locations': [],
+                'languages': [],
+                'raw_response': None,
+                'is_transient': True  # Retry on a later run rather than mark failed
+            }
         except anthropic.APIConnectionError as e:
             return {
                 'success': False,
@@ -275,18 +422,44 @@ Important: Return ONLY the JSON, no other text."""
                 'is_transient': False
             }
 
-    def enrich_speaker(self, speaker_id: int, db) -> Dict:
+    def enrich_speaker(self, speaker_id: int, db, speaker_row: Optional[tuple] = None) -> Dict:
         """
         Full unified enrichment workflow for a single speaker
         Extracts tags + demographics + locations + languages in ONE pass
 
+        Runs load_speaker -> fetch_enrichment -> save_enrichment. Callers that
+        enrich many speakers concurrently run fetch_enrichment (network only)
+        on worker threads and keep the other two steps on the database thread.
+
+        Args:
+            speaker_id: Speaker to enrich
+            db: SpeakerDatabase instance
+            speaker_row: The speaker's db.get_speaker_by_id() row, if the
+                caller already has it (saves re-reading it)
+
         Returns a dictionary with the enrichment result
         """
-        # Get speaker info
-        speaker_row = db.get_speaker_by_id(speaker_id)
-        if not speaker_row:
+        loaded = self.load_speaker(speaker_id, db, speaker_row)
+        if loaded is None:
             return {'success': False, 'error': 'Speaker not found'}
 
+        speaker, events = loaded
+        fetched = self.fetch_enrichment(speaker, events)
+        return self.save_enrichment(speaker_id, speaker, fetched, db)
+
+    def load_speaker(self, speaker_id: int, db, speaker_row: Optional[tuple] = None) -> Optional[tuple]:
+        """
+        Read the speaker and their events from the database
+
+        speaker_row, when given, is used in place of db.get_speaker_by_id().
+
+        Returns (speaker dict, events) or None if the speaker doesn't exist
+        """
+        if speaker_row is None:
+            speaker_row = db.get_speaker_by_id(speaker_id)
+        if not speaker_row:
+            return None
+
         speaker = {
             'speaker_id': speaker_row[0],
             'name': speaker_row[1],
@@ -298,7 +471,16 @@ Important: Return ONLY the JSON, no other text."""
 
         # Get speaker's events
         events = db.get_speaker_events(speaker_id)
+        return speaker, events
+
+    def fetch_enrichment(self, speaker: Dict, events: List) -> Dict:
+        """
+        Web search + Claude extraction for one speaker (no database access)
 
+        Safe to call from several threads at once.
+
+        Returns {'source': ..., 'extraction': extract_all_data result}
+        """
         # Perform web search
         query = self.build_search_query(speaker)
         search_result = self.web_search(query)
@@ -320,6 +502,17 @@ Important: Return ONLY the JSON, no other text."""
             search_result.get('results', [])
         )
 
+        return {'source': source, 'extraction': extraction_result}
+
+    def save_enrichment(self, speaker_id: int, speaker: Dict, fetched: Dict, db) -> Dict:
+        """
+        Save a fetch_enrichment result in one transaction
+
+        Returns a dictionary with the enrichment result
+        """
+        source = fetched['source']
+        extraction_result = fetched['extraction']
+
         if not extraction_result['success']:
             # Only mark as failed if it's a permanent error
             is_transient = extraction_result.get('is_transient', False)
@@ -347,77 +540,74 @@ Important: Return ONLY the JSON, no other text."""
             valid_genders = ['male', 'female', 'non-binary', 'unknown']
             return gender.lower() if gender and gender.lower() in valid_genders else None
 
-        # Begin transaction for atomic save
-        db.conn.execute('BEGIN')
-
+        # Save everything atomically (a savepoint if the caller is batching
+        # several speakers into one transaction)
         try:
-            # Save TAGS to database
-            tags_saved = []
-            for tag_data in extraction_result['tags']:
-                tag_text = tag_data.get('text', '')
-                confidence = tag_data.get('confidence', 0.5)
-
-                if tag_text and isinstance(tag_text, str):
-                    db.add_speaker_tag(speaker_id, tag_text[:100], confidence, source)  # Limit tag length
-                    tags_saved.append({'text': tag_text, 'confidence': confidence})
-
-            # Save DEMOGRAPHICS
-            demographics = extraction_result.get('demographics', {})
-            if demographics and any([
-                demographics.get('gender'),
-                demographics.get('nationality'),
-                demographics.get('birth_year')
-            ]):
-                validated_gender = validate_gender(demographics.get('gender'))
-                validated_nationality = validate_iso_country_code(demographics.get('nationality'))
-
-                db.save_speaker_demographics(
-                    speaker_id,
-                    gender=validated_gender,
-                    gender_confidence=demographics.get('gender_confidence'),
-                    nationality=validated_nationality,
-                    nationality_confidence=demographics.get('nationality_confidence'),
-                    birth_year=demographics.get('birth_year')
+            with db.atomic():
+                # Save TAGS to database
+                tags_saved = []
+                for tag_data in extraction_result['tags']:
+                    tag_text = tag_data.get('text', '')
+                    confidence = tag_data.get('confidence', 0.5)
+
+                    if tag_text and isinstance(tag_text, str):
+                        tags_saved.append({'text': tag_text, 'confidence': confidence})
+                db.bulk_upsert_tags(
+                    (speaker_id, tag['text'][:100], tag['confidence'], source)  # Limit tag length
+                    for tag in tags_saved
                 )
 
-            # Save LOCATIONS
-            locations = extraction_result.get('locations', [])
-            for loc in locations:
-                validated_country = validate_iso_country_code(loc.get('country'))
-                if validated_country:  # Only save if country code is valid
-                    db.save_speaker_location(
-                        speaker_id,
-                        location_type=loc.get('location_type', 'unknown'),
-                        city=loc.get('city'),
-                        country=validated_country,
-                        region=loc.get('region'),
-                        is_primary=loc.get('is_primary', False),
-                        confidence=loc.get('confidence'),
-                        source=source
-                    )
-
-            # Save LANGUAGES
-            languages = extraction_result.get('languages', [])
-            for lang in languages:
-                language_name = lang.get('language')
-                if language_name and isinstance(language_name, str):
-                    db.save_speaker_language(
+                # Save DEMOGRAPHICS
+                demographics = extraction_result.get('demographics', {})
+                if demographics and any([
+                    demographics.get('gender'),
+                    demographics.get('nationality'),
+                    demographics.get('birth_year')
+                ]):
+                    validated_gender = validate_gender(demographics.get('gender'))
+                    validated_nationality = validate_iso_country_code(demographics.get('nationality'))
+
+                    db.save_speaker_demographics(
                         speaker_id,
-                        language=language_name[:50],  # Limit language name length
-                        proficiency=lang.get('proficiency'),
-                        confidence=lang.get('confidence'),
-                        source=source
+                        gender=validated_gender,
+                        gender_confidence=demographics.get('gender_confidence'),
+                        nationality=validated_nationality,
+                        nationality_confidence=demographics.get('nationality_confidence'),
+                        birth_year=demographics.get('birth_year')
                     )
 
-            # Commit transaction - all data saved successfully
-            db.conn.commit()
+                # Save LOCATIONS (one executemany)
+                locations = extraction_result.get('locations', [])
+                location_rows = []
+                for loc in locations:
+                    validated_country = validate_iso_country_code(loc.get('country'))
+                    if validated_country:  # Only save if country code is valid
+                        location_rows.append((
+                            speaker_id,
+                            loc.get('location_type', 'unknown'),
+                            loc.get('city'),
+                            validated_country,
+                            loc.get('region'),
+                            loc.get('is_primary', False),
+                            loc.get('confidence'),
+                            source
+                        ))
+                db.bulk_insert_locations(location_rows)
+
+                # Save LANGUAGES (one executemany)
+                languages = extraction_result.get('languages', [])
+                db.bulk_upsert_languages(
+                    (speaker_id, lang['language'][:50],  # Limit language name length
+                     lang.get('proficiency'), lang.get('confidence'), source)
+                    for lang in languages
+                    if lang.get('language') and isinstance(lang['language'], str)
+                )
 
-            # Mark speaker as tagged AND enriched
-            db.mark_speaker_tagged(speaker_id, 'completed')
+                # Mark speaker as tagged AND enriched
+                db.mark_speaker_tagged(speaker_id, 'completed')
 
         except Exception as e:
-            # Rollback transaction on any database error
-            db.conn.rollback()
+            # atomic() has already rolled back this speaker's writes
             db.mark_speaker_tagged(speaker_id, 'failed')
             return {
                 'success': False,
@@ -440,28 +630,24 @@ Important: Return ONLY the JSON, no other text."""
         self,
         db,
         limit: Optional[int] = None,
-        skip_existing: bool = True
+        skip_existing: bool = True,
+        verbose: bool = True
     ) -> Dict:
         """
         Enrich all unenriched speakers with tags + demographics + locations + languages
 
+        With verbose=False nothing is printed or formatted per speaker.
+
         Returns a dictionary with batch processing results
         """
-        # Get all speakers
-        all_speakers = db.get_all_speakers()
-
-        # Filter for unenriched speakers if requested
-        speakers_to_process = []
+        # Unenriched speakers (no demographics AND no tags) if requested;
+        # filtered and limited in one query instead of two lookups per speaker
         if skip_existing:
-            for speaker_data in all_speakers:
-                speaker_id = speaker_data[0]
-                # Check if already enriched (has demographics OR tags)
-                demographics = db.get_speaker_demographics(speaker_id)
-                tags = db.get_speaker_tags(speaker_id)
-                if not demographics and not tags:
-                    speakers_to_process.append(speaker_data)
+            speakers_to_process = db.get_unenriched_speakers(limit or None)
         else:
-            speakers_to_process = all_speakers
+            speakers_to_process = db.get_all_speakers()
+            if limit:
+                speakers_to_process = speakers_to_process[:limit]
 
         if not speakers_to_process:
             return {
@@ -470,9 +656,6 @@ Important: Return ONLY the JSON, no other text."""
                 'message': 'No unenriched speakers found'
             }
 
-        if limit:
-            speakers_to_process = speakers_to_process[:limit]
-
         results = {
             'success': True,
             'total_processed': 0,
@@ -485,32 +668,32 @@ Important: Return ONLY the JSON, no other text."""
             speaker_id = speaker_data[0]
             speaker_name = speaker_data[1]
 
-            print(f"\n🔄 Enriching: {speaker_name}")
+            if verbose:
+                print(f"\n🔄 Enriching: {speaker_name}")
 
             result = self.enrich_speaker(speaker_id, db)
 
             if result['success']:
                 results['successful'] += 1
-                tags_str = ', '.join([t['text'] for t in result['tags']])
-                print(f"   ✓ Tags: {tags_str}")
-                if result.get('demographics'):
-                    gender = result['demographics'].get('gender', 'N/A')
-                    nationality = result['demographics'].get('nationality', 'N/A')
-                    print(f"   ✓ Demographics: {gender}, {nationality}")
-                if result.get('locations_count'):
-                    print(f"   ✓ Locations: {result['locations_count']}")
-                if result.get('languages_count'):
-                    print(f"   ✓ Languages: {result['languages_count']}")
+                if verbose:
+                    tags_str = ', '.join([t['text'] for t in result['tags']])
+                    print(f"   ✓ Tags: {tags_str}")
+                    if result.get('demographics'):
+                        gender = result['demographics'].get('gender', 'N/A')
+                        nationality = result['demographics'].get('nationality', 'N/A')
+                        print(f"   ✓ Demographics: {gender}, {nationality}")
+                    if result.get('locations_count'):
+                        print(f"   ✓ Locations: {result['locations_count']}")
+                    if result.get('languages_count'):
+                        print(f"   ✓ Languages: {result['languages_count']}")
             else:
                 results['failed'] += 1
-                print(f"   ✗ Error: {result['error']}")
+                if verbose:
+                    print(f"   ✗ Error: {result['error']}")
 
             results['total_processed'] += 1
             results['speakers'].append(result)
 
-            # Rate limit between searches
-            time.sleep(self.search_delay)
-
         return results
 
     def get_last_usage(self) -> Optional[Dict]:
@@ -534,14 +717,10 @@ def test_unified_enricher():
 
     # Find an unenriched speaker
     test_speaker_id = None
-    for speaker_data in all_speakers:
-        speaker_id = speaker_data[0]
-        demographics = db.get_speaker_demographics(speaker_id)
-        tags = db.get_speaker_tags(speaker_id)
-        if not demographics and not tags:
-            test_speaker_id = speaker_id
-            test_speaker_name = speaker_data[1]
-            break
+    unenriched = db.get_unenriched_speakers(limit=1)
+    if unenriched:
+        test_speaker_id = unenriched[0][0]
+        test_speaker_name = unenriched[0][1]
 
     if not test_speaker_id:
         print("All speakers already enriched! Using first speaker for testing...")
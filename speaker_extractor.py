@@ -17,8 +17,35 @@ import json
 import os
 import time
 import logging
-from typing import List, Dict, Optional
-from logging_config import extraction_logger, log_retry, log_api_call
+from typing import List, Dict, Optional, Tuple
+from logging_config import extraction_logger, log_retry, log_api_call, log_with_context
+
+
+# Prompt pieces shared by single-event and batched extraction
+SPEAKER_FIELDS = """For each person, provide:
+1. Full name
+2. Title/role (e.g., "CEO", "Professor", "Director")
+3. Affiliation/organization (full list of all organizations mentioned)
+4. Primary affiliation (single main organization for deduplication)
+5. Role in the event (e.g., "keynote speaker", "panelist", "moderator", "host")
+6. Any relevant biographical information mentioned"""
+
+SPEAKER_JSON = """{
+            "name": "Full Name",
+            "title": "Their professional title",
+            "affiliation": "All organizations they represent (comma-separated if multiple)",
+            "primary_affiliation": "Their single main/primary organization",
+            "role_in_event": "Their role in this specific event",
+            "bio": "Any biographical information mentioned"
+        }"""
+
+SPEAKER_GUIDELINES = """Important guidelines:
+- Only include people who are SPEAKERS/PARTICIPANTS in the event, not people who are just mentioned in passing
+- If title, affiliation, or bio information is not mentioned, use null for that field
+- primary_affiliation should be ONE organization (the most relevant/current one) for deduplication purposes
+- Be thorough - extract all participants, not just the main speakers
+- If someone has multiple roles (e.g., "moderator and panelist"), include both in role_in_event
+- Return ONLY the JSON, no other text"""
 
 
 class SpeakerExtractor:
@@ -31,6 +58,12 @@ class SpeakerExtractor:
     from small single-speaker talks to large multi-panel conferences.
     """
 
+    # Events share a call in extract_speakers_batch while their combined
+    # text stays within this (the size one event gets a standard budget
+    # for), so a full batch's reply fits its token budget; a longer event
+    # keeps its own call
+    BATCH_MAX_CHARS = 30000
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the speaker extractor with Anthropic API credentials.
@@ -90,6 +123,7 @@ class SpeakerExtractor:
                 ],
                 'event_summary': str,  # Only present if success=True
                 'raw_response': str,
+                'usage': {'input_tokens': int, 'output_tokens': int},  # Once Claude replied
                 'error': str  # Only present if success=False
             }
 
@@ -104,50 +138,180 @@ Event Title: {event_title}
 Event Description:
 {event_text}
 
-Please extract ALL speakers/participants mentioned in this event description. For each person, provide:
-1. Full name
-2. Title/role (e.g., "CEO", "Professor", "Director")
-3. Affiliation/organization (full list of all organizations mentioned)
-4. Primary affiliation (single main organization for deduplication)
-5. Role in the event (e.g., "keynote speaker", "panelist", "moderator", "host")
-6. Any relevant biographical information mentioned
+Please extract ALL speakers/participants mentioned in this event description. {SPEAKER_FIELDS}
 
 Return your response as a JSON object with this structure:
 {{
     "speakers": [
-        {{
-            "name": "Full Name",
-            "title": "Their professional title",
-            "affiliation": "All organizations they represent (comma-separated if multiple)",
-            "primary_affiliation": "Their single main/primary organization",
-            "role_in_event": "Their role in this specific event",
-            "bio": "Any biographical information mentioned"
-        }}
+        {SPEAKER_JSON}
     ],
     "event_summary": "Brief 1-2 sentence summary of what this event was about"
 }}
 
-Important guidelines:
-- Only include people who are SPEAKERS/PARTICIPANTS in the event, not people who are just mentioned in passing
-- If title, affiliation, or bio information is not mentioned, use null for that field
-- primary_affiliation should be ONE organization (the most relevant/current one) for deduplication purposes
-- Be thorough - extract all participants, not just the main speakers
-- If someone has multiple roles (e.g., "moderator and panelist"), include both in role_in_event
-- Return ONLY the JSON, no other text"""
+{SPEAKER_GUIDELINES}"""
+
+        message, error = self._create_message(prompt, self._max_tokens(len(event_text)))
+        if error:
+            return error
+
+        try:
+            # Track token usage for cost monitoring and debugging
+            # Input tokens = prompt length, Output tokens = response length
+            # (also returned, for callers running several extractions at
+            # once where _last_usage would be shared)
+            usage = {
+                'input_tokens': message.usage.input_tokens,
+                'output_tokens': message.usage.output_tokens
+            }
+            self._last_usage = usage
+
+            response_text = self._response_text(message)
+
+            # Parse JSON response into structured data
+            result = json.loads(response_text)
+
+            return {
+                'success': True,
+                'speakers': result.get('speakers', []),
+                'event_summary': result.get('event_summary', ''),
+                'raw_response': response_text,
+                'usage': usage
+            }
+
+        except json.JSONDecodeError as e:
+            # Claude returned invalid JSON - this is rare but can happen if the
+            # response was truncated due to max_tokens limit or if Claude misunderstood
+            # the prompt format
+            return {
+                'success': False,
+                'error': f'Failed to parse JSON response: {str(e)}',
+                'raw_response': response_text if 'response_text' in locals() else None,
+                'usage': usage
+            }
 
+        except Exception as e:
+            # Catch-all for unexpected errors (network issues, response processing errors, etc.)
+            return {
+                'success': False,
+                'error': f'Unexpected error: {type(e).__name__}: {str(e)}',
+                'raw_response': None
+            }
+    
+    def extract_speakers_batch(self, items: List[Tuple[str, str]]) -> List[Dict]:
+        """
+        Extract speakers from several short events with one Claude call.
+
+        The events go into one prompt as numbered sections and Claude answers
+        with one entry per event, so the request overhead is paid once per
+        batch rather than once per event. Meant for events of at most
+        BATCH_MAX_CHARS combined; the response budget is the sum of the
+        per-event budgets, capped at 8,000 tokens.
+
+        An event missing from the reply (or every event, if the reply is not
+        valid JSON) is extracted again on its own with extract_speakers.
+
+        Args:
+            items: List of (event_title, event_text) tuples
+
+        Returns:
+            List of extract_speakers results, one per item and in order. The
+            batch call's token usage is added to the first result's usage,
+            so summing usage over the results counts every call once.
+        """
+        if len(items) == 1:
+            return [self.extract_speakers(*items[0])]
+
+        sections = '\n\n'.join(
+            f"=== EVENT {index} ===\nEvent Title: {title}\n\nEvent Description:\n{text}"
+            for index, (title, text) in enumerate(items)
+        )
+        prompt = f"""You are analyzing {len(items)} event descriptions to extract information about speakers, panelists, moderators, and other participants.
+
+{sections}
+
+=== END OF EVENTS ===
+
+For EACH event, extract ALL speakers/participants mentioned in that event's description. {SPEAKER_FIELDS}
+
+Return your response as a JSON object with one entry per event, in event order:
+{{
+    "events": [
+        {{
+            "event": 0,
+            "speakers": [
+                {SPEAKER_JSON}
+            ],
+            "event_summary": "Brief 1-2 sentence summary of what this event was about"
+        }}
+    ]
+}}
+
+{SPEAKER_GUIDELINES}
+- Keep every speaker under the "event" number of the event they appear in"""
+
+        max_tokens = min(sum(self._max_tokens(len(text)) for _, text in items), 8000)
+        message, error = self._create_message(prompt, max_tokens)
+        if error:
+            return [dict(error) for _ in items]
+
+        usage = {
+            'input_tokens': message.usage.input_tokens,
+            'output_tokens': message.usage.output_tokens
+        }
+        self._last_usage = usage
+
+        entries = {}
+        response_text = None
+        try:
+            response_text = self._response_text(message)
+            for position, entry in enumerate(json.loads(response_text).get('events', [])):
+                entries[entry.get('event', position)] = entry
+        except (json.JSONDecodeError, AttributeError, TypeError) as e:
+            log_with_context(extraction_logger, logging.WARNING,
+                             "Batch response unusable, extracting events one by one",
+                             events=len(items), error=str(e))
+            entries = {}
+
+        results = []
+        for index, (title, text) in enumerate(items):
+            entry = entries.get(index)
+            if entry is None:
+                results.append(self.extract_speakers(title, text))
+                continue
+            results.append({
+                'success': True,
+                'speakers': entry.get('speakers') or [],
+                'event_summary': entry.get('event_summary', ''),
+                'raw_response': response_text
+            })
+
+        first_usage = results[0].get('usage') or {}
+        results[0]['usage'] = {key: value + first_usage.get(key, 0) for key, value in usage.items()}
+        return results
+
+    @staticmethod
+    def _max_tokens(event_size: int) -> int:
+        """Response token budget for an event of event_size characters"""
         # Dynamically scale max_tokens based on event size
         # Reasoning: Large multi-panel events with 20-50 speakers need more tokens
         # to return complete JSON. Claude needs ~100 tokens per speaker on average.
         # We've seen events with 80k+ characters that have 50+ speakers, requiring
         # up to 8k tokens for the full response.
-        event_size = len(event_text)
         if event_size > 80000:
-            max_tokens = 8000  # Very large multi-panel events (50+ speakers possible)
+            return 8000  # Very large multi-panel events (50+ speakers possible)
         elif event_size > 30000:
-            max_tokens = 4000  # Medium-large events (15-25 speakers typical)
+            return 4000  # Medium-large events (15-25 speakers typical)
         else:
-            max_tokens = 2000  # Standard events (5-10 speakers typical)
+            return 2000  # Standard events (5-10 speakers typical)
+
+    def _create_message(self, prompt: str, max_tokens: int):
+        """
+        Send one prompt to Claude, retrying transient failures.
 
+        Returns:
+            (message, None) on success, or (None, error result) in the
+            extract_speakers failure shape
+        """
         # Retry logic for API resilience at scale
         # Handles transient failures and rate limits with exponential backoff (1s, 2s, 4s)
         max_retries = 3
@@ -173,7 +337,7 @@ Important guidelines:
                     time.sleep(wait_time)
                     continue
                 # Final attempt failed, return error
-                return {
+                return None, {
                     'success': False,
                     'error': f'Rate limit exceeded after {max_retries} attempts: {str(e)}',
                     'raw_response': None,
@@ -189,7 +353,7 @@ Important guidelines:
                     time.sleep(wait_time)
                     continue
                 # Final attempt failed
-                return {
+                return None, {
                     'success': False,
                     'error': f'Connection error after {max_retries} attempts: {str(e)}',
                     'raw_response': None,
@@ -204,7 +368,7 @@ Important guidelines:
                             error="Timeout", wait_time_s=wait_time)
                     time.sleep(wait_time)
                     continue
-                return {
+                return None, {
                     'success': False,
                     'error': f'Timeout after {max_retries} attempts: {str(e)}',
                     'raw_response': None,
@@ -221,7 +385,7 @@ Important guidelines:
                     time.sleep(wait_time)
                     continue
                 # 4xx error or final attempt failed, return error
-                return {
+                return None, {
                     'success': False,
                     'error': f'API error (status {status_code}): {str(e)}',
                     'raw_response': None,
@@ -230,65 +394,34 @@ Important guidelines:
 
         # If we got here without a message, something unexpected went wrong
         if message is None:
-            return {
+            return None, {
                 'success': False,
                 'error': 'API call failed after retries without raising exception',
                 'raw_response': None
             }
 
-        try:
-            # Track token usage for cost monitoring and debugging
-            # Input tokens = prompt length, Output tokens = response length
-            self._last_usage = {
-                'input_tokens': message.usage.input_tokens,
-                'output_tokens': message.usage.output_tokens
-            }
-
-            # Extract the response text
-            response_text = message.content[0].text
-
-            # Claude sometimes wraps JSON in markdown code fences (```json ... ```)
-            # We need to strip these before parsing
-            response_text = response_text.strip()
-            if response_text.startswith('```'):
-                # Remove first line (```json or ```)
-                lines = response_text.split('\n')
-                response_text = '\n'.join(lines[1:])
-            if response_text.endswith('```'):
-                # Remove last line (```)
-                lines = response_text.split('\n')
-                response_text = '\n'.join(lines[:-1])
-
-            response_text = response_text.strip()
+        return message, None
 
-            # Parse JSON response into structured data
-            result = json.loads(response_text)
+    @staticmethod
+    def _response_text(message) -> str:
+        """Claude's reply text with any markdown code fence removed"""
+        # Extract the response text
+        response_text = message.content[0].text
 
-            return {
-                'success': True,
-                'speakers': result.get('speakers', []),
-                'event_summary': result.get('event_summary', ''),
-                'raw_response': response_text
-            }
+        # Claude sometimes wraps JSON in markdown code fences (```json ... ```)
+        # We need to strip these before parsing
+        response_text = response_text.strip()
+        if response_text.startswith('```'):
+            # Remove first line (```json or ```)
+            lines = response_text.split('\n')
+            response_text = '\n'.join(lines[1:])
+        if response_text.endswith('```'):
+            # Remove last line (```)
+            lines = response_text.split('\n')
+            response_text = '\n'.join(lines[:-1])
 
-        except json.JSONDecodeError as e:
-            # Claude returned invalid JSON - this is rare but can happen if the
-            # response was truncated due to max_tokens limit or if Claude misunderstood
-            # the prompt format
-            return {
-                'success': False,
-                'error': f'Failed to parse JSON response: {str(e)}',
-                'raw_response': response_text if 'response_text' in locals() else None
-            }
+        return response_text.strip()
 
-        except Exception as e:
-            # Catch-all for unexpected errors (network issues, response processing errors, etc.)
-            return {
-                'success': False,
-                'error': f'Unexpected error: {type(e).__name__}: {str(e)}',
-                'raw_response': None
-            }
-    
     def batch_extract_speakers(self, events: List[tuple]) -> List[Dict]:
         """
         Process multiple events sequentially, extracting speakers from each.
@@ -5,7 +5,7 @@ Combines semantic embeddings with structured filters and ranking
 
 from typing import List, Dict, Optional, Tuple
 from database import SpeakerDatabase
-from embedding_engine import EmbeddingEngine
+from embedding_engine import EmbeddingEngine, SimilarityIndex
 from query_parser import QueryParser
 import numpy as np
 
@@ -21,7 +21,12 @@ class SpeakerSearch:
         """
         self.db = SpeakerDatabase(db_path)
         self.engine = EmbeddingEngine(provider=provider)
+        # Repeated queries reuse their embedding instead of calling the API
+        self.engine.query_cache_store = self.db
         self.parser = QueryParser()
+        # Built on first semantic search, reused until an embedding changes
+        self._similarity_index = None
+        self._similarity_index_version = None
 
     def search(
         self,
@@ -137,23 +142,14 @@ class SpeakerSearch:
             # Generate query embedding
             query_embedding = self.engine.generate_query_embedding(query_text)
 
-            # Get all speaker embeddings
-            all_embeddings = self.db.get_all_embeddings()
-
-            if not all_embeddings:
+            similarity_index = self._get_similarity_index()
+            if similarity_index is None:
                 # No embeddings available, return all speakers
                 return self._get_all_speakers_data()
 
-            # Deserialize embeddings
-            candidate_embeddings = [
-                (speaker_id, self.engine.deserialize_embedding(emb_blob))
-                for speaker_id, emb_blob in all_embeddings
-            ]
-
             # Search by similarity
-            similar_speakers = self.engine.search_by_similarity(
+            similar_speakers = similarity_index.search(
                 query_embedding,
-                candidate_embeddings,
                 top_k=candidate_count
             )
 
@@ -181,6 +177,40 @@ class SpeakerSearch:
             # Otherwise return all speakers for filtering
             return self._get_all_speakers_data()
 
+    def _get_similarity_index(self) -> Optional[SimilarityIndex]:
+        """
+        Return a similarity index over all speaker embeddings
+
+        The index is cached and only rebuilt after a stored embedding has
+        changed, so repeated searches skip loading the embeddings again.
+
+        Returns:
+            SimilarityIndex, or None if there are no embeddings
+        """
+        version = self.db.get_counters().get('embedding_writes')
+        if self._similarity_index is not None and self._similarity_index_version == version:
+            return self._similarity_index
+
+        # Prefer the memory-mapped embedding matrix (one contiguous read,
+        # rows already unit length); fall back to decoding the BLOB rows
+        # if it is missing or stale
+        embedding_matrix = self.db.get_embedding_matrix()
+
+        if embedding_matrix is not None:
+            ids, matrix = embedding_matrix
+        else:
+            all_embeddings = self.db.get_all_embeddings()
+            if not all_embeddings:
+                return None
+
+            # Decode embeddings into one normalized matrix (rows saved
+            # before embeddings were stored normalized need it)
+            ids, matrix = self.engine.decode_candidate_matrix(all_embeddings)
+
+        self._similarity_index = SimilarityIndex(ids, matrix)
+        self._similarity_index_version = version
+        return self._similarity_index
+
     def _score_and_rank(
         self,
         candidates: List[Dict],
@@ -251,27 +251,29 @@ Return ONLY the JSON, no other text."""
                 'speaker_name': speaker['name']
             }
 
-        # Save tags to database
         tags_saved = []
         for tag_data in tag_result['tags']:
             tag_text = tag_data.get('text', '')
             confidence = tag_data.get('confidence', 0.5)
 
             if tag_text:
-                db.add_speaker_tag(speaker_id, tag_text, confidence, source)
                 tags_saved.append({'text': tag_text, 'confidence': confidence})
 
         # Save enriched data if available
         enriched_title = tag_result.get('enriched_title')
         enriched_bio = tag_result.get('enriched_bio')
+        enrichment_applied = bool(enriched_title or enriched_bio)
 
-        enrichment_applied = False
-        if enriched_title or enriched_bio:
-            db.enrich_speaker_data(speaker_id, enriched_title, enriched_bio)
-            enrichment_applied = True
+        # Tags, enriched fields and status in one transaction (one commit)
+        with db.atomic():
+            db.bulk_upsert_tags(
+                (speaker_id, tag['text'], tag['confidence'], source) for tag in tags_saved
+            )
+            if enrichment_applied:
+                db.enrich_speaker_data(speaker_id, enriched_title, enriched_bio)
 
-        # Mark speaker as tagged
-        db.mark_speaker_tagged(speaker_id, 'completed')
+            # Mark speaker as tagged
+            db.mark_speaker_tagged(speaker_id, 'completed')
 
         return {
             'success': True,
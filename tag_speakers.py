@@ -9,21 +9,14 @@ Enrichment includes:
 
 import os
 import argparse
+from dotenv import load_dotenv
 from database import SpeakerDatabase
 from speaker_tagger import SpeakerTagger
 
 
 def load_api_key():
     """Load API key from .env file or environment"""
-    if os.path.exists('.env'):
-        with open('.env', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('ANTHROPIC_API_KEY='):
-                    key = line.split('=', 1)[1].strip()
-                    os.environ['ANTHROPIC_API_KEY'] = key
-                    return key
-
+    load_dotenv()  # No-op when there's no .env file
     return os.getenv('ANTHROPIC_API_KEY')
 
 
@@ -14,10 +14,11 @@ Covers:
 - Search logging
 """
 
+import json
 import pytest
 import sqlite3
 from datetime import datetime
-from database import SpeakerDatabase, normalize_name
+from database import SpeakerDatabase, SpeakerDatabasePool, normalize_name
 
 
 # ── normalize_name ──────────────────────────────────────────────────────
@@ -90,11 +91,89 @@ class TestDatabaseInit:
         }
         assert expected.issubset(tables)
 
+    def test_write_connection_is_tuned(self, db):
+        """Writers (pipeline, freshness, embeddings) run under WAL + NORMAL."""
+        cursor = db.conn.cursor()
+        assert cursor.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        assert cursor.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+        assert cursor.execute('PRAGMA temp_store').fetchone()[0] == 2  # MEMORY
+        assert cursor.execute('PRAGMA cache_size').fetchone()[0] == -65536
+
+    def test_refresh_queue_uses_partial_index(self, db):
+        """The refresh queue is an index seek, not a scan plus sort."""
+        plan = db.conn.execute('''
+            EXPLAIN QUERY PLAN
+            SELECT speaker_id FROM speaker_freshness
+            WHERE needs_refresh = 1 ORDER BY priority_score DESC LIMIT 10
+        ''').fetchall()
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_freshness_refresh" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_close_refreshes_planner_statistics(self, tmp_path):
+        """Connections that wrote rows run PRAGMA optimize on close."""
+        db_path = str(tmp_path / "optimize.db")
+        database = SpeakerDatabase(db_path)
+        database.add_speaker(name="Writer")
+        statements = []
+        database.conn.set_trace_callback(statements.append)
+        database.close()
+        assert 'PRAGMA optimize' in statements
+
+        untouched = SpeakerDatabase(db_path)
+        untouched.get_statistics()
+        statements.clear()
+        untouched.conn.set_trace_callback(statements.append)
+        untouched.close()
+        assert statements == []
+
+        reader = SpeakerDatabase(db_path, read_only=True)
+        statements.clear()
+        reader.conn.set_trace_callback(statements.append)
+        reader.close()
+        assert statements == []
+
     def test_idempotent_init(self, db):
         """Calling init_database multiple times should not raise errors."""
         db.init_database()
         db.init_database()
 
+    def test_migrates_rowid_tables_to_without_rowid(self, tmp_path):
+        """Old rowid speaker_tags/speaker_languages are rebuilt in place."""
+        db_path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript('''
+            CREATE TABLE speaker_tags (
+                tag_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                speaker_id INTEGER NOT NULL, tag_text TEXT NOT NULL,
+                confidence_score REAL, source TEXT, created_at TEXT,
+                UNIQUE(speaker_id, tag_text)
+            );
+            CREATE TABLE speaker_languages (
+                language_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                speaker_id INTEGER NOT NULL, language TEXT NOT NULL,
+                proficiency TEXT, confidence REAL, source TEXT, created_at TEXT NOT NULL
+            );
+            INSERT INTO speaker_tags (speaker_id, tag_text, confidence_score)
+                VALUES (1, 'trade', 0.9), (1, 'climate', 0.8), (2, 'trade', 0.7);
+            INSERT INTO speaker_languages (speaker_id, language, proficiency, created_at)
+                VALUES (1, 'English', 'fluent', 'a'), (1, 'English', 'native', 'b');
+        ''')
+        conn.close()
+
+        with SpeakerDatabase(db_path) as database:
+            cursor = database.conn.cursor()
+            for table in ('speaker_tags', 'speaker_languages'):
+                cursor.execute("SELECT sql FROM sqlite_master WHERE name = ?", (table,))
+                assert 'WITHOUT ROWID' in cursor.fetchone()[0]
+            assert len(database.get_speaker_tags(1)) == 2
+            assert database.get_speaker_languages(1) == [('English', 'native', None, None, 'b')]
+            assert database.get_counters()['total_tags'] == 3
+
+            # Counter triggers are re-attached to the rebuilt table
+            database.add_speaker_tag(3, "energy")
+            assert database.get_counters()['tagged_speakers'] == 3
+
     def test_context_manager(self, tmp_path):
         """SpeakerDatabase should work as a context manager if supported."""
         db_path = str(tmp_path / "ctx_test.db")
@@ -121,6 +200,20 @@ class TestEventCRUD:
         id2 = db.add_event(url="https://example.com/dup", title="Second", body_text="Other text")
         assert id1 == id2
 
+    def test_get_existing_event_urls(self, db):
+        db.add_event(url="https://example.com/a", title="A", body_text="Text")
+        db.add_event(url="https://example.com/b", title="B", body_text="Text")
+
+        candidates = ["https://example.com/a", "https://example.com/new"]
+        assert db.get_existing_event_urls(candidates) == {"https://example.com/a"}
+        assert db.get_existing_event_urls([]) == set()
+
+    def test_get_new_event_urls(self, db):
+        db.add_event(url="https://example.com/a", title="A", body_text="x")
+        candidates = ["https://example.com/c", "https://example.com/a", "https://example.com/b"]
+        assert db.get_new_event_urls(candidates) == ["https://example.com/c", "https://example.com/b"]
+        assert db.get_new_event_urls([]) == []
+
     def test_add_event_with_all_fields(self, db):
         event_id = db.add_event(
             url="https://example.com/full",
@@ -165,6 +258,18 @@ class TestEventCRUD:
         events = db.get_unprocessed_events(max_attempts=3)
         assert len(events) == 0
 
+    def test_iter_unprocessed_events_survives_writes_while_streaming(self, db):
+        for i in range(7):
+            db.add_event(url=f"https://example.com/e{i}", title=f"E{i}", body_text="Text")
+
+        seen = []
+        for event_id, url, title, body_text in db.iter_unprocessed_events(batch_size=3):
+            seen.append(event_id)
+            db.mark_event_processed(event_id, status='completed')
+
+        assert len(seen) == len(set(seen)) == 7
+        assert db.get_unprocessed_events() == []
+
     def test_mark_event_processed(self, db):
         e1 = db.add_event(url="https://example.com/e1", title="E1", body_text="Text")
         db.mark_event_processed(e1, status='completed')
@@ -244,6 +349,18 @@ class TestSpeakerCRUD:
         speaker = db.get_speaker_by_id(99999)
         assert speaker is None
 
+    def test_enrich_speaker_data_keeps_unset_fields(self, db):
+        sid = db.add_speaker(name="Jane Smith", title="Analyst")
+        db.enrich_speaker_data(sid, enriched_bio="Economist focused on trade.")
+        speaker = db.get_speaker_by_id(sid)
+        assert speaker[2] == "Analyst"
+        assert speaker[5] == "Economist focused on trade."
+
+        db.enrich_speaker_data(sid, enriched_title="Chief Economist")
+        speaker = db.get_speaker_by_id(sid)
+        assert speaker[2] == "Chief Economist"
+        assert speaker[5] == "Economist focused on trade."
+
 
 # ── Speaker Deduplication ───────────────────────────────────────────────
 
@@ -345,6 +462,48 @@ class TestEventSpeakerLinking:
         speakers = db.get_event_speakers(e_id)
         assert len(speakers) == 1
 
+    def test_link_speakers_to_event_bulk_upserts(self, db):
+        e_id = db.add_event(url="https://ex.com/e1", title="E1", body_text="T")
+        s1 = db.add_speaker(name="Speaker 1")
+        s2 = db.add_speaker(name="Speaker 2")
+        db.link_speaker_to_event(e_id, s1, role_in_event="panelist")
+
+        db.link_speakers_to_event(e_id, [(s1, "moderator", '{"a": 1}'), (s2, "keynote", None)])
+
+        rows = db.conn.execute(
+            'SELECT speaker_id, role_in_event, extracted_info FROM event_speakers ORDER BY speaker_id'
+        ).fetchall()
+        assert rows == [(s1, "moderator", '{"a": 1}'), (s2, "keynote", None)]
+
+    def test_extraction_writes_roll_back_together(self, db):
+        e_id = db.add_event(url="https://ex.com/e1", title="E1", body_text="T")
+        with pytest.raises(RuntimeError):
+            with db.atomic():
+                s_id = db.add_speaker(name="Speaker 1")
+                db.link_speakers_to_event(e_id, [(s_id, "panelist", None)])
+                db.mark_event_processed(e_id)
+                raise RuntimeError("boom")
+
+        assert db.get_statistics()['total_speakers'] == 0
+        assert db.get_event_speakers(e_id) == []
+        assert len(db.get_unprocessed_events()) == 1
+
+    def test_save_extracted_speakers(self, db):
+        e_id = db.add_event(url="https://ex.com/e1", title="E1", body_text="T")
+        speakers = [{'name': "Zoë Li", 'role_in_event': "keynote", 'primary_affiliation': "Asia Society"},
+                    {'name': "Speaker 2"}]
+
+        ids = db.save_extracted_speakers(e_id, speakers)
+
+        assert len(ids) == 2
+        assert {row[0] for row in db.get_event_speakers(e_id)} == set(ids)
+        info = db.conn.execute(
+            'SELECT extracted_info FROM event_speakers WHERE speaker_id = ?', (ids[0],)
+        ).fetchone()[0]
+        assert json.loads(info) == speakers[0] and "Zoë" in info
+        assert db.get_unprocessed_events() == []
+        assert not db.conn.in_transaction
+
     def test_get_speaker_events(self, db_with_data):
         db, data = db_with_data
         # Jane Smith (s1) is linked to e1 and e2
@@ -378,6 +537,68 @@ class TestSpeakerTags:
         tags = db.get_speaker_tags(sid)
         assert len(tags) == 1
 
+    def test_bulk_upsert_tags(self, db):
+        s1 = db.add_speaker(name="Speaker 1")
+        s2 = db.add_speaker(name="Speaker 2")
+        db.add_speaker_tag(s1, "trade")
+
+        inserted = db.bulk_upsert_tags([
+            (s1, " Trade ", 0.9, "web_search"),  # normalizes to an existing tag
+            (s1, "Economics", 0.8, "web_search"),
+            (s2, "climate", 0.7, "bio_only"),
+        ])
+        assert inserted == 2
+        assert sorted(t[0] for t in db.get_speaker_tags(s1)) == ["economics", "trade"]
+        assert db.get_counters()['tagged_speakers'] == 2
+        assert not db.conn.in_transaction
+        assert db.bulk_upsert_tags([]) == 0
+
+    def test_get_enrichment_counts(self, db):
+        both = db.add_speaker(name="Both")
+        tagged = db.add_speaker(name="Tagged")
+        db.add_speaker(name="Plain")
+        db.add_speaker_tag(both, "trade")
+        db.add_speaker_tag(both, "economics")
+        db.add_speaker_tag(tagged, "climate")
+        db.save_speaker_demographics(both, gender="female")
+        db.save_speaker_location(both, "residence", country="US")
+        db.save_speaker_location(both, "birth", country="CN")
+        db.save_speaker_language(tagged, "English")
+
+        assert db.get_enrichment_counts() == {
+            'total_speakers': 3,
+            'tagged_speakers': 2,
+            'with_demographics': 1,
+            'with_locations': 1,
+            'with_languages': 1,
+            'fully_enriched': 1,
+            'remaining': 1,
+        }
+
+    def test_analyze_populates_planner_stats(self, db):
+        speaker_id = db.add_speaker(name="Analyzed")
+        db.add_speaker_tag(speaker_id, "trade")
+        db.save_speaker_location(speaker_id, "residence", country="US")
+
+        db.analyze()
+
+        tables = {row[0] for row in db.conn.execute('SELECT tbl FROM sqlite_stat1')}
+        assert {'speaker_tags', 'speaker_locations'} <= tables
+        assert not db.conn.in_transaction
+
+    def test_get_unenriched_speakers(self, db):
+        tagged = db.add_speaker(name="Tagged Speaker")
+        profiled = db.add_speaker(name="Profiled Speaker")
+        plain_b = db.add_speaker(name="Plain B")
+        plain_a = db.add_speaker(name="Plain A")
+        db.add_speaker_tag(tagged, "economics")
+        db.save_speaker_demographics(profiled, gender="female")
+
+        rows = db.get_unenriched_speakers()
+        assert [r[0] for r in rows] == [plain_a, plain_b]
+        assert len(rows[0]) == len(db.get_all_speakers()[0])
+        assert [r[0] for r in db.get_unenriched_speakers(limit=1)] == [plain_a]
+
     def test_get_untagged_speakers(self, db):
         s1 = db.add_speaker(name="Tagged Speaker")
         s2 = db.add_speaker(name="Untagged Speaker")
@@ -419,6 +640,171 @@ class TestSpeakerEmbeddings:
 
         assert db.count_embeddings() == 2
 
+    def test_save_many_embeddings_upserts(self, db):
+        s1 = db.add_speaker(name="Speaker 1")
+        s2 = db.add_speaker(name="Speaker 2")
+        db.save_speaker_embedding(s1, b'\x00', "old", model="test")
+
+        db.save_speaker_embeddings([(s1, b'\x01', "new"), (s2, b'\x02', "t2")], model="m2")
+
+        assert db.count_embeddings() == 2
+        assert db.get_speaker_embedding(s1)[:3] == (b'\x01', "new", "m2")
+        assert not db.conn.in_transaction
+
+    def test_iter_speakers_for_embedding_matches_per_speaker_queries(self, db_with_data):
+        db, ids = db_with_data
+        s1, s2 = ids['speakers']['s1'], ids['speakers']['s2']
+        db.add_speaker_tag(s1, "climate", confidence=0.5)
+        db.add_speaker_tag(s1, "policy", confidence=0.9)
+        db.save_speaker_embedding(s2, b'\x00', "t", model="test")
+
+        rows = list(db.iter_speakers_for_embedding())
+        assert [row[0] for row in rows] == [s1, ids['speakers']['s3']]
+        assert db.count_speakers_for_embedding() == 2
+        speaker_id, *_, tags, events = rows[0]
+        assert tags == [row[0] for row in db.get_speaker_tags(s1)]
+        assert events == [e[1:] for e in db.get_speaker_events_with_descriptions(s1)]
+
+        assert len(list(db.iter_speakers_for_embedding(missing_only=False, limit=2))) == 2
+        assert db.count_speakers_for_embedding(missing_only=False) == 3
+
+    def test_iter_speakers_for_embedding_truncates_in_sql(self, db):
+        sid = db.add_speaker(name="Speaker 1", bio="b" * 50)
+        for n in range(4):
+            event_id = db.add_event(url=f"https://example.com/e{n}", title=f"E{n}",
+                                    body_text="x" * 30, event_date=f"2024-01-0{n + 1}")
+            db.link_speaker_to_event(event_id, sid)
+
+        (row,) = db.iter_speakers_for_embedding(bio_chars=10, max_events=2, event_chars=5)
+
+        assert row[0] == sid
+        assert row[5] == "b" * 10
+        assert row[7] == [("E3", None, "x" * 5), ("E2", None, "x" * 5)]
+
+    def test_get_embedded_speaker_ids(self, db):
+        s1 = db.add_speaker(name="Speaker 1")
+        s2 = db.add_speaker(name="Speaker 2")
+        db.save_speaker_embedding(s1, b'\x00', "t1", model="test")
+
+        assert db.get_embedded_speaker_ids([s1, s2, 999]) == {s1}
+        assert db.get_embedded_speaker_ids([]) == set()
+        assert db.get_embedded_speaker_ids([s1, s2], model="other") == set()
+
+    def test_speakers_for_embedding_include_other_models(self, db):
+        s1 = db.add_speaker(name="Speaker 1")
+        s2 = db.add_speaker(name="Speaker 2")
+        db.save_speaker_embedding(s1, b'\x00', "t1", model="old")
+        db.save_speaker_embedding(s2, b'\x00', "t2", model="new")
+
+        assert [row[0] for row in db.iter_speakers_for_embedding(model="new")] == [s1]
+        assert db.count_speakers_for_embedding(model="new") == 1
+        assert db.count_speakers_for_embedding() == 0
+
+    def test_embedding_matrix_round_trip(self, db):
+        import pickle
+        import numpy as np
+        s1 = db.add_speaker(name="Speaker 1")
+        s2 = db.add_speaker(name="Speaker 2")
+        db.save_speaker_embedding(s2, pickle.dumps(np.array([0.0, 1.0])), "t2", model="test")
+        db.save_speaker_embedding(s1, pickle.dumps(np.array([1.0, 0.0])), "t1", model="test")
+
+        # No matrix file yet
+        assert db.get_embedding_matrix() is None
+
+        assert db.rebuild_embedding_matrix(pickle.loads) == 2
+        ids, matrix = db.get_embedding_matrix()
+        assert ids.tolist() == [s1, s2]
+        assert matrix.dtype == np.float32
+        assert matrix.tolist() == [[1.0, 0.0], [0.0, 1.0]]
+
+    def test_embedding_matrix_rows_are_unit_length(self, db):
+        import pickle
+        import numpy as np
+        s1 = db.add_speaker(name="Speaker 1")
+        db.save_speaker_embedding(s1, pickle.dumps(np.array([3.0, 4.0])), "t1", model="test")
+
+        db.rebuild_embedding_matrix(pickle.loads)
+        _, matrix = db.get_embedding_matrix()
+        np.testing.assert_allclose(matrix, [[0.6, 0.8]], rtol=1e-6)
+
+    def test_int8_embedding_matrix_scores_like_float32(self, db):
+        import pickle
+        import numpy as np
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((20, 64))
+        for i, vector in enumerate(vectors):
+            sid = db.add_speaker(name=f"Speaker {i}")
+            db.save_speaker_embedding(sid, pickle.dumps(vector), "t", model="test")
+
+        assert db.rebuild_embedding_matrix(pickle.loads, dtype='int8') == 20
+        _, matrix = db.get_embedding_matrix()
+        assert matrix.dtype == np.int8
+        assert len(matrix) == 20
+
+        query = rng.standard_normal(64)
+        query /= np.linalg.norm(query)
+        expected = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)) @ query
+        np.testing.assert_allclose(matrix @ query, expected, atol=0.02)
+
+        with pytest.raises(ValueError):
+            db.rebuild_embedding_matrix(pickle.loads, dtype='int4')
+
+    def test_float16_embedding_matrix(self, db):
+        import pickle
+        import numpy as np
+        s1 = db.add_speaker(name="Speaker 1")
+        s2 = db.add_speaker(name="Speaker 2")
+        db.save_speaker_embedding(s1, pickle.dumps(np.array([3.0, 4.0])), "t1", model="test")
+        db.save_speaker_embedding(s2, pickle.dumps(np.array([0.0, 2.0])), "t2", model="test")
+
+        db.rebuild_embedding_matrix(pickle.loads, dtype='float16')
+        ids, matrix = db.get_embedding_matrix()
+        assert ids.tolist() == [s1, s2]
+        assert matrix.dtype == np.float16
+        np.testing.assert_allclose(matrix @ np.array([0.0, 1.0]), [0.8, 1.0], atol=1e-3)
+
+    def test_fresh_embedding_matrix_loads_from_sidecars(self, db):
+        import pickle
+        import numpy as np
+        s1 = db.add_speaker(name="Speaker 1")
+        s2 = db.add_speaker(name="Speaker 2")
+        db.save_speaker_embedding(s1, pickle.dumps(np.array([3.0, 4.0])), "t1", model="test")
+        db.save_speaker_embedding(s2, pickle.dumps(np.array([0.0, 2.0])), "t2", model="test")
+        db.rebuild_embedding_matrix(pickle.loads, dtype='int8')
+
+        # The fast path never looks at the per-row offsets
+        db.conn.execute('UPDATE speaker_embeddings SET embedding_offset = NULL')
+        ids, matrix = db.get_embedding_matrix()
+        assert ids.tolist() == [s1, s2]
+        np.testing.assert_allclose(matrix @ np.array([0.0, 1.0]), [0.8, 1.0], atol=0.01)
+
+        # Any embedding write sends it back to the per-row check
+        db.save_speaker_embedding(s1, pickle.dumps(np.array([1.0, 0.0])), "t1", model="test")
+        assert db.get_embedding_matrix() is None
+
+    def test_embedding_writes_counter_tracks_vector_changes(self, db):
+        sid = db.add_speaker(name="Speaker 1")
+        before = db.get_counters()['embedding_writes']
+        db.save_speaker_embedding(sid, b'\x00', "t1", model="test")
+        db.save_speaker_embedding(sid, b'\x01', "t1", model="test")
+        assert db.get_counters()['embedding_writes'] == before + 2
+
+    def test_query_embedding_cache_round_trip(self, db):
+        assert db.get_cached_query_embedding("k") is None
+        db.save_cached_query_embedding("k", b'\x01\x02')
+        assert db.get_cached_query_embedding("k") == b'\x01\x02'
+
+    def test_embedding_matrix_stale_after_save(self, db):
+        import pickle
+        import numpy as np
+        s1 = db.add_speaker(name="Speaker 1")
+        db.save_speaker_embedding(s1, pickle.dumps(np.array([1.0, 0.0])), "t1", model="test")
+        db.rebuild_embedding_matrix(pickle.loads)
+
+        # Overwriting an embedding invalidates its matrix row
+        db.save_speaker_embedding(s1, pickle.dumps(np.array([0.0, 1.0])), "t1", model="test")
+        assert db.get_embedding_matrix() is None
+
 
 # ── Demographics ────────────────────────────────────────────────────────
 
@@ -453,6 +839,30 @@ class TestSpeakerLocations:
         locations = db.get_speaker_locations(sid)
         assert len(locations) >= 1
 
+    def test_bulk_insert_locations(self, db):
+        sid = db.add_speaker(name="Test Speaker")
+
+        inserted = db.bulk_insert_locations([
+            (sid, "residence", "Hong Kong", "HK", None, True, 0.9, "web_search"),
+            (sid, "birth", None, "CN", None, False, 0.7, "web_search"),
+        ])
+
+        assert inserted == 2
+        assert [loc[3] for loc in db.get_speaker_locations(sid)] == ["HK", "CN"]
+        assert db.bulk_insert_locations([]) == 0
+
+    def test_failed_bulk_insert_rolls_back(self, db):
+        sid = db.add_speaker(name="Test Speaker")
+
+        with pytest.raises(sqlite3.Error):
+            db.bulk_insert_locations([
+                (sid, "residence", "Hong Kong", "HK", None, True, 0.9, "web_search"),
+                (sid, "birth"),  # Wrong number of bindings
+            ])
+
+        assert not db.conn.in_transaction
+        assert db.get_speaker_locations(sid) == []
+
 
 # ── Languages ───────────────────────────────────────────────────────────
 
@@ -467,6 +877,64 @@ class TestSpeakerLanguages:
         languages = db.get_speaker_languages(sid)
         assert len(languages) >= 1
 
+    def test_save_language_twice_updates(self, db):
+        sid = db.add_speaker(name="Test Speaker")
+        db.save_speaker_language(sid, language="French", proficiency="basic")
+        db.save_speaker_language(sid, language="French", proficiency="fluent")
+
+        languages = db.get_speaker_languages(sid)
+        assert [(lang[0], lang[1]) for lang in languages] == [("French", "fluent")]
+
+    def test_bulk_upsert_languages_updates_existing(self, db):
+        sid = db.add_speaker(name="Test Speaker")
+        db.save_speaker_language(sid, language="French", proficiency="basic")
+
+        written = db.bulk_upsert_languages([
+            (sid, "French", "fluent", 0.9, "web_search"),
+            (sid, "English", "native", 0.99, "web_search"),
+        ])
+
+        assert written == 2
+        assert sorted((lang[0], lang[1]) for lang in db.get_speaker_languages(sid)) == [
+            ("English", "native"), ("French", "fluent")]
+        assert not db.conn.in_transaction
+
+
+# ── Transactions ────────────────────────────────────────────────────────
+
+class TestAtomic:
+    def test_save_helpers_join_the_open_transaction(self, db):
+        sid = db.add_speaker(name="Speaker 1")
+        with pytest.raises(RuntimeError):
+            with db.atomic():
+                db.save_speaker_demographics(sid, gender="female")
+                db.save_speaker_language(sid, "English")
+                db.enrich_speaker_data(sid, enriched_title="Professor")
+                db.mark_speaker_tagged(sid)
+                db.add_event(url="https://example.com/e", title="E", body_text="Body")
+                raise RuntimeError("boom")
+
+        assert db.get_speaker_demographics(sid) is None
+        assert db.get_speaker_by_id(sid)[2] is None
+        assert db.get_speaker_languages(sid) == []
+        assert db.get_statistics()['total_events'] == 0
+        assert not db.conn.in_transaction
+
+    def test_nested_block_rolls_back_alone(self, db):
+        s1 = db.add_speaker(name="Speaker 1")
+        s2 = db.add_speaker(name="Speaker 2")
+        with db.atomic():
+            db.save_speaker_demographics(s1, gender="female")
+            with pytest.raises(RuntimeError):
+                with db.atomic():
+                    db.save_speaker_demographics(s2, gender="male")
+                    raise RuntimeError("boom")
+            assert db.conn.in_transaction
+
+        assert db.get_speaker_demographics(s1) is not None
+        assert db.get_speaker_demographics(s2) is None
+        assert not db.conn.in_transaction
+
 
 # ── Corrections ─────────────────────────────────────────────────────────
 
@@ -508,12 +976,129 @@ class TestStatistics:
         stats = db.get_statistics()
         assert stats['total_events'] == 3
         assert stats['total_speakers'] == 3
+        assert stats['pending_events'] == stats['total_events'] - stats['processed_events']
+
+    def test_count_speakers_matches_statistics(self, db_with_data):
+        db, data = db_with_data
+        assert db.count_speakers() == db.get_statistics()['total_speakers'] == 3
+
+    def test_speaker_event_counts_match_per_speaker_queries(self, db_with_data):
+        db, data = db_with_data
+        counts = db.get_speaker_event_counts()
+        for speaker_id in data['speakers'].values():
+            assert counts.get(speaker_id, 0) == len(db.get_speaker_events(speaker_id))
+
+    def test_export_rows_stream_in_batches(self, db_with_data):
+        db, data = db_with_data
+        db.add_speaker_tag(data['speakers']['s1'], "trade", confidence=0.5)
+        db.add_speaker_tag(data['speakers']['s1'], "climate", confidence=0.9)
+
+        batches = list(db.iter_speakers_with_event_counts(batch_size=2))
+        assert [len(rows) for rows in batches] == [2, 1]
+
+        rows = [row for rows in batches for row in rows]
+        assert [row[1] for row in rows] == [s[1] for s in db.get_all_speakers()]
+        for row in rows:
+            speaker_id = row[0]
+            assert row[5] == '; '.join(t[0] for t in db.get_speaker_tags(speaker_id))
+            assert row[8] == len(db.get_speaker_events(speaker_id))
+
+    def test_stale_speakers_count(self, db):
+        stale = db.add_speaker(name="Stale")
+        fresh = db.add_speaker(name="Fresh")
+        untagged = db.add_speaker(name="Untagged")
+        for sid in (stale, fresh, untagged):
+            db.save_speaker_demographics(sid, gender="female")
+        db.mark_speaker_tagged(stale)
+        db.mark_speaker_tagged(fresh)
+        db.conn.execute(
+            "UPDATE speaker_demographics SET enriched_at = '2000-01-01' WHERE speaker_id IN (?, ?)",
+            (stale, untagged)
+        )
+        db.conn.commit()
+
+        assert db._compute_enhanced_statistics()['stale_speakers_count'] == 1
 
     def test_get_statistics_empty_db(self, db):
         stats = db.get_statistics()
         assert stats['total_events'] == 0
         assert stats['total_speakers'] == 0
 
+    def test_counters_track_tag_inserts_and_deletes(self, db):
+        s1 = db.add_speaker(name="Speaker 1")
+        s2 = db.add_speaker(name="Speaker 2")
+        db.add_speaker_tag(s1, "economics")
+        db.add_speaker_tag(s1, "trade")
+        db.add_speaker_tag(s2, "climate")
+        db.add_speaker_tag(s2, "climate")  # duplicate, ignored
+
+        stats = db.get_statistics()
+        assert stats['total_tags'] == 3
+        assert stats['tagged_speakers'] == 2
+
+        db.conn.execute('DELETE FROM speaker_tags WHERE speaker_id = ?', (s2,))
+        db.conn.commit()
+        counters = db.get_counters()
+        assert counters['total_tags'] == 2
+        assert counters['tagged_speakers'] == 1
+
+        db.reset_speaker_tagging_status()
+        counters = db.get_counters()
+        assert counters['total_tags'] == 0
+        assert counters['tagged_speakers'] == 0
+
+    def test_counters_seeded_from_existing_rows(self, tmp_path):
+        """Counters are rebuilt from the tables when missing (e.g. after upgrade)."""
+        db_path = str(tmp_path / "seed.db")
+        db = SpeakerDatabase(db_path)
+        sid = db.add_speaker(name="Speaker 1")
+        db.add_speaker_tag(sid, "economics")
+        db.save_speaker_embedding(sid, b'\x00', "text", model="test")
+        db.conn.execute('DROP TABLE counters')
+        db.conn.commit()
+        db.close()
+
+        with SpeakerDatabase(db_path) as reopened:
+            assert reopened.get_counters() == {
+                'total_tags': 1, 'tagged_speakers': 1, 'total_embeddings': 1,
+                'embedding_writes': 1
+            }
+            assert reopened.count_embeddings() == 1
+
+    def test_statistics_cached_until_write(self, tmp_path):
+        db_path = str(tmp_path / "cache.db")
+        db = SpeakerDatabase(db_path)
+        db.add_speaker(name="Speaker 1")
+        stats = db.get_enhanced_statistics()
+        assert stats['total_speakers'] == 1
+
+        # Callers may mutate the result without corrupting the cache
+        stats['total_speakers'] = 99
+        assert db.get_enhanced_statistics()['total_speakers'] == 1
+
+        # A commit from another connection (e.g. the pipeline) invalidates it
+        other = SpeakerDatabase(db_path)
+        other.add_speaker(name="Speaker 2")
+        other.close()
+        assert db.get_enhanced_statistics()['total_speakers'] == 2
+
+        # As does a write through this connection
+        db.add_speaker(name="Speaker 3")
+        assert db.get_statistics()['total_speakers'] == 3
+        db.close()
+
+    def test_statistics_cache_expires(self, db, monkeypatch):
+        db.get_statistics()
+        calls = []
+        original = db._compute_statistics
+        monkeypatch.setattr(db, '_compute_statistics', lambda: calls.append(1) or original())
+        db.get_statistics()
+        assert calls == []
+
+        monkeypatch.setattr(SpeakerDatabase, 'STATS_CACHE_TTL', 0)
+        db.get_statistics()
+        assert calls == [1]
+
     def test_get_unique_event_locations(self, db_with_data):
         db, data = db_with_data
         locations = db.get_unique_event_locations()
@@ -545,7 +1130,68 @@ class TestMergeDuplicates:
         count = db.merge_duplicates(verbose=False)
         assert count == 0
 
+    def test_merge_keeps_most_complete_and_longest_fields(self, db):
+        cursor = db.conn.cursor()
+        now = datetime.now().isoformat()
+        rows = [
+            ("Jane Smith", "Prof", "MIT", None, None),
+            ("Jane Smith", None, "Massachusetts Institute of Technology", "MIT", "Researcher."),
+            ("Jane Smith", "Professor of Economics", None, None, None),
+        ]
+        ids = []
+        for name, title, aff, primary_aff, bio in rows:
+            cursor.execute(
+                'INSERT INTO speakers (name, title, affiliation, primary_affiliation, bio, first_seen) '
+                'VALUES (?, ?, ?, ?, ?, ?)', (name, title, aff, primary_aff, bio, now)
+            )
+            ids.append(cursor.lastrowid)
+        e1 = db.add_event(url="https://example.com/e1", title="E1", body_text="T")
+        db.link_speaker_to_event(e1, ids[0])
+
+        assert db.pick_primary_speaker(ids) == ids[1]
+        assert db.merge_duplicates() == 2
+
+        speaker = db.get_speaker_by_id(ids[1])
+        assert speaker[2] == "Professor of Economics"
+        assert speaker[3] == "Massachusetts Institute of Technology"
+        assert speaker[4] == "MIT"
+        assert speaker[5] == "Researcher."
+        assert [s[0] for s in db.get_event_speakers(e1)] == [ids[1]]
+
     def test_get_top_speakers(self, db_with_data):
         db, data = db_with_data
         top = db.get_top_speakers(limit=10)
         assert len(top) > 0
+
+
+# ── Connection Pool ─────────────────────────────────────────────────────
+
+class TestSpeakerDatabasePool:
+    def test_reader_sees_committed_writes(self, tmp_path):
+        db_path = str(tmp_path / "pool.db")
+        pool = SpeakerDatabasePool(db_path, size=2)
+        with SpeakerDatabase(db_path) as writer:
+            writer.add_speaker(name="Jane Smith")
+
+        with pool.reader() as reader:
+            assert reader.get_statistics()['total_speakers'] == 1
+        pool.close()
+
+    def test_reader_is_read_only(self, tmp_path):
+        db_path = str(tmp_path / "pool.db")
+        pool = SpeakerDatabasePool(db_path, size=1)
+        with pool.reader() as reader:
+            with pytest.raises(sqlite3.OperationalError):
+                reader.add_speaker(name="Jane Smith")
+        pool.close()
+
+    def test_connections_are_returned(self, tmp_path):
+        import queue
+        pool = SpeakerDatabasePool(str(tmp_path / "pool.db"), size=1)
+        first = pool.acquire()
+        with pytest.raises(queue.Empty):
+            pool.acquire(timeout=0.01)
+        pool.release(first)
+        with pool.reader() as reader:
+            assert reader is first
+        pool.close()
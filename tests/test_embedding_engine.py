@@ -12,7 +12,9 @@ Covers:
 import pytest
 import os
 import sys
+import threading
 import numpy as np
+from collections import OrderedDict
 from unittest.mock import patch, MagicMock
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -27,7 +29,7 @@ def engine():
                 from embedding_engine import EmbeddingEngine
                 eng = EmbeddingEngine.__new__(EmbeddingEngine)
                 eng.provider = 'gemini'
-                eng._last_usage = None
+                eng._usage = threading.local()
                 eng.dimension = 768
                 return eng
 
@@ -90,6 +92,33 @@ class TestBuildEmbeddingText:
         text = engine.build_embedding_text(speaker)
         assert 'Anonymous Speaker' in text
 
+    def test_plain_string_tags_and_affiliation_fallback(self, engine):
+        speaker = {
+            'name': 'Li Wei',
+            'title': None,
+            'affiliation': None,
+            'primary_affiliation': 'Tsinghua University',
+            'bio': 'Trade economist.',
+            'tags': ['trade', 'economics'],
+        }
+        text = engine.build_embedding_text(speaker)
+        assert text == (
+            "Name: Li Wei\n"
+            "Affiliation: Tsinghua University\n"
+            "Bio: Trade economist.\n"
+            "Expertise: trade, economics"
+        )
+
+    def test_mixed_tag_shapes(self, engine):
+        speaker = {'name': 'Li Wei', 'tags': ['trade', ('economics', 0.9)]}
+        text = engine.build_embedding_text(speaker)
+        assert text == "Name: Li Wei\nExpertise: trade, economics"
+
+    def test_long_bio_is_cut(self, engine):
+        speaker = {'name': 'Jane Smith', 'bio': 'x' * (engine.BIO_MAX_CHARS + 100)}
+        text = engine.build_embedding_text(speaker)
+        assert text == "Name: Jane Smith\nBio: " + 'x' * engine.BIO_MAX_CHARS
+
 
 class TestCosineSimilarity:
     def test_identical_vectors(self, engine):
@@ -122,6 +151,17 @@ class TestCosineSimilarity:
         sim = engine.cosine_similarity(v1, v2)
         assert sim == 0.0 or np.isnan(sim)
 
+    def test_matrix_matches_pairwise(self, engine):
+        rng = np.random.default_rng(3)
+        queries = rng.standard_normal((3, 8))
+        matrix = np.vstack([rng.standard_normal((4, 8)), np.zeros((1, 8))])
+
+        scores = engine.cosine_similarity_matrix(queries, matrix)
+
+        assert scores.shape == (3, 5)
+        expected = [[engine.cosine_similarity(q, m) for m in matrix] for q in queries]
+        np.testing.assert_allclose(scores, expected, rtol=1e-5, atol=1e-6)
+
 
 class TestSearchBySimilarity:
     def test_returns_top_k(self, engine):
@@ -153,6 +193,266 @@ class TestSearchBySimilarity:
         results = engine.search_by_similarity(query_emb, candidates, top_k=10)
         assert len(results) == 2
 
+    def test_matches_pairwise_cosine(self, engine):
+        rng = np.random.default_rng(0)
+        query_emb = rng.standard_normal(16)
+        candidates = [(i, rng.standard_normal(16)) for i in range(100)]
+
+        expected = sorted(
+            ((i, engine.cosine_similarity(query_emb, emb)) for i, emb in candidates),
+            key=lambda x: x[1], reverse=True
+        )[:10]
+        results = engine.search_by_similarity(query_emb, candidates, top_k=10)
+
+        assert [r[0] for r in results] == [e[0] for e in expected]
+        np.testing.assert_allclose([r[1] for r in results], [e[1] for e in expected], rtol=1e-5)
+
+    def test_ties_keep_candidate_order(self, engine):
+        query_emb = np.array([1.0, 0.0])
+        candidates = [(i, np.array([1.0, 0.0])) for i in (5, 3, 9, 1)]
+        results = engine.search_by_similarity(query_emb, candidates, top_k=4)
+        assert [r[0] for r in results] == [5, 3, 9, 1]
+
+    def test_build_candidate_matrix_normalizes_rows(self, engine):
+        ids, matrix = engine.build_candidate_matrix([
+            (7, np.array([3.0, 4.0])),
+            (9, np.array([0.0, 0.0])),
+        ])
+        assert ids.tolist() == [7, 9]
+        assert matrix.dtype == np.float32
+        np.testing.assert_allclose(matrix, [[0.6, 0.8], [0.0, 0.0]])
+
+
+class TestDecodeCandidateMatrix:
+    def test_raw_rows_decoded_in_bulk(self, engine):
+        rows = [
+            (4, engine.serialize_embedding(np.array([3.0, 4.0]))),
+            (2, engine.serialize_embedding(np.array([0.0, 5.0]))),
+        ]
+        ids, matrix = engine.decode_candidate_matrix(rows)
+        assert ids.tolist() == [4, 2]
+        assert matrix.flags['C_CONTIGUOUS']
+        np.testing.assert_allclose(matrix, [[0.6, 0.8], [0.0, 1.0]], rtol=1e-6)
+
+    def test_mixed_legacy_rows(self, engine):
+        import pickle
+        rows = [
+            (1, pickle.dumps(np.array([2.0, 0.0]))),
+            (2, engine.serialize_embedding(np.array([0.0, 1.0]))),
+        ]
+        ids, matrix = engine.decode_candidate_matrix(rows)
+        assert ids.tolist() == [1, 2]
+        np.testing.assert_allclose(matrix, [[1.0, 0.0], [0.0, 1.0]], rtol=1e-6)
+
+    def test_empty(self, engine):
+        ids, matrix = engine.decode_candidate_matrix([])
+        assert len(ids) == 0
+
+
+class TestSimilarityIndex:
+    def test_matches_search_by_similarity(self, engine):
+        from embedding_engine import SimilarityIndex
+        rng = np.random.default_rng(1)
+        query_emb = rng.standard_normal(8)
+        candidates = [(i, rng.standard_normal(8)) for i in range(30)]
+
+        ids, matrix = engine.build_candidate_matrix(candidates)
+        index = SimilarityIndex(ids, matrix)
+        results = index.search(query_emb, top_k=5)
+
+        expected = engine.search_by_similarity(query_emb, candidates, top_k=5)
+        assert [r[0] for r in results] == [e[0] for e in expected]
+        np.testing.assert_allclose([r[1] for r in results], [e[1] for e in expected], rtol=1e-5)
+
+    def test_binary_prefilter_finds_nearest_rows(self, engine):
+        from embedding_engine import SimilarityIndex
+        rng = np.random.default_rng(2)
+        candidates = [(i, rng.standard_normal(64)) for i in range(500)]
+        ids, matrix = engine.build_candidate_matrix(candidates)
+        query_emb = candidates[123][1] + 0.1 * rng.standard_normal(64)
+
+        with patch('embedding_engine.faiss', None), \
+                patch.multiple(SimilarityIndex, BINARY_THRESHOLD=100, BINARY_SHORTLIST=50):
+            index = SimilarityIndex(ids, matrix)
+            assert index.binary.shape == (500, 8)
+            results = index.search(query_emb, top_k=3)
+
+        # Approximate shortlist, exact scores for what it returns
+        assert results[0][0] == 123
+        exact = dict(engine.search_by_similarity(query_emb, candidates, top_k=500))
+        np.testing.assert_allclose([r[1] for r in results], [exact[r[0]] for r in results], rtol=1e-5)
+
+    def test_hamming_distances(self):
+        from embedding_engine import binarize_rows, hamming_distances
+        matrix = np.array([[1.0, -1.0, 1.0], [-1.0, -1.0, -1.0], [1.0, 1.0, 1.0]])
+        bits = binarize_rows(matrix)
+        assert hamming_distances(binarize_rows(matrix[0]), bits).tolist() == [0, 2, 1]
+
+    def test_empty_index(self):
+        from embedding_engine import SimilarityIndex
+        index = SimilarityIndex(np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32))
+        assert len(index) == 0
+        assert index.search(np.array([1.0, 0.0]), top_k=3) == []
+
+
+class TestGenerateEmbeddingsBatch:
+    def test_gemini_batch_preserves_input_order(self, engine):
+        engine.model = "models/text-embedding-004"
+        engine.client = MagicMock()
+        engine.client.embed_content.side_effect = lambda content, **kwargs: {
+            'embedding': [float(len(content))]
+        }
+        texts = ["a", "ccc", "bb", "dddd"]
+
+        embeddings = engine.generate_embeddings_batch(texts)
+
+        assert [e.tolist() for e in embeddings] == [[1.0], [3.0], [2.0], [4.0]]
+        assert engine.client.embed_content.call_count == 4
+        assert engine.get_last_usage() == {'total_tokens': 4}
+
+    def test_batch_as_matrix(self, engine):
+        engine.model = "models/text-embedding-004"
+        engine.client = MagicMock()
+        engine.client.embed_content.side_effect = lambda content, **kwargs: {
+            'embedding': [float(len(content)), 1.0]
+        }
+
+        matrix = engine.generate_embeddings_batch(["a", "ccc", "bb"], return_matrix=True)
+
+        assert matrix.dtype == np.float32
+        assert matrix.tolist() == [[1.0, 1.0], [3.0, 1.0], [2.0, 1.0]]
+        assert engine.generate_embeddings_batch([], return_matrix=True).shape == (0, 0)
+
+    def test_iter_embeddings_yields_each_index_once(self, engine):
+        engine.model = "models/text-embedding-004"
+        engine.client = MagicMock()
+        engine.client.embed_content.side_effect = lambda content, **kwargs: {
+            'embedding': [float(len(content))]
+        }
+        texts = ["x" * n for n in range(1, 40)]
+
+        results = dict(engine.iter_embeddings(texts))
+
+        assert sorted(results) == list(range(len(texts)))
+        assert all(results[i].tolist() == [float(i + 1)] for i in results)
+
+    def test_iter_embeddings_stops_submitting_when_closed(self, engine):
+        engine.model = "models/text-embedding-004"
+        engine.client = MagicMock()
+        engine.client.embed_content.return_value = {'embedding': [1.0]}
+        texts = ["text"] * 100
+
+        stream = engine.iter_embeddings(texts)
+        next(stream)
+        stream.close()
+
+        assert engine.client.embed_content.call_count <= 2 * engine.GEMINI_MAX_CONCURRENCY + 1
+
+    def test_pack_batches_respects_token_and_item_caps(self, engine):
+        engine.BATCH_MAX_TOKENS = 100
+        texts = ["x" * 800, "y" * 40, "z" * 40, "w" * 40, "v" * 4, "u" * 4]
+
+        batches = engine.pack_batches(texts, max_items=2)
+
+        assert sorted(i for batch in batches for i in batch) == list(range(len(texts)))
+        assert batches[0] == [0]
+        assert all(len(batch) <= 2 for batch in batches)
+        assert all(sum(len(texts[i]) // 4 + 1 for i in batch) <= 100
+                   for batch in batches if len(batch) > 1)
+
+    def test_openai_micro_batches_scatter_back_to_input_order(self, engine):
+        engine.provider = 'openai'
+        engine.model = "text-embedding-3-small"
+        engine.BATCH_MAX_ITEMS = {'openai': 2}
+        engine.client = MagicMock()
+
+        def create(input, **kwargs):
+            return MagicMock(
+                data=[MagicMock(embedding=[float(len(text))]) for text in input],
+                usage=MagicMock(total_tokens=len(input))
+            )
+        engine.client.embeddings.create.side_effect = create
+        texts = ["a", "ccc", "bb", "dddd", "eeeee"]
+
+        embeddings = engine.generate_embeddings_batch(texts)
+
+        assert [e.tolist() for e in embeddings] == [[1.0], [3.0], [2.0], [4.0], [5.0]]
+        assert all(e.dtype == np.float32 for e in embeddings)
+        assert engine.client.embeddings.create.call_count == 3
+        assert engine.get_last_usage() == {'total_tokens': 5}
+
+    def test_identical_texts_are_embedded_once(self, engine):
+        engine.provider = 'openai'
+        engine.model = "text-embedding-3-small"
+        engine.client = MagicMock()
+
+        def create(input, **kwargs):
+            return MagicMock(
+                data=[MagicMock(embedding=[float(len(text))]) for text in input],
+                usage=MagicMock(total_tokens=len(input))
+            )
+        engine.client.embeddings.create.side_effect = create
+
+        embeddings = engine.generate_embeddings_batch(["aa", "b", "aa", "aa"])
+
+        assert [e.tolist() for e in embeddings] == [[2.0], [1.0], [2.0], [2.0]]
+        (call,) = engine.client.embeddings.create.call_args_list
+        assert sorted(call.kwargs['input']) == ["aa", "b"]
+
+    def test_openai_base64_vectors_decode_to_float32(self, engine):
+        import base64
+        engine.provider = 'openai'
+        engine.model = "text-embedding-3-small"
+        engine.client = MagicMock()
+        vector = np.array([0.25, -1.5, 3.0], dtype='<f4')
+        engine.client.embeddings.create.return_value = MagicMock(
+            data=[MagicMock(embedding=base64.b64encode(vector.tobytes()).decode())],
+            usage=MagicMock(total_tokens=3)
+        )
+
+        embedding = engine.generate_embedding("climate")
+
+        assert engine.client.embeddings.create.call_args.kwargs['encoding_format'] == "base64"
+        assert embedding.dtype == np.float32
+        np.testing.assert_array_equal(embedding, vector)
+
+
+class TestQueryEmbeddingCache:
+    def test_repeated_query_served_from_cache(self, engine, tmp_path):
+        from database import SpeakerDatabase
+        engine.model = "models/text-embedding-004"
+        engine._query_cache = OrderedDict()
+        engine._embed_query = MagicMock(return_value=np.array([3.0, 4.0]))
+
+        with SpeakerDatabase(str(tmp_path / "cache.db")) as db:
+            engine.query_cache_store = db
+            first = engine.generate_query_embedding("climate policy")
+            second = engine.generate_query_embedding("climate policy")
+            assert engine._embed_query.call_count == 1
+            np.testing.assert_array_equal(first, second)
+
+            # A fresh process (empty LRU) falls through to the persistent tier
+            engine._query_cache.clear()
+            persisted = engine.generate_query_embedding("climate policy")
+            assert engine._embed_query.call_count == 1
+            np.testing.assert_allclose(persisted, [0.6, 0.8], rtol=1e-6)
+
+            engine.generate_query_embedding("trade")
+            assert engine._embed_query.call_count == 2
+
+    def test_lru_evicts_oldest(self, engine):
+        engine.model = "models/text-embedding-004"
+        engine._query_cache = OrderedDict()
+        engine.query_cache_store = None
+        engine.QUERY_CACHE_SIZE = 2
+        engine._embed_query = MagicMock(return_value=np.array([1.0]))
+
+        for query in ["a", "b", "a", "c"]:
+            engine.generate_query_embedding(query)
+        assert engine._embed_query.call_count == 3
+        assert engine.query_cache_key("b") not in engine._query_cache
+        assert engine.query_cache_key("a") in engine._query_cache
+
 
 class TestSerializeDeserialize:
     def test_roundtrip(self, engine):
@@ -161,13 +461,32 @@ class TestSerializeDeserialize:
         assert isinstance(serialized, bytes)
 
         deserialized = engine.deserialize_embedding(serialized)
-        np.testing.assert_array_almost_equal(original, deserialized)
+        # Stored embeddings are unit length; the direction is preserved
+        np.testing.assert_array_almost_equal(original / np.linalg.norm(original), deserialized)
 
     def test_high_dimensional(self, engine):
         original = np.random.randn(768)  # Gemini dimension
         serialized = engine.serialize_embedding(original)
         deserialized = engine.deserialize_embedding(serialized)
-        np.testing.assert_array_almost_equal(original, deserialized)
+        np.testing.assert_array_almost_equal(original / np.linalg.norm(original), deserialized)
+
+    def test_stored_as_raw_float32(self, engine):
+        serialized = engine.serialize_embedding(np.random.randn(768))
+        assert len(serialized) == 768 * 4
+        assert not engine.is_legacy_embedding(serialized)
+
+    def test_reads_legacy_pickled_embeddings(self, engine):
+        import pickle
+        original = np.array([1.0, 2.0, 3.0])
+        legacy = pickle.dumps(original)
+        assert engine.is_legacy_embedding(legacy)
+        np.testing.assert_array_almost_equal(engine.deserialize_embedding(legacy), original)
+
+    def test_serialized_embeddings_are_unit_length(self, engine):
+        original = np.array([1.0, 2.0, 3.0])
+        v1 = engine.deserialize_embedding(engine.serialize_embedding(original))
+        assert abs(np.linalg.norm(v1) - 1.0) < 1e-6
+        assert np.allclose(v1, original / np.linalg.norm(original), atol=1e-6)
 
 
 class TestProviderInit:
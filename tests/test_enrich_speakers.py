@@ -0,0 +1,206 @@
+"""
+Tests for enrich_speakers.py - concurrent unified enrichment.
+
+Covers:
+- Network fetches run on worker threads, saves on the calling thread
+- Every speaker is saved once
+- Failed or raising fetches are counted without aborting the run
+"""
+
+import threading
+from unittest.mock import patch
+
+import enrich_speakers
+from speaker_enricher import UnifiedSpeakerEnricher
+
+
+def make_enricher(extract):
+    """Real enricher with the network calls replaced"""
+    with patch('speaker_enricher.anthropic.Anthropic'):
+        enricher = UnifiedSpeakerEnricher(api_key="test-key")
+    enricher.web_search = lambda query: {'success': True, 'results': []}
+    enricher.extract_all_data = extract
+    return enricher
+
+
+def extraction(speaker):
+    return {
+        'success': True,
+        'tags': [{'text': f"tag-{speaker['speaker_id']}", 'confidence': 0.9}],
+        'demographics': {},
+        'locations': [],
+        'languages': [],
+        'usage': {'input_tokens': 10, 'output_tokens': 5},
+    }
+
+
+def run(db, enricher, workers):
+    with patch.object(enrich_speakers, 'UnifiedSpeakerEnricher', return_value=enricher):
+        enrich_speakers._enrich_speakers(db, batch_size=10, limit=None,
+                                         skip_existing=True, verbose=False,
+                                         workers=workers)
+
+
+class TestConcurrentEnrichment:
+    def test_fetches_on_workers_and_saves_every_speaker(self, db_with_data):
+        db, ids = db_with_data
+        fetch_threads = set()
+
+        def extract(speaker, events, results):
+            fetch_threads.add(threading.get_ident())
+            return extraction(speaker)
+
+        run(db, make_enricher(extract), workers=3)
+
+        assert threading.get_ident() not in fetch_threads
+        for speaker_id in ids['speakers'].values():
+            assert [t[0] for t in db.get_speaker_tags(speaker_id)] == [f"tag-{speaker_id}"]
+        assert not db.conn.in_transaction
+
+    def test_failures_do_not_stop_the_run(self, db_with_data):
+        db, ids = db_with_data
+        bad = ids['speakers']['s1']
+
+        def extract(speaker, events, results):
+            if speaker['speaker_id'] == bad:
+                raise RuntimeError("boom")
+            return extraction(speaker)
+
+        run(db, make_enricher(extract), workers=2)
+
+        assert db.get_speaker_tags(bad) == []
+        for key in ('s2', 's3'):
+            assert db.get_speaker_tags(ids['speakers'][key])
+
+
+class TestEnrichAllSpeakers:
+    def test_skips_speakers_with_tags_or_demographics(self, db_with_data):
+        db, ids = db_with_data
+        db.add_speaker_tag(ids['speakers']['s1'], "climate")
+        db.save_speaker_demographics(ids['speakers']['s2'], gender="male")
+
+        enricher = make_enricher(lambda speaker, events, results: extraction(speaker))
+        enricher.search_delay = 0
+        results = enricher.enrich_all_speakers(db, verbose=False)
+
+        assert results['total_processed'] == 1
+        assert [r['speaker_name'] for r in results['speakers']] == ["Maria Garcia"]
+
+    def test_quiet_run_prints_nothing(self, db_with_data, capsys):
+        db, ids = db_with_data
+        enricher = make_enricher(lambda speaker, events, results: extraction(speaker))
+        enricher.search_delay = 0
+
+        results = enricher.enrich_all_speakers(db, limit=1, verbose=False)
+
+        assert results['successful'] == 1
+        assert capsys.readouterr().out == ""
+
+    def test_no_fixed_sleep_between_speakers(self, db_with_data):
+        import time
+        db, ids = db_with_data
+        enricher = make_enricher(lambda speaker, events, results: extraction(speaker))
+        # Pacing lives in web_search, which is stubbed out here
+        enricher.search_delay = 0.5
+
+        start = time.monotonic()
+        results = enricher.enrich_all_speakers(db, verbose=False)
+
+        assert results['successful'] == 3
+        assert time.monotonic() - start < 0.5
+
+    def test_enrich_speaker_uses_callers_row(self, db_with_data):
+        db, ids = db_with_data
+        speaker_id = ids['speakers']['s1']
+        row = db.get_speaker_by_id(speaker_id)
+        seen = []
+
+        def extract(speaker, events, results):
+            seen.append(speaker['name'])
+            return extraction(speaker)
+
+        enricher = make_enricher(extract)
+        with patch.object(db, 'get_speaker_by_id', side_effect=AssertionError("re-read")):
+            result = enricher.enrich_speaker(speaker_id, db, row)
+
+        assert result['success']
+        assert seen == [row[1]]
+
+
+class TestRequestPacer:
+    def test_spaces_calls_across_threads(self):
+        import time
+        from speaker_enricher import RequestPacer
+        pacer = RequestPacer()
+        starts = []
+
+        def call():
+            pacer.wait(0.05)
+            starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.04 for gap in gaps)
+
+
+class TestTokenBucket:
+    def test_waits_for_refill_once_budget_is_spent(self):
+        import time
+        from speaker_enricher import TokenBucket
+        bucket = TokenBucket(per_minute=6000)  # 100 tokens a second
+
+        start = time.monotonic()
+        bucket.acquire(6000)
+        assert time.monotonic() - start < 0.05
+
+        bucket.acquire(10)
+        assert time.monotonic() - start >= 0.08
+
+    def test_adjust_credits_back_overestimates(self):
+        import time
+        from speaker_enricher import TokenBucket
+        bucket = TokenBucket(per_minute=6000)
+        bucket.acquire(6000)
+        bucket.adjust(5000)
+
+        start = time.monotonic()
+        bucket.acquire(1000)
+        assert time.monotonic() - start < 0.05
+
+    def test_failed_call_credits_reservation_back(self):
+        with patch('speaker_enricher.anthropic.Anthropic'):
+            enricher = UnifiedSpeakerEnricher(api_key="test-key")
+        enricher.client.messages.create.side_effect = RuntimeError("overloaded")
+        speaker = {'speaker_id': 1, 'name': "Jane Doe", 'title': "", 'affiliation': "", 'bio': ""}
+
+        result = enricher.extract_all_data(speaker, [], [])
+
+        assert result['success'] is False
+        assert enricher._claude_tokens._tokens > enricher.CLAUDE_TOKENS_PER_MINUTE - 1
+
+
+class TestCompressText:
+    def test_collapses_whitespace_and_repeated_sentences(self):
+        from speaker_enricher import compress_text
+        bio = "Jane leads trade research.\n\n  She advises   ministries. Jane leads trade research."
+        assert compress_text(bio, 500) == "Jane leads trade research. She advises ministries."
+
+    def test_keeps_repeated_abbreviations(self):
+        from speaker_enricher import compress_text
+        bio = "Dr. Smith chairs the board. Dr. Lee advises it. Dr. Smith chairs the board."
+        assert compress_text(bio, 500) == "Dr. Smith chairs the board. Dr. Lee advises it."
+
+    def test_cuts_at_sentence_boundary(self):
+        from speaker_enricher import compress_text
+        bio = "First sentence here. Second sentence is a bit longer. Third."
+        assert compress_text(bio, 35) == "First sentence here."
+
+    def test_hard_cut_without_boundary(self):
+        from speaker_enricher import compress_text
+        assert compress_text("x" * 50, 10) == "x" * 10 + "…"
@@ -0,0 +1,154 @@
+"""
+Tests for freshness_manager.py - staleness and refresh priority tracking.
+
+The enricher is mocked; only the database side is exercised.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from freshness_manager import FreshnessManager
+from migrate_search_tables import migrate_database
+
+
+def make_manager(db):
+    # FreshnessManager writes the migrate_search_tables layout of
+    # speaker_freshness, not the one SpeakerDatabase creates
+    db.conn.execute('DROP TABLE speaker_freshness')
+    db.conn.commit()
+    migrate_database(db.db_path, verbose=False)
+    with patch('freshness_manager.SpeakerDatabase', return_value=db), \
+         patch('freshness_manager.UnifiedSpeakerEnricher'):
+        return FreshnessManager()
+
+
+class TestUpdateFreshnessTracking:
+    def test_counts_come_from_one_query(self, db_with_data):
+        db, ids = db_with_data
+        s1 = ids['speakers']['s1']
+        for tag in ("trade", "climate", "energy"):
+            db.add_speaker_tag(s1, tag)
+        db.save_speaker_demographics(s1, gender="female")
+        old = (datetime.now() - timedelta(days=300)).isoformat()
+        db.conn.execute('UPDATE speaker_demographics SET enriched_at = ? WHERE speaker_id = ?', (old, s1))
+        db.conn.commit()
+
+        manager = make_manager(db)
+        with patch.object(db, 'get_speaker_events', side_effect=AssertionError("per-speaker query")), \
+             patch.object(db, 'get_speaker_tags', side_effect=AssertionError("per-speaker query")):
+            manager.update_freshness_tracking(verbose=False)
+
+        rows = dict(db.conn.execute('SELECT speaker_id, priority_score FROM speaker_freshness'))
+        assert set(rows) == set(ids['speakers'].values())
+        # Two events (no boost) + three tags (+0.2) on top of staleness
+        staleness = manager.calculate_staleness(old, 2)
+        assert abs(rows[s1] - (staleness + 0.2)) < 1e-6
+        # Never enriched: fully stale, no tag boost
+        assert rows[ids['speakers']['s3']] == 1.0
+
+    def test_age_and_next_refresh_come_from_sqlite(self, db_with_data):
+        db, ids = db_with_data
+        s2 = ids['speakers']['s2']
+        db.save_speaker_demographics(s2, gender="male")
+        enriched = datetime.now() - timedelta(days=200, hours=1)
+        db.conn.execute('UPDATE speaker_demographics SET enriched_at = ? WHERE speaker_id = ?',
+                        (enriched.isoformat(), s2))
+        db.conn.commit()
+
+        manager = make_manager(db)
+        manager.update_freshness_tracking(verbose=False)
+
+        staleness, next_refresh = db.conn.execute(
+            'SELECT staleness_score, next_refresh_date FROM speaker_freshness WHERE speaker_id = ?', (s2,)
+        ).fetchone()
+        assert abs(staleness - 200 / 365.0) < 1e-9
+        # Same format as datetime.isoformat(), microseconds included
+        assert next_refresh == (enriched + timedelta(days=365)).isoformat()
+
+    def test_recently_enriched_speakers_are_not_rescored(self, db_with_data):
+        db, ids = db_with_data
+        s1 = ids['speakers']['s1']
+        db.save_speaker_demographics(s1, gender="female")
+        manager = make_manager(db)
+        db.conn.execute('''
+            INSERT INTO speaker_freshness (speaker_id, staleness_score, needs_refresh, priority_score)
+            VALUES (?, 1.0, 1, 1.0)
+        ''', (s1,))
+        db.conn.commit()
+
+        manager.update_freshness_tracking(verbose=False)
+
+        rows = {row[0]: row[1:] for row in db.conn.execute(
+            'SELECT speaker_id, staleness_score, needs_refresh FROM speaker_freshness')}
+        # Enriched just now: taken off the queue, score left as it was
+        assert rows[s1] == (1.0, 0)
+        assert rows[ids['speakers']['s3']] == (1.0, 1)
+
+    def test_sql_matches_python_scoring(self, db_with_data):
+        db, ids = db_with_data
+        s1 = ids['speakers']['s1']
+        for n in range(6):
+            event_id = db.add_event(url=f"https://example.com/e{n}", title=f"E{n}", body_text="x")
+            db.link_speaker_to_event(event_id, s1)
+        for tag in ("trade", "climate", "energy"):
+            db.add_speaker_tag(s1, tag)
+        db.save_speaker_demographics(s1, gender="female")
+        enriched = datetime.now() - timedelta(days=400)
+        db.conn.execute('UPDATE speaker_demographics SET enriched_at = ? WHERE speaker_id = ?',
+                        (enriched.isoformat(), s1))
+        db.conn.commit()
+
+        manager = make_manager(db)
+        manager.update_freshness_tracking(verbose=False)
+
+        staleness, needs_refresh, priority, next_refresh = db.conn.execute('''
+            SELECT staleness_score, needs_refresh, priority_score, next_refresh_date
+            FROM speaker_freshness WHERE speaker_id = ?
+        ''', (s1,)).fetchone()
+        event_count = len(db.get_speaker_events(s1))
+        assert staleness == manager.calculate_staleness(enriched.isoformat(), event_count)
+        assert needs_refresh == 1
+        assert priority == manager.calculate_priority(s1, staleness, event_count)
+        # High priority: next refresh six months after enrichment
+        assert next_refresh[:16] == (enriched + timedelta(days=180)).isoformat()[:16]
+
+
+class TestCalculateStaleness:
+    def test_busy_speakers_age_faster(self, db):
+        manager = make_manager(db)
+        enriched = (datetime.now() - timedelta(days=73, hours=1)).isoformat()
+
+        assert manager.calculate_staleness(enriched, 0) == 0.2
+        assert abs(manager.calculate_staleness(enriched, 11) - 0.3) < 1e-9
+        assert manager.calculate_staleness(None, 0) == 1.0
+
+
+class TestRefreshStaleSpeakers:
+    def test_fetches_on_workers_and_marks_speakers_fresh(self, db_with_data):
+        import threading
+        from unittest.mock import MagicMock
+        from speaker_enricher import UnifiedSpeakerEnricher
+
+        db, ids = db_with_data
+        manager = make_manager(db)
+        manager.update_freshness_tracking(verbose=False)  # never enriched: all stale
+
+        enricher = MagicMock()
+        enricher.load_speaker.side_effect = lambda *args: UnifiedSpeakerEnricher.load_speaker(None, *args)
+        fetch_threads = set()
+
+        def fetch(speaker, events):
+            fetch_threads.add(threading.get_ident())
+            return {'source': 'bio_only', 'extraction': {'success': True}}
+
+        enricher.fetch_enrichment.side_effect = fetch
+        enricher.save_enrichment.return_value = {'success': True}
+        manager.enricher = enricher
+
+        manager.refresh_stale_speakers(limit=10, min_priority=0, verbose=False, workers=2)
+
+        assert threading.get_ident() not in fetch_threads
+        assert enricher.save_enrichment.call_count == 3
+        needs_refresh = [row[0] for row in db.conn.execute('SELECT needs_refresh FROM speaker_freshness')]
+        assert needs_refresh == [0, 0, 0]
+        assert not db.conn.in_transaction
@@ -0,0 +1,117 @@
+"""
+Tests for generate_embeddings.py - batched embedding generation.
+
+The embedding API is faked; only batching and saving are exercised.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+
+import generate_embeddings
+
+
+class FakeEngine:
+    """Stands in for EmbeddingEngine; one vector per text, usage per batch"""
+    provider = 'openai'
+    model = 'fake'
+
+    def __init__(self, provider='openai', fail_first=False):
+        self.fail_first = fail_first
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.usage = threading.local()
+
+    def build_embedding_text(self, speaker):
+        return speaker['name']
+
+    def iter_embeddings(self, texts):
+        with self.lock:
+            self.calls += 1
+            first = self.calls == 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.05)
+            if first and self.fail_first:
+                raise RuntimeError("batch failed")
+            for i, _ in enumerate(texts):
+                yield i, np.ones(2, dtype=np.float32)
+            self.usage.last = {'total_tokens': len(texts)}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def generate_embedding(self, text):
+        self.usage.last = {'total_tokens': 1}
+        return np.ones(2, dtype=np.float32)
+
+    def get_last_usage(self):
+        return getattr(self.usage, 'last', None)
+
+    def serialize_embedding(self, embedding):
+        return embedding.tobytes()
+
+
+def run(db, engine, workers):
+    with patch.object(generate_embeddings, 'get_engine', return_value=engine), \
+         patch.object(generate_embeddings, 'refresh_embedding_matrix'):
+        generate_embeddings._generate_embeddings(db, batch_size=1, limit=None, provider='openai',
+                                                 verbose=False, workers=workers)
+
+
+class TestGenerateEmbeddings:
+    def test_batches_are_embedded_concurrently(self, db_with_data):
+        db, ids = db_with_data
+        engine = FakeEngine()
+
+        run(db, engine, workers=3)
+
+        assert engine.max_in_flight > 1
+        assert db.get_embedded_speaker_ids(ids['speakers'].values()) == set(ids['speakers'].values())
+        assert not db.conn.in_transaction
+
+    def test_failed_batch_falls_back_to_single_texts(self, db_with_data):
+        db, ids = db_with_data
+        engine = FakeEngine(fail_first=True)
+
+        run(db, engine, workers=2)
+
+        assert db.count_embeddings() == len(ids['speakers'])
+
+    def test_reembeds_speakers_from_another_model(self, db_with_data):
+        db, ids = db_with_data
+        stale = ids['speakers']['s1']
+        db.save_speaker_embedding(stale, b'\x00', "old text", model="old-model")
+
+        run(db, FakeEngine(), workers=2)
+
+        assert db.get_speaker_embedding(stale)[2] == FakeEngine.model
+        assert db.count_embeddings() == len(ids['speakers'])
+
+
+class TestGetEngine:
+    def test_engine_is_created_once_per_provider(self):
+        generate_embeddings.get_engine.cache_clear()
+        with patch.object(generate_embeddings, 'EmbeddingEngine', side_effect=FakeEngine) as factory:
+            first = generate_embeddings.get_engine('openai')
+            assert generate_embeddings.get_engine('openai') is first
+        assert factory.call_count == 1
+        generate_embeddings.get_engine.cache_clear()
+
+    def test_falls_back_when_provider_fails_even_when_quiet(self):
+        generate_embeddings.get_engine.cache_clear()
+
+        def make(provider):
+            if provider == 'gemini':
+                raise ValueError("GEMINI_API_KEY not found")
+            return FakeEngine(provider)
+
+        with patch.object(generate_embeddings, 'EmbeddingEngine', side_effect=make) as factory:
+            generate_embeddings._init_engine('gemini', verbose=False)
+        assert [c.kwargs['provider'] for c in factory.call_args_list] == ['gemini', 'openai']
+        generate_embeddings.get_engine.cache_clear()
@@ -0,0 +1,128 @@
+"""
+Tests for logging_config.py - StructuredFormatter.
+
+Covers:
+- Timestamp taken from the record and cached per second
+- Component names translated once per logger
+- Extra fields appended as key=value pairs
+- Helpers skip disabled levels
+- Records written by the background listener, flushed once per burst
+- Component loggers built on first use
+"""
+
+import logging
+
+from logging_config import StructuredFormatter
+
+
+def make_record(created, **extra_fields):
+    record = logging.LogRecord("pipeline_cron", logging.INFO, __file__, 1, "Event processed", None, None)
+    record.created = created
+    if extra_fields:
+        record.extra_fields = extra_fields
+    return record
+
+
+class TestStructuredFormatter:
+    def test_formats_record_time_as_utc(self):
+        formatter = StructuredFormatter()
+        line = formatter.format(make_record(1771929045.75, event_id=123, speakers=5))
+        assert line == ("[INFO] 2026-02-24T10:30:45Z | pipeline.cron | Event processed"
+                        " | event_id=123 | speakers=5")
+        assert formatter.format(make_record(1771929045.75)) == (
+            "[INFO] 2026-02-24T10:30:45Z | pipeline.cron | Event processed")
+
+    def test_timestamp_formatted_once_per_second(self, monkeypatch):
+        import time
+        formatter = StructuredFormatter()
+        calls = []
+        real_gmtime = time.gmtime
+        monkeypatch.setattr(time, 'gmtime', lambda *args: calls.append(args) or real_gmtime(*args))
+
+        first = formatter.format_timestamp(1771929045.1)
+        assert formatter.format_timestamp(1771929045.9) == first
+        assert formatter.format_timestamp(1771929046.0) == "2026-02-24T10:30:46Z"
+        assert len(calls) == 2
+
+    def test_component_translated_once_per_logger(self):
+        formatter = StructuredFormatter("pipeline_cron")
+        assert formatter.component_for("pipeline_cron") == "pipeline.cron"
+        # Records from child loggers propagating to this handler keep their own name
+        assert formatter.component_for("pipeline_cron.scrape_x") == "pipeline.cron.scrape.x"
+        assert set(formatter._components) == {"pipeline_cron", "pipeline_cron.scrape_x"}
+
+
+class TestLogHelpers:
+    def test_disabled_level_builds_nothing(self):
+        from unittest.mock import MagicMock
+        from logging_config import log_api_call, log_stats, log_with_context
+        logger = MagicMock()
+        logger.isEnabledFor.return_value = False
+
+        log_with_context(logger, logging.INFO, "Event processed", event_id=1)
+        log_stats(logger, "Run", {'events': 3})
+        log_api_call(logger, "openai", "embed", success=True, duration_ms=12)
+
+        logger.log.assert_not_called()
+
+
+class TestSetupLogging:
+    def test_records_are_written_off_the_calling_thread(self, monkeypatch):
+        import threading
+        import logging_config
+        written = []
+        monkeypatch.setattr(logging_config._stdout_handler, 'emit',
+                            lambda record: written.append((threading.get_ident(), record.getMessage())))
+
+        logger = logging_config.setup_logging("test_queue")
+        logger.info("queued")
+        logging_config._log_queue.join()
+
+        assert written == [(written[0][0], "queued")]
+        assert written[0][0] != threading.get_ident()
+
+    def test_flush_logs_writes_queued_records_to_sys_stdout(self, monkeypatch):
+        import sys
+        import logging_config
+        assert logging_config._stdout_handler.stream is sys.stdout
+        written = []
+        monkeypatch.setattr(logging_config._stdout_handler, 'emit',
+                            lambda record: written.append(record.getMessage()))
+
+        logging_config.setup_logging("test_flush").info("before summary")
+        logging_config.flush_logs()
+
+        assert written == ["before summary"]
+
+    def test_burst_is_flushed_once(self):
+        import io
+        import queue
+        from unittest.mock import patch
+        from logging_config import BufferedStreamHandler, DrainingQueueListener
+        stream = io.StringIO()
+        handler = BufferedStreamHandler(stream)
+        records = queue.Queue()
+        for n in range(5):
+            records.put(make_record(1771929045.0 + n))
+        listener = DrainingQueueListener(records, handler)
+
+        with patch.object(stream, 'flush') as flush:
+            listener.start()
+            records.join()
+            assert flush.call_count == 1
+            listener.stop()
+
+        assert stream.getvalue().count("Event processed") == 5
+
+    def test_component_loggers_are_built_on_first_use(self, monkeypatch):
+        import logging_config
+        monkeypatch.delattr(logging_config, 'web_logger', raising=False)
+        built = []
+        real_setup = logging_config.setup_logging
+        monkeypatch.setattr(logging_config, 'setup_logging',
+                            lambda component: built.append(component) or real_setup(component))
+
+        from logging_config import web_logger
+        assert web_logger is logging.getLogger("web")
+        assert logging_config.web_logger is web_logger
+        assert built == ["web"]
@@ -7,6 +7,7 @@ Tests static/parsing methods that don't require a running browser:
 - extract_title_from_page
 - extract_date_from_page
 - parse_event_page
+- _fetch_event_pages (browser creation and page loads mocked)
 
 Selenium WebDriver calls are mocked to avoid needing Chrome installed.
 """
@@ -20,6 +21,17 @@ from bs4 import BeautifulSoup
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@pytest.fixture(autouse=True)
+def debug_log(tmp_path, monkeypatch):
+    """Send the scraper's file log to tmp_path instead of the repo root."""
+    import logging
+    from selenium_scraper import logger
+    handler = logging.FileHandler(tmp_path / "pipeline_debug.log", delay=True)
+    monkeypatch.setattr(logger, 'handlers', [handler])
+    yield
+    handler.close()
+
+
 @pytest.fixture
 def scraper():
     """Create a SeleniumEventScraper with mocked WebDriver."""
@@ -106,6 +118,14 @@ class TestExtractEventLinks:
         links = scraper.extract_event_links("<html><body></body></html>")
         assert links == []
 
+    def test_blank_page_source(self, scraper):
+        assert scraper.extract_event_links("") == []
+
+    def test_unescapes_href_entities(self, scraper):
+        html = '<a href="/events/trade-and-tariffs?a=1&amp;b=2">Trade</a>'
+        links = scraper.extract_event_links(html)
+        assert links == ["https://asiasociety.org/events/trade-and-tariffs?a=1&b=2"]
+
 
 class TestExtractLocationFromUrl:
     def test_global_url(self, scraper):
@@ -128,6 +148,12 @@ class TestExtractLocationFromUrl:
         loc = scraper.extract_location_from_url("https://asiasociety.org/texas/events/some-event")
         assert loc == "Texas"
 
+    def test_repeated_slug_uses_cached_name(self, scraper):
+        url = "https://asiasociety.org/northern-california/events/some-event"
+        assert scraper.extract_location_from_url(url) == "Northern California"
+        assert scraper._location_names["northern-california"] == "Northern California"
+        assert scraper.extract_location_from_url(url + "-2") == "Northern California"
+
 
 class TestExtractTitleFromPage:
     def test_og_title(self, scraper):
@@ -214,3 +240,82 @@ class TestParseEventPage:
         result = scraper.parse_event_page(html, "https://asiasociety.org/events/simple-event")
         assert result['title'] == "Simple Event"
         assert len(result['body_text']) > 0
+
+
+class TestFetchEventPages:
+    def fetched(self, scraper, urls, workers):
+        from selenium_scraper import SeleniumEventScraper, _BrowserPool
+        pages = {url: f"<html>{url}</html>" for url in urls}
+        with patch.object(SeleniumEventScraper, 'setup_driver', lambda self: setattr(self, 'driver', MagicMock())), \
+             patch.object(SeleniumEventScraper, 'fetch_page', lambda self, url: pages[url]):
+            pool = _BrowserPool(scraper.base_url, True, workers, page_delay=0) if workers > 1 else None
+            try:
+                with patch.object(SeleniumEventScraper, 'PAGE_DELAY', 0):
+                    groups = list(scraper._fetch_event_pages(urls, pool))
+            finally:
+                if pool is not None:
+                    pool.close()
+        return groups, pages
+
+    def test_sequential_keeps_order(self, scraper):
+        urls = [f"https://asiasociety.org/events/event-{n}" for n in range(3)]
+        groups, pages = self.fetched(scraper, urls, workers=1)
+        assert groups == [[(url, pages[url])] for url in urls]
+
+    def test_concurrent_fetches_every_page_once(self, scraper):
+        urls = [f"https://asiasociety.org/events/event-{n}" for n in range(10)]
+        groups, pages = self.fetched(scraper, urls, workers=3)
+        results = [item for group in groups for item in group]
+        assert sorted(results) == sorted(pages.items())
+
+
+class TestScrapeEvents:
+    LISTING = {
+        0: '<a href="/events/trade-and-tariffs">x</a><a href="/events/climate-summit">y</a>',
+        1: '<a href="/events/climate-summit">y</a><a href="/events/art-and-empire">z</a>',
+    }
+
+    def scrape(self, scraper, db, requested):
+        from selenium_scraper import SeleniumEventScraper
+        body = "<article><p>" + "Panel discussion on regional trade. " * 5 + "</p></article>"
+        listing = self.LISTING
+
+        def fetch_page(self, url):
+            requested.append(url)
+            if '?page=' in url:
+                return f"<html><body>{listing.get(int(url.split('=')[1]), '')}</body></html>"
+            return f"<html><head><title>Event {url}</title></head><body>{body}</body></html>"
+
+        with patch.object(SeleniumEventScraper, 'setup_driver', lambda self: setattr(self, 'driver', MagicMock())), \
+             patch.object(SeleniumEventScraper, 'fetch_page', fetch_page), \
+             patch.object(SeleniumEventScraper, 'PAGE_DELAY', 0):
+            return scraper.scrape_events(db, workers=2)
+
+    def test_prefetched_listing_pages_keep_stop_logic(self, scraper, db):
+        requested = []
+        saved = self.scrape(scraper, db, requested)
+
+        assert saved == 3
+        assert db.get_statistics()['total_events'] == 3
+        # Three empty pages stop the loop; at most workers - 1 extra were prefetched
+        listing_requests = [url for url in requested if '?page=' in url]
+        assert len(listing_requests) <= 5 + 1
+
+    def test_skips_urls_already_in_database(self, scraper, db):
+        db.add_event(url="https://asiasociety.org/events/climate-summit", title="Climate", body_text="x")
+        requested = []
+        saved = self.scrape(scraper, db, requested)
+
+        assert saved == 2
+        assert "https://asiasociety.org/events/climate-summit" not in requested
+
+    def test_invalid_mode_starts_no_browser_pool(self, scraper, db):
+        with patch('selenium_scraper._BrowserPool') as pool:
+            with pytest.raises(ValueError):
+                scraper.scrape_events(db, mode='backfill', workers=2)
+        pool.assert_not_called()
+
+    def test_raw_html_not_stored_by_default(self, scraper, db):
+        self.scrape(scraper, db, [])
+        stored = db.conn.execute('SELECT COUNT(*) FROM events WHERE raw_html IS NOT NULL').fetchone()[0]
+        assert stored == 0
@@ -7,7 +7,7 @@ Covers:
 - JSON parsing (including markdown fence removal)
 - Dynamic token allocation based on event size
 - Error handling (rate limits, timeouts, bad JSON, API errors)
-- Batch extraction
+- Batch extraction (sequential, and several events per call)
 """
 
 import pytest
@@ -158,9 +158,10 @@ class TestSpeakerExtraction:
         response_json = json.dumps({"speakers": [], "event_summary": "Test"})
         extractor.client.messages.create.return_value = self._make_mock_response(response_json)
 
-        extractor.extract_speakers("Test", "Text")
+        result = extractor.extract_speakers("Test", "Text")
         assert extractor._last_usage['input_tokens'] == 100
         assert extractor._last_usage['output_tokens'] == 50
+        assert result['usage'] == {'input_tokens': 100, 'output_tokens': 50}
 
 
 class TestSpeakerExtractionErrors:
@@ -278,3 +279,58 @@ class TestBatchExtraction:
         # batch_extract returns dicts with 'event_id', 'url', 'title', 'extraction'
         assert all('extraction' in r for r in results)
         assert all(r['extraction']['success'] for r in results)
+
+    @staticmethod
+    def _reply(payload, input_tokens=50, output_tokens=25):
+        mock_msg = MagicMock()
+        mock_msg.content = [MagicMock(text=json.dumps(payload))]
+        mock_msg.usage = MagicMock(input_tokens=input_tokens, output_tokens=output_tokens)
+        return mock_msg
+
+    def test_extract_speakers_batch_uses_one_call(self, extractor):
+        """Short events share one prompt; results come back per event, in order."""
+        extractor.client.messages.create.return_value = self._reply({"events": [
+            {"event": 1, "speakers": [{"name": "Bo"}], "event_summary": "Second"},
+            {"event": 0, "speakers": [{"name": "Ann"}], "event_summary": "First"},
+        ]})
+
+        results = extractor.extract_speakers_batch([("Event 1", "Text 1"), ("Event 2", "Text 2")])
+
+        assert extractor.client.messages.create.call_count == 1
+        prompt = extractor.client.messages.create.call_args.kwargs['messages'][0]['content']
+        assert "=== EVENT 0 ===" in prompt and "=== EVENT 1 ===" in prompt
+        assert [r['speakers'][0]['name'] for r in results] == ["Ann", "Bo"]
+        assert results[0]['usage'] == {'input_tokens': 50, 'output_tokens': 25}
+        assert 'usage' not in results[1]
+
+    def test_extract_speakers_batch_falls_back_for_missing_events(self, extractor):
+        """An event left out of the batch reply is extracted on its own."""
+        extractor.client.messages.create.side_effect = [
+            self._reply({"events": [{"event": 0, "speakers": [], "event_summary": ""}]}),
+            self._reply({"speakers": [{"name": "Cy"}], "event_summary": "Alone"}, 10, 5),
+        ]
+
+        results = extractor.extract_speakers_batch([("Event 1", "Text 1"), ("Event 2", "Text 2")])
+
+        assert extractor.client.messages.create.call_count == 2
+        assert results[1]['speakers'] == [{"name": "Cy"}]
+        assert results[0]['usage'] == {'input_tokens': 50, 'output_tokens': 25}
+        assert results[1]['usage'] == {'input_tokens': 10, 'output_tokens': 5}
+
+    def test_extract_speakers_batch_falls_back_when_reply_is_not_json(self, extractor):
+        """A batch reply that does not parse sends every event to its own call."""
+        cut_off = MagicMock()
+        cut_off.content = [MagicMock(text='{"events": [{"event": 0, "speakers": [{"na')]
+        cut_off.usage = MagicMock(input_tokens=50, output_tokens=25)
+        extractor.client.messages.create.side_effect = [
+            cut_off,
+            self._reply({"speakers": [{"name": "Ann"}], "event_summary": "First"}, 10, 5),
+            self._reply({"speakers": [{"name": "Bo"}], "event_summary": "Second"}, 10, 5),
+        ]
+
+        results = extractor.extract_speakers_batch([("Event 1", "Text 1"), ("Event 2", "Text 2")])
+
+        assert extractor.client.messages.create.call_count == 3
+        assert [r['speakers'][0]['name'] for r in results] == ["Ann", "Bo"]
+        assert results[0]['usage'] == {'input_tokens': 60, 'output_tokens': 30}
+        assert results[1]['usage'] == {'input_tokens': 10, 'output_tokens': 5}
@@ -99,7 +99,7 @@ class TestStatsPage:
 class TestSpeakerDetailPage:
     def test_speaker_not_found(self, authenticated_client):
         """Should return 404 for non-existent speaker."""
-        with patch('web_app.app.get_db') as mock_get_db:
+        with patch('web_app.app.get_read_db') as mock_get_db:
             mock_db = MagicMock()
             mock_db.get_speaker_by_id.return_value = None
             mock_get_db.return_value = mock_db
@@ -109,7 +109,7 @@ class TestSpeakerDetailPage:
 
     def test_speaker_found(self, authenticated_client):
         """Should render speaker page with full data."""
-        with patch('web_app.app.get_db') as mock_get_db:
+        with patch('web_app.app.get_read_db') as mock_get_db:
             mock_db = MagicMock()
             mock_db.get_speaker_by_id.return_value = (
                 1, "Jane Smith", "Professor", "MIT", "MIT", "AI researcher"
@@ -188,3 +188,47 @@ class TestApiSearch:
                                                 data=json.dumps({'query': 'test'}),
                                                 content_type='application/json')
             assert response.status_code == 500
+
+
+class TestAdminDatabaseTransfer:
+    def test_download_includes_commits_still_in_wal(self, client, tmp_path):
+        import sqlite3
+        db_path = str(tmp_path / "speakers.db")
+        writer = sqlite3.connect(db_path)
+        writer.execute('PRAGMA journal_mode=WAL')
+        writer.execute('PRAGMA wal_autocheckpoint=0')
+        writer.execute('CREATE TABLE t (x)')
+        writer.execute('INSERT INTO t VALUES (1)')
+        writer.commit()
+
+        with patch('web_app.app.get_db_path', return_value=db_path):
+            response = client.get('/admin/download-db')
+        writer.close()
+
+        downloaded = tmp_path / "downloaded.db"
+        downloaded.write_bytes(response.data)
+        conn = sqlite3.connect(str(downloaded))
+        assert conn.execute('SELECT x FROM t').fetchall() == [(1,)]
+        conn.close()
+
+    def test_upload_replaces_file_and_drops_old_wal(self, client, tmp_path):
+        import io
+        import sqlite3
+        db_path = str(tmp_path / "speakers.db")
+        (tmp_path / "speakers.db-wal").write_bytes(b"stale frames")
+        new_path = str(tmp_path / "new.db")
+        conn = sqlite3.connect(new_path)
+        conn.execute('CREATE TABLE t (x)')
+        conn.commit()
+        conn.close()
+
+        with patch('web_app.app.get_db_path', return_value=db_path):
+            with open(new_path, 'rb') as f:
+                response = client.post('/admin/upload-db', data={'file': (io.BytesIO(f.read()), 'speakers.db')})
+
+        assert response.status_code == 200
+        assert not os.path.exists(db_path + '-wal')
+        assert not os.path.exists(db_path + '.upload')
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT name FROM sqlite_master").fetchall() == [('t',)]
+        conn.close()
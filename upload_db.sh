@@ -2,6 +2,10 @@
 # Upload database to Railway using base64 encoding
 # This works around binary file upload issues
 
+# Flush the WAL into the main file so the upload is complete
+# (mode=rw: a missing database is an error, not a new empty file)
+python3 -c "import sqlite3; conn = sqlite3.connect('file:speakers.db?mode=rw', uri=True); conn.execute('PRAGMA wal_checkpoint(TRUNCATE)'); conn.close()" || exit 1
+
 echo "Encoding database..."
 base64 speakers.db > speakers.db.b64
 
@@ -2,11 +2,12 @@
 Flask web application for speaker search
 """
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
-from functools import wraps
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, g
+from functools import lru_cache, wraps
 import sys
 import os
 import logging
+import threading
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 import atexit
@@ -16,7 +17,7 @@ import markdown
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from speaker_search import SpeakerSearch
-from database import SpeakerDatabase
+from database import SpeakerDatabase, SpeakerDatabasePool
 from monitoring import PipelineMonitor
 
 app = Flask(__name__)
@@ -34,8 +35,19 @@ SITE_PASSWORD = os.environ.get('SITE_PASSWORD', 'CHANGE_ME_IN_ENV_VARS')
 search = None
 db = None
 
+# Pool of read-only connections for query-only routes
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '4'))
+db_pool = None
+db_pool_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
 def get_db_path():
-    """Get database path - /data/speakers.db on Railway, ./speakers.db locally"""
+    """
+    Get database path - /data/speakers.db on Railway, ./speakers.db locally
+
+    Cached: the volume doesn't come or go while the app runs, and this is
+    called on nearly every request.
+    """
     if os.path.exists('/data'):
         # Railway production with mounted volume
         return '/data/speakers.db'
@@ -52,13 +64,34 @@ def get_search():
     return search
 
 def get_db():
-    """Lazy initialization of database"""
+    """Lazy initialization of database (shared connection, used for writes)"""
     global db
     if db is None:
         db_path = get_db_path()
         db = SpeakerDatabase(db_path)
     return db
 
+def get_db_pool():
+    """Lazy initialization of the read-only connection pool"""
+    global db_pool
+    with db_pool_lock:
+        if db_pool is None:
+            db_pool = SpeakerDatabasePool(get_db_path(), size=DB_POOL_SIZE)
+    return db_pool
+
+def get_read_db():
+    """Read-only connection checked out from the pool for the current request"""
+    if 'read_db' not in g:
+        g.read_db = get_db_pool().acquire()
+    return g.read_db
+
+@app.teardown_appcontext
+def release_read_db(exception):
+    """Return the request's read-only connection to the pool"""
+    database = g.pop('read_db', None)
+    if database is not None:
+        get_db_pool().release(database)
+
 
 # Pipeline lock configuration - configurable timeout via environment variable
 PIPELINE_LOCK_TIMEOUT = int(os.environ.get('PIPELINE_LOCK_TIMEOUT_SECONDS', '1800'))  # Default: 30 minutes
@@ -411,7 +444,7 @@ def api_search():
 @login_required
 def speaker_detail(speaker_id):
     """Speaker detail page"""
-    database = get_db()
+    database = get_read_db()
 
     speaker_data = database.get_speaker_by_id(speaker_id)
     if not speaker_data:
@@ -548,7 +581,7 @@ def speaker_detail(speaker_id):
 @login_required
 def event_detail(event_id):
     """Event detail page showing all speakers"""
-    database = get_db()
+    database = get_read_db()
 
     # Get event details
     event_data = database.get_event_by_id(event_id)
@@ -591,7 +624,7 @@ def faq():
     """FAQ page with dynamic statistics"""
     import sqlite3
 
-    database = get_db()
+    database = get_read_db()
 
     # Get current statistics for dynamic content
     cursor = database.conn.cursor()
@@ -688,9 +721,8 @@ def api_stats():
     """Enhanced database statistics with enrichment progress and costs"""
     import sqlite3
 
-    # Create new database connection for this request to avoid threading issues
-    db_path = get_db_path()
-    with SpeakerDatabase(db_path) as database:
+    # Read-only connection from the pool
+    with get_db_pool().reader() as database:
         stats = database.get_enhanced_statistics()
 
         # Get event date range (event_date is mostly text format "DD MMM YYYY", some ISO)
@@ -796,9 +828,8 @@ def api_leaderboard():
         months = request.args.get('months', '12')
         months = int(months) if months and months != 'all' else None
 
-        # Create new database connection for this request
-        db_path = get_db_path()
-        with SpeakerDatabase(db_path) as database:
+        # Read-only connection from the pool
+        with get_db_pool().reader() as database:
             # Get top speakers
             speakers = database.get_top_speakers(limit=limit, months=months)
 
@@ -856,9 +887,8 @@ def api_events():
         limit = int(request.args.get('limit', 50))
         offset = int(request.args.get('offset', 0))
 
-        # Create new database connection for this request
-        db_path = get_db_path()
-        with SpeakerDatabase(db_path) as database:
+        # Read-only connection from the pool
+        with get_db_pool().reader() as database:
             # Get events
             events = database.get_all_events(
                 location_filter=location_filter,
@@ -1051,7 +1081,27 @@ def upload_database():
         file = request.files['file']
         db_path = get_db_path()
 
-        file.save(db_path)
+        # Never write over the live file: save beside it, close every open
+        # connection, and drop the old -wal/-shm so SQLite can't replay the
+        # previous database's frames onto the new one
+        upload_path = db_path + '.upload'
+        file.save(upload_path)
+
+        global db, search, db_pool
+        with db_pool_lock:
+            if db_pool is not None:
+                db_pool.close()
+                db_pool = None
+            if db is not None:
+                db.close()
+                db = None
+            if search is not None:
+                search.close()
+                search = None
+            for suffix in ('-wal', '-shm'):
+                if os.path.exists(db_path + suffix):
+                    os.remove(db_path + suffix)
+            os.replace(upload_path, db_path)
 
         return jsonify({'success': True, 'message': f'Database uploaded to {db_path}', 'size': os.path.getsize(db_path)})
     except Exception as e:
@@ -1061,10 +1111,27 @@ def upload_database():
 @app.route('/admin/download-db', methods=['GET'])
 def download_database():
     """TEMPORARY: Download database file - REMOVE AFTER USE"""
+    import sqlite3
+    import tempfile
     from flask import send_file
     try:
         db_path = get_db_path()
-        return send_file(db_path, as_attachment=True, download_name='speakers.db')
+
+        # Send a consistent snapshot made with the backup API: copying the
+        # file alone would miss commits still in speakers.db-wal
+        fd, snapshot_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        source = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+        snapshot = sqlite3.connect(snapshot_path)
+        try:
+            source.backup(snapshot)
+        finally:
+            snapshot.close()
+            source.close()
+
+        response = send_file(snapshot_path, as_attachment=True, download_name='speakers.db')
+        response.call_on_close(lambda: os.remove(snapshot_path))
+        return response
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1463,7 +1530,7 @@ def diagnose_counts():
         enriched_speakers = cursor.fetchone()[0]
 
         # Check tagged (distinct speakers with tags)
-        cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_tags')
+        cursor.execute('SELECT COUNT(*) FROM (SELECT 1 FROM speaker_tags GROUP BY speaker_id)')
         tagged_speakers = cursor.fetchone()[0]
 
         # Check embeddings - TOTAL COUNT
@@ -1592,8 +1659,7 @@ def api_search_analytics():
     try:
         days = int(request.args.get('days', 30))
 
-        db_path = get_db_path()
-        with SpeakerDatabase(db_path) as database:
+        with get_db_pool().reader() as database:
             analytics = database.get_search_analytics(days=days)
 
         # Format data for JSON response
@@ -2256,11 +2322,11 @@ def admin_data_quality():
         speakers_with_bio = cursor.fetchone()[0]
 
         # Speakers with tags
-        cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_tags')
+        cursor.execute('SELECT COUNT(*) FROM (SELECT 1 FROM speaker_tags GROUP BY speaker_id)')
         speakers_with_tags = cursor.fetchone()[0]
 
-        # Speakers with demographics (from speaker_demographics table)
-        cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_demographics')
+        # Speakers with demographics (one speaker_demographics row per speaker)
+        cursor.execute('SELECT COUNT(*) FROM speaker_demographics')
         speakers_with_demographics = cursor.fetchone()[0]
 
         # Speakers with locations (from speaker_locations table)
@@ -2399,7 +2465,7 @@ def debug_stats():
         cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_embeddings')
         debug['unique_speakers_with_embeddings'] = cursor.fetchone()[0]
 
-        cursor.execute('SELECT COUNT(DISTINCT speaker_id) FROM speaker_tags')
+        cursor.execute('SELECT COUNT(*) FROM (SELECT 1 FROM speaker_tags GROUP BY speaker_id)')
         debug['tagged_speakers'] = cursor.fetchone()[0]
 
         cursor.execute('SELECT COUNT(*) FROM speaker_tags')